@@ -1,11 +1,116 @@
+import typing
+import collections
 from PyQt6.QtCore import QRect
 from PyQt6.QtGui import QFont, QFontMetrics
 
 
+class TextMeasurer:
+	"""
+    A least recently used cache of text bounding rectangles.
+
+    Rectangles are keyed by the font key, the text, the width constraint, the text flags and the tab stops, so the same text is only laid out once per font and width. The font metrics of every font are kept too.
+
+    Attributes:
+        max_size (int): The maximum number of cached rectangles.
+        rectangles (collections.OrderedDict[tuple, QRect]): The cached rectangles, least recently used first.
+        font_metrics (dict[str, QFontMetrics]): The font metrics of every measured font, keyed by font key.
+        hits (int): The number of measurements answered from the cache.
+        misses (int): The number of measurements that laid out the text.
+
+    :Usage:
+        rect = text_measurer.measure("Hello, world!", QFont("Arial", 12), 120, Qt.TextFlag.TextWordWrap)
+        print(text_measurer.get_statistics())
+    """
+	
+	def __init__(self, max_size: int = 65536):
+		"""
+        Initializes a TextMeasurer object.
+
+        Args:
+            max_size (int): The maximum number of cached rectangles.
+        """
+		self.max_size = max_size
+		self.rectangles: collections.OrderedDict[tuple, QRect] = collections.OrderedDict()
+		self.font_metrics: dict[str, QFontMetrics] = {}
+		self.hits = 0
+		self.misses = 0
+	
+	def clear(self):
+		"""Drops the cached rectangles and font metrics and resets the statistics."""
+		self.rectangles.clear()
+		self.font_metrics.clear()
+		self.hits = 0
+		self.misses = 0
+	
+	def get_statistics(self) -> dict[str, int]:
+		"""
+        Returns the cache statistics.
+
+        Returns:
+            dict[str, int]: The hits, the misses and the number of cached rectangles.
+        """
+		return {"hits": self.hits, "misses": self.misses, "size": len(self.rectangles)}
+	
+	def measure(
+			self,
+			text: str,
+			font: QFont,
+			width: typing.Optional[int] = None,
+			flags: int = 0,
+			tab_stops: int = 0
+	) -> QRect:
+		"""
+        Returns the bounding rectangle of a text.
+
+        Args:
+            text (str): The text to measure.
+            font (QFont): The font of the text.
+            width (typing.Optional[int]): The width the text is laid out in. If None, the text is measured on a single line and flags and tab_stops are ignored.
+            flags (int): The alignment and text flags, e.g. Qt.TextFlag.TextWordWrap.
+            tab_stops (int): The tab stops passed to QFontMetrics.boundingRect.
+
+        Returns:
+            QRect: A copy of the bounding rectangle.
+        """
+		font_key = font.key()
+		key = (font_key, text, width, int(flags), tab_stops)
+		rect = self.rectangles.get(key)
+		
+		if rect is not None:
+			self.hits += 1
+			self.rectangles.move_to_end(key)
+			
+			return QRect(rect)
+		
+		self.misses += 1
+		metrics = self.font_metrics.get(font_key)
+		
+		if metrics is None:
+			metrics = QFontMetrics(font)
+			self.font_metrics[font_key] = metrics
+		
+		if width is None:
+			rect = metrics.boundingRect(text)
+		else:
+			rect = metrics.boundingRect(QRect(0, 0, width, 5000), flags, text, tab_stops)
+		
+		self.rectangles[key] = rect
+		
+		if len(self.rectangles) > self.max_size:
+			self.rectangles.popitem(last=False)
+		
+		return QRect(rect)
+
+
+text_measurer = TextMeasurer()
+
+
 def get_text_size(text: str, font: QFont) -> QRect:
 	"""
     Calculates the bounding rectangle of a given text using the specified font.
 
+    The rectangle is taken from the shared text_measurer cache.
+
     Args:
         text (str): The text string.
         font (QFont): The font to use for the calculation.
@@ -20,4 +125,4 @@ def get_text_size(text: str, font: QFont) -> QRect:
         width = rect.width()
         height = rect.height()
     """
-	return QFontMetrics(font).boundingRect(text)
+	return text_measurer.measure(text, font)
@@ -1,12 +1,255 @@
+import sys
+import numpy
 import typing
 import pandas
+import collections
+from PyQt6.QtGui import QColor, QFont
 from PyQt6.QtCore import (
+	QAbstractItemModel,
 	QAbstractTableModel,
 	QModelIndex,
-	Qt
+	Qt,
+	pyqtSignal
 )
 
 
+def get_column_values(column: pandas.Series) -> typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]:
+	"""
+    Returns the values of a column without copying them where the dtype allows it.
+
+    Plain NumPy dtypes are returned as NumPy arrays sharing the DataFrame's buffer. Datetime, timedelta and extension dtypes are returned as pandas arrays, so that single values are boxed exactly like `DataFrame.iloc` does.
+
+    Args:
+        column (pandas.Series): The column to take the values from.
+
+    Returns:
+        typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]: The values of the column.
+    """
+	if isinstance(column.dtype, numpy.dtype) and column.dtype.kind not in "mM":
+		return column.to_numpy(copy=False)
+	
+	return column.array
+
+
+def get_column_formatter(
+		column: int,
+		format_data: typing.Optional[typing.Callable[[typing.Any], str]],
+		format_data_by_column: typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]
+) -> typing.Callable[[typing.Any], str]:
+	"""
+    Picks the callable formatting the values of a column: its own formatter, then the formatter of all data, then str.
+
+    Args:
+        column (int): The column index.
+        format_data (typing.Optional[typing.Callable[[typing.Any], str]]): The callable formatting all data, if any.
+        format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): The callables formatting specific columns, if any.
+
+    Returns:
+        typing.Callable[[typing.Any], str]: The formatter of the column.
+    """
+	if format_data_by_column is not None and column in format_data_by_column:
+		return format_data_by_column[column]
+	elif format_data is not None:
+		return format_data
+	else:
+		return str
+
+
+def get_contiguous_ranges(positions: typing.Iterable[int]) -> list[tuple[int, int]]:
+	"""
+    Merges positions into sorted contiguous ranges.
+
+    Args:
+        positions (typing.Iterable[int]): The positions to merge. Duplicates are allowed.
+
+    Returns:
+        list[tuple[int, int]]: The (first, last) pairs of every contiguous range, in ascending order.
+
+    :Usage:
+        get_contiguous_ranges([7, 1, 2, 3, 9, 8]) # [(1, 3), (7, 9)]
+    """
+	positions = numpy.unique(numpy.asarray(positions, dtype=numpy.int64))
+	
+	if positions.size == 0:
+		return []
+	
+	breaks = numpy.flatnonzero(numpy.diff(positions) != 1)
+	firsts = numpy.concatenate(([positions[0]], positions[breaks + 1]))
+	lasts = numpy.concatenate((positions[breaks], [positions[-1]]))
+	
+	return list(zip(firsts.tolist(), lasts.tolist()))
+
+
+def get_sort_permutation(
+		data: pandas.DataFrame,
+		columns: typing.Sequence[int],
+		orders: typing.Sequence[Qt.SortOrder]
+) -> numpy.ndarray:
+	"""
+    Computes the stable permutation that sorts a DataFrame by the raw values of several columns.
+
+    Args:
+        data (pandas.DataFrame): The data to sort.
+        columns (typing.Sequence[int]): The positions of the sort columns, from the primary to the last tie-breaker.
+        orders (typing.Sequence[Qt.SortOrder]): The sort order of every column.
+
+    Returns:
+        numpy.ndarray: The row positions in sorted order. Missing values are placed last.
+
+    :Usage:
+        get_sort_permutation(data, [2, 0], [Qt.SortOrder.DescendingOrder, Qt.SortOrder.AscendingOrder])
+    """
+	dtype = data.dtypes.iloc[columns[0]]
+	
+	if len(columns) == 1 and isinstance(dtype, numpy.dtype) and dtype.kind in "biu":
+		values = data.iloc[:, columns[0]].to_numpy(copy=False)
+		
+		if orders[0] == Qt.SortOrder.AscendingOrder:
+			return numpy.argsort(values, kind="stable")
+		
+		return values.size - 1 - numpy.argsort(values[::-1], kind="stable")[::-1]
+	
+	keys = pandas.DataFrame(
+			{position: data.iloc[:, column].to_numpy(copy=False) for position, column in enumerate(columns)},
+			copy=False
+	)
+	
+	return keys.sort_values(
+			list(range(len(columns))),
+			ascending=[order == Qt.SortOrder.AscendingOrder for order in orders],
+			kind="stable",
+			na_position="last"
+	).index.to_numpy()
+
+
+class StyleRule:
+	"""
+    A condition over the raw values of a column and the colors and font applied to the cells where it holds.
+
+    All the given conditions must hold. Conditions are evaluated on the whole column at once.
+
+    Attributes:
+        minimum (typing.Optional[float]): The inclusive lower bound of the values. Defaults to None.
+        maximum (typing.Optional[float]): The exclusive upper bound of the values. Defaults to None.
+        sign (typing.Optional[int]): The sign of the values: -1 for negative, 0 for zero, 1 for positive. Defaults to None.
+        condition (typing.Optional[typing.Callable[[pandas.Series], typing.Any]]): A vectorized callable returning a boolean mask for a column. Defaults to None.
+        foreground (typing.Optional[QColor]): The text color of the matching cells. Defaults to None.
+        background (typing.Optional[QColor]): The background color of the matching cells. Defaults to None.
+        font (typing.Optional[QFont]): The font of the matching cells. Defaults to None.
+
+    :Usage:
+        negative_red = StyleRule(sign=-1, foreground=QColor("red"))
+        large_bold = StyleRule(minimum=1_000_000, font=PyFont(weight=700))
+    """
+	
+	def __init__(
+			self,
+			minimum: typing.Optional[float] = None,
+			maximum: typing.Optional[float] = None,
+			sign: typing.Optional[int] = None,
+			condition: typing.Optional[typing.Callable[[pandas.Series], typing.Any]] = None,
+			foreground: typing.Optional[QColor] = None,
+			background: typing.Optional[QColor] = None,
+			font: typing.Optional[QFont] = None
+	):
+		"""
+        Initializes a StyleRule object.
+
+        Args:
+            minimum (typing.Optional[float]): The inclusive lower bound.
+            maximum (typing.Optional[float]): The exclusive upper bound.
+            sign (typing.Optional[int]): The sign of the values.
+            condition (typing.Optional[typing.Callable[[pandas.Series], typing.Any]]): A vectorized condition.
+            foreground (typing.Optional[QColor]): The text color.
+            background (typing.Optional[QColor]): The background color.
+            font (typing.Optional[QFont]): The font.
+        """
+		self.minimum = minimum
+		self.maximum = maximum
+		self.sign = sign
+		self.condition = condition
+		self.foreground = foreground
+		self.background = background
+		self.font = font
+	
+	def get_mask(self, values: typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]) -> numpy.ndarray:
+		"""
+        Evaluates the rule over column values.
+
+        Args:
+            values (typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]): The column values.
+
+        Returns:
+            numpy.ndarray: A boolean mask of the values matching the rule. Missing values never match.
+        """
+		series = pandas.Series(values, copy=False)
+		mask = numpy.ones(len(series), dtype=bool)
+		
+		if self.minimum is not None:
+			mask &= (series >= self.minimum).to_numpy(dtype=bool, na_value=False)
+		
+		if self.maximum is not None:
+			mask &= (series < self.maximum).to_numpy(dtype=bool, na_value=False)
+		
+		if self.sign is not None:
+			mask &= (numpy.sign(series) == self.sign).to_numpy(dtype=bool, na_value=False)
+		
+		if self.condition is not None:
+			mask &= pandas.Series(self.condition(series), copy=False).to_numpy(dtype=bool, na_value=False)
+		
+		return mask
+
+
+class ColumnStyle:
+	"""
+    A declarative style of a table column.
+
+    The column-wide colors and font apply to every cell, and the rules override them where they match; later rules override earlier ones.
+
+    Attributes:
+        column (int): The index of the styled column.
+        alignment (typing.Optional[Qt.AlignmentFlag]): The text alignment of the column. Defaults to None.
+        foreground (typing.Optional[QColor]): The text color of the column. Defaults to None.
+        background (typing.Optional[QColor]): The background color of the column. Defaults to None.
+        font (typing.Optional[QFont]): The font of the column. Defaults to None.
+        rules (list[StyleRule]): The conditional styles of the column. Defaults to an empty list.
+
+    :Usage:
+        pnl_style = ColumnStyle(
+            column=3,
+            alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            rules=[StyleRule(sign=-1, foreground=QColor("red")), StyleRule(sign=1, foreground=QColor("green"))]
+        )
+    """
+	
+	def __init__(
+			self,
+			column: int,
+			alignment: typing.Optional[Qt.AlignmentFlag] = None,
+			foreground: typing.Optional[QColor] = None,
+			background: typing.Optional[QColor] = None,
+			font: typing.Optional[QFont] = None,
+			rules: typing.Optional[list[StyleRule]] = None
+	):
+		"""
+        Initializes a ColumnStyle object.
+
+        Args:
+            column (int): The index of the styled column.
+            alignment (typing.Optional[Qt.AlignmentFlag]): The text alignment.
+            foreground (typing.Optional[QColor]): The text color.
+            background (typing.Optional[QColor]): The background color.
+            font (typing.Optional[QFont]): The font.
+            rules (typing.Optional[list[StyleRule]]): The conditional styles.
+        """
+		self.column = column
+		self.alignment = alignment
+		self.foreground = foreground
+		self.background = background
+		self.font = font
+		self.rules = rules if rules is not None else []
+
+
 class AbstractTableModelInit:
 	"""
     Data class to hold initialization parameters for abstract table models.
@@ -15,13 +258,27 @@ class AbstractTableModelInit:
         data (pandas.DataFrame): The pandas.DataFrame to be displayed in the table model.
         format_data (typing.Optional[typing.Union[typing.Callable[[typing.Any], str]]]): A callable to format all data in the table. Defaults to None.
         format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary mapping column indices to callables for formatting specific columns. Defaults to None.
+        cache_formatted_data (bool): Whether display strings are formatted in column blocks and cached. Defaults to False.
+        cache_block_size (int): The number of rows formatted at once for a single column when caching. Defaults to 4096.
+        cache_memory_limit (int): The approximate memory budget of the display strings cache in bytes. Defaults to 64 MiB.
+        diff_key_column (typing.Optional[typing.Hashable]): The column with unique row keys. If set, reset_table_data only emits the inserted, removed and changed rows between the old and the new data. Defaults to None.
+        max_diff_ranges (int): The maximum number of inserted and removed row ranges of a diff or of remove_rows. The storage is rebuilt for every range, so larger changes reset the model instead. Defaults to 64.
+        column_styles (typing.Optional[list[ColumnStyle]]): The alignment, colors and fonts of the columns, served for the TextAlignmentRole, ForegroundRole, BackgroundRole and FontRole. Defaults to None.
+        sort_enabled (bool): Whether sort reorders the stored data. Views call sort when sorting is enabled on them, so it is off by default and the given DataFrame is only reordered by an explicit sort_by_columns or a proxy with native_sort. Defaults to False.
     """
 	
 	def __init__(
 			self,
 			data: pandas.DataFrame,
 			format_data: typing.Optional[typing.Union[typing.Callable[[typing.Any], str]]] = None,
-			format_data_by_column: typing.Optional[dict[int, typing.Callable[[typing.Any], str]]] = None
+			format_data_by_column: typing.Optional[dict[int, typing.Callable[[typing.Any], str]]] = None,
+			cache_formatted_data: bool = False,
+			cache_block_size: int = 4096,
+			cache_memory_limit: int = 64 * 1024 * 1024,
+			diff_key_column: typing.Optional[typing.Hashable] = None,
+			column_styles: typing.Optional[list[ColumnStyle]] = None,
+			sort_enabled: bool = False,
+			max_diff_ranges: int = 64
 	):
 		"""
         Initializes an AbstractTableModelInit object.
@@ -30,10 +287,156 @@ class AbstractTableModelInit:
             data (pandas.DataFrame): The pandas.DataFrame for the model.
             format_data (typing.Optional[typing.Union[typing.Callable[[typing.Any], str]]]): A callable to format all data.
             format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary to format data by column.
+            cache_formatted_data (bool): Whether to cache formatted display strings.
+            cache_block_size (int): The number of rows formatted at once per column.
+            cache_memory_limit (int): The memory budget of the cache in bytes.
+            diff_key_column (typing.Optional[typing.Hashable]): The column identifying rows when resetting data by diff.
+            column_styles (typing.Optional[list[ColumnStyle]]): The styles of the columns.
+            sort_enabled (bool): Whether sort reorders the stored data.
+            max_diff_ranges (int): The maximum number of inserted and removed row ranges of a diff.
         """
 		self.data = data
 		self.format_data = format_data
 		self.format_data_by_column = format_data_by_column
+		self.cache_formatted_data = cache_formatted_data
+		self.cache_block_size = cache_block_size
+		self.cache_memory_limit = cache_memory_limit
+		self.diff_key_column = diff_key_column
+		self.column_styles = column_styles
+		self.sort_enabled = sort_enabled
+		self.max_diff_ranges = max_diff_ranges
+
+
+class FormattedDataCache:
+	"""
+    An LRU cache of pre-formatted display strings, stored by column in blocks of rows.
+
+    Attributes:
+        block_size (int): The number of rows formatted at once for a single column.
+        memory_limit (int): The approximate number of bytes the cache is allowed to hold.
+        blocks (collections.OrderedDict[tuple[int, int], list[str]]): The cached blocks keyed by (column, block index), least recently used first.
+        blocks_memory (dict[tuple[int, int], int]): The approximate size in bytes of every cached block.
+        memory_usage (int): The approximate size in bytes of all cached blocks.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that required a block to be formatted.
+        evictions (int): The number of blocks evicted to stay within the memory limit.
+    """
+	
+	def __init__(self, block_size: int = 4096, memory_limit: int = 64 * 1024 * 1024):
+		"""
+        Initializes a FormattedDataCache object.
+
+        Args:
+            block_size (int): The number of rows per block. Defaults to 4096.
+            memory_limit (int): The memory budget in bytes. Defaults to 64 MiB.
+        """
+		self.block_size = max(1, block_size)
+		self.memory_limit = memory_limit
+		self.blocks: collections.OrderedDict[tuple[int, int], list[str]] = collections.OrderedDict()
+		self.blocks_memory: dict[tuple[int, int], int] = {}
+		self.memory_usage = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+	
+	def clear(self):
+		"""Drops every cached block."""
+		self.blocks.clear()
+		self.blocks_memory.clear()
+		self.memory_usage = 0
+	
+	def invalidate_rows(
+			self,
+			first_row: int,
+			last_row: typing.Optional[int] = None,
+			columns: typing.Optional[typing.Iterable[int]] = None
+	):
+		"""
+        Drops the cached blocks that contain any of the given rows.
+
+        Args:
+            first_row (int): The first invalidated row.
+            last_row (typing.Optional[int]): The last invalidated row. If None, every row from first_row onwards is invalidated.
+            columns (typing.Optional[typing.Iterable[int]]): The invalidated columns. If None, every column is invalidated.
+        """
+		first_block = first_row // self.block_size
+		last_block = None if last_row is None else last_row // self.block_size
+		columns = None if columns is None else set(columns)
+		
+		for key in [
+				key
+				for key in self.blocks
+				if key[1] >= first_block
+				and (last_block is None or key[1] <= last_block)
+				and (columns is None or key[0] in columns)
+		]:
+			del self.blocks[key]
+			self.memory_usage -= self.blocks_memory.pop(key)
+	
+	def invalidate_cells(self, rows: numpy.ndarray, columns: numpy.ndarray):
+		"""
+        Drops the cached blocks that contain any of the given cells, looking up only those blocks.
+
+        Args:
+            rows (numpy.ndarray): The row of every invalidated cell.
+            columns (numpy.ndarray): The column of every invalidated cell.
+        """
+		block_keys = numpy.unique(numpy.stack((columns, rows // self.block_size), axis=1), axis=0)
+		
+		for key in map(tuple, block_keys.tolist()):
+			block_memory = self.blocks_memory.pop(key, None)
+			
+			if block_memory is not None:
+				del self.blocks[key]
+				self.memory_usage -= block_memory
+	
+	def get(self, row: int, column: int) -> typing.Optional[str]:
+		"""
+        Returns the cached string for a cell.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            typing.Optional[str]: The cached string, or None if its block is not cached.
+        """
+		block_index, offset = divmod(row, self.block_size)
+		block = self.blocks.get((column, block_index))
+		
+		if block is None:
+			self.misses += 1
+			return None
+		
+		self.hits += 1
+		self.blocks.move_to_end((column, block_index))
+		
+		return block[offset]
+	
+	def put(self, column: int, block_index: int, block: list[str]):
+		"""
+        Stores a formatted block and evicts the least recently used blocks if the memory limit is exceeded.
+
+        Args:
+            column (int): The column of the block.
+            block_index (int): The index of the block within the column.
+            block (list[str]): The formatted strings of the block.
+        """
+		key = (column, block_index)
+		block_memory = sys.getsizeof(block) + sum(map(sys.getsizeof, block))
+		
+		if key in self.blocks:
+			self.memory_usage -= self.blocks_memory[key]
+		
+		self.blocks[key] = block
+		self.blocks.move_to_end(key)
+		self.blocks_memory[key] = block_memory
+		self.memory_usage += block_memory
+		
+		while self.memory_usage > self.memory_limit and len(self.blocks) > 1:
+			evicted_key, _ = self.blocks.popitem(last=False)
+			self.memory_usage -= self.blocks_memory.pop(evicted_key)
+			self.evictions += 1
 
 
 class PyAbstractTableModel(QAbstractTableModel):
@@ -44,8 +447,23 @@ class PyAbstractTableModel(QAbstractTableModel):
         table_data (pandas.DataFrame): The pandas.DataFrame to be displayed in the table model.
         format_data (typing.Optional[typing.Union[typing.Callable[[typing.Any], str]]]): A callable to format all data in the table. Defaults to None.
         format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary mapping column indices to callables for formatting specific columns. Defaults to None.
+        data_cache (typing.Optional[FormattedDataCache]): The cache of formatted display strings, if caching is enabled.
+        column_values (list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]]): The values of every column, taken from table_data without copying where possible.
+        index_values (numpy.ndarray): The index of table_data.
+        horizontal_header_labels (list[str]): The cached labels of the horizontal header.
+        row_count (int): The number of rows exposed by the model.
+        diff_key_column (typing.Optional[typing.Hashable]): The column with unique row keys used to reset data by diff.
+        max_diff_ranges (int): The maximum number of inserted and removed row ranges of a diff or of remove_rows before the model is reset instead.
+        column_styles (list[ColumnStyle]): The styles of the columns.
+        column_alignments (dict[int, Qt.AlignmentFlag]): The text alignment of every aligned column.
+        role_codes (dict[tuple[int, int], numpy.ndarray]): The per-row index into role_values for every styled (role, column) pair.
+        role_values (dict[tuple[int, int], list[typing.Any]]): The distinct values served for every styled (role, column) pair.
+        data_version (int): A counter incremented on every change of the stored data, used by proxies to invalidate derived data.
+        sort_enabled (bool): Whether sort reorders the stored data.
     """
 	
+	rowsPermuted = pyqtSignal(object)
+	
 	def __init__(self, abstract_table_model_init: AbstractTableModelInit):
 		"""
         Initializes a PyAbstractTableModel object.
@@ -58,6 +476,189 @@ class PyAbstractTableModel(QAbstractTableModel):
 		self.table_data = abstract_table_model_init.data
 		self.format_data = abstract_table_model_init.format_data
 		self.format_data_by_column = abstract_table_model_init.format_data_by_column
+		self.diff_key_column = abstract_table_model_init.diff_key_column
+		self.sort_enabled = abstract_table_model_init.sort_enabled
+		self.max_diff_ranges = abstract_table_model_init.max_diff_ranges
+		self.column_styles = (
+				abstract_table_model_init.column_styles
+				if abstract_table_model_init.column_styles is not None
+				else []
+		)
+		self.column_alignments = {
+			style.column: style.alignment
+			for style in self.column_styles
+			if style.alignment is not None
+		}
+		self.role_codes: dict[tuple[int, int], numpy.ndarray] = {}
+		self.role_values: dict[tuple[int, int], list[typing.Any]] = {}
+		self.data_cache = (
+				FormattedDataCache(
+						abstract_table_model_init.cache_block_size,
+						abstract_table_model_init.cache_memory_limit
+				)
+				if abstract_table_model_init.cache_formatted_data
+				else None
+		)
+		
+		self.column_values: list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]] = []
+		self.index_values = numpy.empty(0)
+		self.horizontal_header_labels: list[str] = []
+		self.row_count = 0
+		self.data_version = 0
+		self.reset_storage()
+	
+	def append_rows(self, data: pandas.DataFrame):
+		"""
+        Appends rows to the end of the table and emits a single rows inserted range.
+
+        table_data is a single DataFrame, so every call copies the whole table and appending batch by batch is quadratic in the number of batches. Append rows in batches, for example through PyTableUpdateBatcher, rather than one by one.
+
+        Args:
+            data (pandas.DataFrame): The rows to append. Must have the same columns as table_data.
+        """
+		if data.shape[0] == 0:
+			return
+		
+		first_row = self.row_count
+		
+		self.beginInsertRows(QModelIndex(), first_row, first_row + data.shape[0] - 1)
+		self.table_data = pandas.concat(
+				[self.table_data, data],
+				ignore_index=isinstance(self.table_data.index, pandas.RangeIndex)
+		)
+		self.reset_storage()
+		
+		if self.data_cache is not None:
+			self.data_cache.invalidate_rows(first_row)
+		
+		self.endInsertRows()
+	
+	def apply_data_diff(self, data: pandas.DataFrame) -> bool:
+		"""
+        Replaces table_data with new data by emitting only the rows removed, inserted and changed between them.
+
+        Rows are matched by diff_key_column. The removed rows are emitted first, then the changed rows, then the inserted rows, and table_data holds the matching intermediate rows during every notification. The vertical header is refreshed if rows were inserted or removed or the index labels of the kept rows changed.
+
+        The diff is not applied if the columns or dtypes differ, the keys are not unique, the rows kept in both frames changed their relative order, or there are more than max_diff_ranges inserted and removed ranges.
+
+        Args:
+            data (pandas.DataFrame): The new data.
+
+        Returns:
+            bool: True if the diff was applied, False if the model has to be reset instead.
+        """
+		old_data = self.table_data
+		
+		if (
+				self.diff_key_column is None
+				or self.diff_key_column not in old_data.columns
+				or not old_data.columns.equals(data.columns)
+				or not old_data.dtypes.equals(data.dtypes)
+		):
+			return False
+		
+		old_keys = pandas.Index(old_data[self.diff_key_column])
+		new_keys = pandas.Index(data[self.diff_key_column])
+		
+		if not old_keys.is_unique or not new_keys.is_unique:
+			return False
+		
+		new_positions_in_old = old_keys.get_indexer(new_keys)
+		inserted_mask = new_positions_in_old == -1
+		removed_mask = new_keys.get_indexer(old_keys) == -1
+		old_common = new_positions_in_old[~inserted_mask]
+		new_common = numpy.flatnonzero(~inserted_mask)
+		
+		if numpy.any(numpy.diff(old_common) <= 0):
+			return False
+		
+		changed_matrix = numpy.zeros((new_common.size, data.shape[1]), dtype=bool)
+		
+		for column in range(data.shape[1]):
+			old_values = old_data.iloc[old_common, column].reset_index(drop=True)
+			new_values = data.iloc[new_common, column].reset_index(drop=True)
+			equal_values = old_values.eq(new_values) | (old_values.isna() & new_values.isna())
+			changed_matrix[:, column] = ~equal_values.to_numpy(dtype=bool, na_value=False)
+		
+		removed_ranges = get_contiguous_ranges(numpy.flatnonzero(removed_mask))
+		inserted_ranges = get_contiguous_ranges(numpy.flatnonzero(inserted_mask))
+		
+		if len(removed_ranges) + len(inserted_ranges) > self.max_diff_ranges:
+			return False
+		
+		labels_changed = not old_data.index[old_common].equals(data.index[new_common])
+		kept_mask = numpy.ones(old_data.shape[0], dtype=bool)
+		
+		for first_row, last_row in reversed(removed_ranges):
+			self.beginRemoveRows(QModelIndex(), first_row, last_row)
+			kept_mask[first_row:last_row + 1] = False
+			self.table_data = old_data.iloc[kept_mask]
+			self.reset_storage()
+			
+			if self.data_cache is not None:
+				self.data_cache.invalidate_rows(first_row)
+			
+			self.endRemoveRows()
+		
+		self.table_data = data.iloc[new_common] if inserted_ranges else data
+		self.reset_storage()
+		
+		changed_rows = changed_matrix.any(axis=1)
+		
+		for first, last in get_contiguous_ranges(numpy.flatnonzero(changed_rows)):
+			self.emit_rows_changed(
+					range(first, last + 1),
+					numpy.flatnonzero(changed_matrix[first:last + 1].any(axis=0)).tolist()
+			)
+		
+		present_mask = ~inserted_mask
+		
+		for first_row, last_row in inserted_ranges:
+			self.beginInsertRows(QModelIndex(), first_row, last_row)
+			present_mask[first_row:last_row + 1] = True
+			self.table_data = data if present_mask.all() else data.iloc[present_mask]
+			self.reset_storage()
+			
+			if self.data_cache is not None:
+				self.data_cache.invalidate_rows(first_row)
+			
+			self.endInsertRows()
+		
+		if (removed_ranges or inserted_ranges or labels_changed) and self.row_count > 0:
+			self.headerDataChanged.emit(Qt.Orientation.Vertical, 0, self.row_count - 1)
+		
+		return True
+	
+	def apply_sort_permutation(self, permutation: numpy.ndarray):
+		"""
+        Reorders the stored rows and moves persistent indexes, such as the selection of attached views, with their rows.
+
+        rowsPermuted is emitted with the permutation right after data_version is incremented, before layoutChanged, so that proxies can reorder derived data instead of evaluating it again.
+
+        Args:
+            permutation (numpy.ndarray): The previous position of every row, in the new order.
+        """
+		self.layoutAboutToBeChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
+		
+		self.table_data = self.table_data.take(permutation)
+		self.reset_storage()
+		self.rowsPermuted.emit(permutation)
+		
+		if self.data_cache is not None:
+			self.data_cache.clear()
+		
+		persistent_indexes = self.persistentIndexList()
+		
+		if persistent_indexes:
+			new_rows = numpy.empty_like(permutation)
+			new_rows[permutation] = numpy.arange(permutation.size)
+			
+			self.changePersistentIndexList(
+					persistent_indexes,
+					[self.index(int(new_rows[index.row()]), index.column()) for index in persistent_indexes]
+			)
+		
+		self.layoutChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
 	
 	def columnCount(self, index: QModelIndex = QModelIndex()) -> int:
 		"""
@@ -71,32 +672,133 @@ class PyAbstractTableModel(QAbstractTableModel):
         """
 		return self.table_data.shape[1]
 	
-	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Optional[str]:
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
 		"""
         Returns the data for the given index and role.
 
+        Besides the display text, the alignment, colors and fonts evaluated from column_styles are served for the TextAlignmentRole, ForegroundRole, BackgroundRole and FontRole.
+
         Args:
             index (QModelIndex): The index of the data item.
             role (int): The data role. Defaults to Qt.ItemDataRole.DisplayRole.
 
         Returns:
-            typing.Optional[str]: The data.
+            typing.Any: The data.
         """
 		if role == Qt.ItemDataRole.DisplayRole:
-			if self.format_data_by_column is not None:
-				if index.column() in self.format_data_by_column:
-					return self.format_data_by_column[index.column()](self.table_data.iloc[index.row(), index.column()])
-				elif self.format_data is not None:
-					return self.format_data(self.table_data.iloc[index.row(), index.column()])
-				else:
-					return str(self.table_data.iloc[index.row(), index.column()])
-			elif self.format_data is not None:
-				return self.format_data(self.table_data.iloc[index.row(), index.column()])
-			else:
-				return str(self.table_data.iloc[index.row(), index.column()])
+			if self.data_cache is not None:
+				return self.get_cached_display_data(index.row(), index.column())
+			
+			return self.get_column_formatter(index.column())(self.column_values[index.column()][index.row()])
+		elif role == Qt.ItemDataRole.TextAlignmentRole:
+			return self.column_alignments.get(index.column())
+		
+		codes = self.role_codes.get((role, index.column()))
+		
+		if codes is not None:
+			return self.role_values[(role, index.column())][codes[index.row()]]
 		
 		return None
 	
+	def evaluate_column_styles(self, column: typing.Optional[int] = None, rows: typing.Optional[numpy.ndarray] = None):
+		"""
+        Evaluates the style rules into per-row role codes, vectorized over the column values.
+
+        Args:
+            column (typing.Optional[int]): The column to evaluate. If None, every styled column is evaluated.
+            rows (typing.Optional[numpy.ndarray]): The rows to re-evaluate. If None, the whole column is evaluated.
+        """
+		style_roles = (
+				(Qt.ItemDataRole.ForegroundRole, "foreground"),
+				(Qt.ItemDataRole.BackgroundRole, "background"),
+				(Qt.ItemDataRole.FontRole, "font")
+		)
+		
+		for style in self.column_styles:
+			if column is not None and style.column != column:
+				continue
+			
+			values = self.column_values[style.column]
+			
+			if rows is not None:
+				values = values[rows]
+			
+			masks = [rule.get_mask(values) for rule in style.rules]
+			
+			for role, attribute in style_roles:
+				role_values = [getattr(style, attribute)]
+				codes = numpy.zeros(len(values), dtype=numpy.int16)
+				
+				for rule, mask in zip(style.rules, masks):
+					if getattr(rule, attribute) is not None:
+						role_values.append(getattr(rule, attribute))
+						codes[mask] = len(role_values) - 1
+				
+				if len(role_values) == 1 and role_values[0] is None:
+					continue
+				
+				if rows is None:
+					self.role_codes[(role, style.column)] = codes
+					self.role_values[(role, style.column)] = role_values
+				else:
+					self.role_codes[(role, style.column)][rows] = codes
+	
+	def format_column_block(self, column: int, start: int, stop: int) -> list[str]:
+		"""
+        Formats a block of rows of a single column at once.
+
+        Args:
+            column (int): The column to format.
+            start (int): The first row of the block.
+            stop (int): The row after the last row of the block.
+
+        Returns:
+            list[str]: The formatted strings of the block.
+        """
+		values = self.column_values[column][start:stop]
+		formatter = self.get_column_formatter(column)
+		
+		if formatter is str and isinstance(values, numpy.ndarray) and values.dtype.kind in "biuf":
+			return values.astype(str).tolist()
+		
+		return list(map(formatter, values))
+	
+	def get_cached_display_data(self, row: int, column: int) -> str:
+		"""
+        Returns the display string of a cell from the cache, formatting its block first if needed.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            str: The display string.
+        """
+		cached_value = self.data_cache.get(row, column)
+		
+		if cached_value is not None:
+			return cached_value
+		
+		block_index, offset = divmod(row, self.data_cache.block_size)
+		start = block_index * self.data_cache.block_size
+		block = self.format_column_block(column, start, min(start + self.data_cache.block_size, self.rowCount()))
+		
+		self.data_cache.put(column, block_index, block)
+		
+		return block[offset]
+	
+	def get_column_formatter(self, column: int) -> typing.Callable[[typing.Any], str]:
+		"""
+        Returns the callable used to format the values of a column.
+
+        Args:
+            column (int): The column index.
+
+        Returns:
+            typing.Callable[[typing.Any], str]: The formatter of the column.
+        """
+		return get_column_formatter(column, self.format_data, self.format_data_by_column)
+	
 	def headerData(
 			self,
 			section: int,
@@ -116,9 +818,9 @@ class PyAbstractTableModel(QAbstractTableModel):
         """
 		if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.UserRole:
 			if orientation == Qt.Orientation.Horizontal:
-				return str(self.table_data.columns[section])
+				return self.horizontal_header_labels[section]
 			elif orientation == Qt.Orientation.Vertical:
-				return str(self.table_data.index[section] + 1)
+				return str(self.index_values[section] + 1)
 		
 		return None
 	
@@ -126,13 +828,105 @@ class PyAbstractTableModel(QAbstractTableModel):
 		"""
         Resets the table data with a new pandas.DataFrame.
 
+        If diff_key_column is set, only the differences between the old and the new data are emitted when possible.
+
         Args:
             data (pandas.DataFrame): The new pandas.DataFrame to use.
         """
+		if self.apply_data_diff(data):
+			return
+		
 		self.beginResetModel()
 		self.table_data = data
+		self.reset_storage()
+		
+		if self.data_cache is not None:
+			self.data_cache.clear()
+		
 		self.endResetModel()
 	
+	def emit_rows_changed(self, rows: typing.Iterable[int], columns: typing.Iterable[int]):
+		"""
+        Emits dataChanged for every contiguous range of rows, spanning the given columns.
+
+        Args:
+            rows (typing.Iterable[int]): The changed rows.
+            columns (typing.Iterable[int]): The changed columns.
+        """
+		columns = list(columns)
+		
+		if not columns:
+			return
+		
+		first_column, last_column = min(columns), max(columns)
+		ranges = get_contiguous_ranges(rows)
+		
+		if self.data_cache is not None and ranges:
+			block_size = self.data_cache.block_size
+			block_rows = numpy.unique(numpy.asarray(rows, dtype=numpy.int64) // block_size) * block_size
+			
+			self.data_cache.invalidate_cells(
+					numpy.repeat(block_rows, len(columns)),
+					numpy.tile(numpy.asarray(columns, dtype=numpy.int64), block_rows.size)
+			)
+		
+		for first_row, last_row in ranges:
+			self.dataChanged.emit(self.index(first_row, first_column), self.index(last_row, last_column))
+	
+	def remove_rows(self, rows: typing.Iterable[int]):
+		"""
+        Removes rows by position and emits one rows removed range per contiguous block of rows.
+
+        The ranges are removed from the last one to the first one, so the positions of the ranges not yet reported stay valid, and table_data holds the matching intermediate rows during every notification. If there are more than max_diff_ranges ranges, the model is reset instead.
+
+        Args:
+            rows (typing.Iterable[int]): The positions of the rows to remove.
+        """
+		ranges = get_contiguous_ranges(rows)
+		
+		if not ranges:
+			return
+		
+		old_data = self.table_data
+		kept_mask = numpy.ones(self.row_count, dtype=bool)
+		
+		if len(ranges) > self.max_diff_ranges:
+			for first_row, last_row in ranges:
+				kept_mask[first_row:last_row + 1] = False
+			
+			self.beginResetModel()
+			self.table_data = old_data.iloc[kept_mask]
+			self.reset_storage()
+			
+			if self.data_cache is not None:
+				self.data_cache.clear()
+			
+			self.endResetModel()
+			return
+		
+		for first_row, last_row in reversed(ranges):
+			self.beginRemoveRows(QModelIndex(), first_row, last_row)
+			kept_mask[first_row:last_row + 1] = False
+			self.table_data = old_data.iloc[kept_mask]
+			self.reset_storage()
+			
+			if self.data_cache is not None:
+				self.data_cache.invalidate_rows(first_row)
+			
+			self.endRemoveRows()
+	
+	def reset_storage(self):
+		"""Takes the column values, index and header labels from table_data."""
+		self.column_values = [
+				get_column_values(self.table_data.iloc[:, column])
+				for column in range(self.table_data.shape[1])
+		]
+		self.index_values = self.table_data.index.to_numpy()
+		self.horizontal_header_labels = [str(column) for column in self.table_data.columns]
+		self.row_count = self.table_data.shape[0]
+		self.data_version += 1
+		self.evaluate_column_styles()
+	
 	def rowCount(self, index: QModelIndex = QModelIndex()) -> int:
 		"""
         Returns the number of rows in the model.
@@ -143,4 +937,110 @@ class PyAbstractTableModel(QAbstractTableModel):
         Returns:
             int: The number of rows.
         """
-		return self.table_data.shape[0]
+		return self.row_count
+	
+	def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+		"""
+        Sorts the table by the raw values of a column if sort_enabled is set, and does nothing otherwise.
+
+        Args:
+            column (int): The column to sort by. Negative columns keep the current order.
+            order (Qt.SortOrder): The sort order. Defaults to Qt.SortOrder.AscendingOrder.
+        """
+		if self.sort_enabled and 0 <= column < self.columnCount():
+			self.sort_by_columns([column], [order])
+	
+	def sort_by_columns(
+			self,
+			columns: typing.Sequence[int],
+			orders: typing.Optional[typing.Sequence[Qt.SortOrder]] = None
+	):
+		"""
+        Sorts the table by the raw values of several columns at once with a stable vectorized sort, and reorders the stored data.
+
+        Args:
+            columns (typing.Sequence[int]): The columns to sort by, from the primary to the last tie-breaker.
+            orders (typing.Optional[typing.Sequence[Qt.SortOrder]]): The sort order of every column. Defaults to ascending for every column.
+        """
+		if orders is None:
+			orders = [Qt.SortOrder.AscendingOrder] * len(columns)
+		
+		self.apply_sort_permutation(get_sort_permutation(self.table_data, columns, orders))
+	
+	def update_cells(
+			self,
+			rows: typing.Sequence[int],
+			columns: typing.Sequence[int],
+			values: typing.Sequence[typing.Any]
+	):
+		"""
+        Updates single cells in place and emits dataChanged for contiguous ranges of the changed rows.
+
+        The cells are sorted once by column and once by row, so that every column is written with one slice and every range spans its changed columns; the cached blocks of the cells are invalidated once for the whole batch.
+
+        Args:
+            rows (typing.Sequence[int]): The row of every changed cell.
+            columns (typing.Sequence[int]): The column of every changed cell.
+            values (typing.Sequence[typing.Any]): The new value of every changed cell.
+        """
+		rows = numpy.asarray(rows, dtype=numpy.int64)
+		columns = numpy.asarray(columns, dtype=numpy.int64)
+		
+		if rows.size == 0:
+			return
+		
+		column_order = numpy.lexsort((rows, columns))
+		ordered_values = [values[position] for position in column_order.tolist()]
+		column_rows = rows[column_order]
+		changed_columns, column_starts = numpy.unique(columns[column_order], return_index=True)
+		column_stops = numpy.append(column_starts[1:], rows.size)
+		
+		for column, start, stop in zip(changed_columns.tolist(), column_starts.tolist(), column_stops.tolist()):
+			self.update_column(column, column_rows[start:stop], ordered_values[start:stop])
+		
+		if self.data_cache is not None:
+			self.data_cache.invalidate_cells(rows, columns)
+		
+		row_order = numpy.argsort(rows, kind="stable")
+		sorted_rows = rows[row_order]
+		sorted_columns = columns[row_order]
+		breaks = numpy.flatnonzero(numpy.diff(sorted_rows) > 1)
+		range_starts = numpy.concatenate(([0], breaks + 1))
+		range_stops = numpy.concatenate((breaks, [rows.size - 1]))
+		
+		for first_row, last_row, first_column, last_column in zip(
+				sorted_rows[range_starts].tolist(),
+				sorted_rows[range_stops].tolist(),
+				numpy.minimum.reduceat(sorted_columns, range_starts).tolist(),
+				numpy.maximum.reduceat(sorted_columns, range_starts).tolist()
+		):
+			self.dataChanged.emit(self.index(first_row, first_column), self.index(last_row, last_column))
+	
+	def update_column(self, column: int, rows: numpy.ndarray, values: typing.Any):
+		"""
+        Writes values into a column of table_data in place and refreshes the column values taken from it.
+
+        Args:
+            column (int): The column to write into.
+            rows (numpy.ndarray): The positions of the rows to write.
+            values (typing.Any): The values to write.
+        """
+		self.table_data.iloc[rows, column] = values
+		self.column_values[column] = get_column_values(self.table_data.iloc[:, column])
+		self.data_version += 1
+		self.evaluate_column_styles(column, rows)
+	
+	def update_rows(self, rows: typing.Sequence[int], data: pandas.DataFrame):
+		"""
+        Updates whole rows in place and emits dataChanged for every contiguous range of the changed rows.
+
+        Args:
+            rows (typing.Sequence[int]): The positions of the changed rows.
+            data (pandas.DataFrame): The new values of the rows, in the same order as rows and with the same columns as table_data.
+        """
+		rows = numpy.asarray(rows, dtype=numpy.int64)
+		
+		for column in range(self.columnCount()):
+			self.update_column(column, rows, data.iloc[:, column].to_numpy())
+		
+		self.emit_rows_changed(rows, range(self.columnCount()))
@@ -0,0 +1,469 @@
+import abc
+import numpy
+import typing
+import pandas
+import collections
+from PyQt6.QtCore import (
+	QAbstractTableModel,
+	QModelIndex,
+	Qt
+)
+from PyGraphicUI.Objects.AbstractTableModel import get_column_formatter, get_column_values
+
+
+class TableChunkProvider(abc.ABC):
+	"""
+    Base class for sources that read table rows in fixed size chunks.
+
+    Every chunk except the last one must contain exactly chunk_size rows.
+
+    Attributes:
+        columns (list[typing.Hashable]): The column labels of the table.
+        chunk_size (int): The number of rows in a chunk.
+        row_count (typing.Optional[int]): The total number of rows, or None if it is unknown until the source is exhausted.
+    """
+	
+	def __init__(
+			self,
+			columns: list[typing.Hashable],
+			chunk_size: int,
+			row_count: typing.Optional[int] = None
+	):
+		"""
+        Initializes a TableChunkProvider object.
+
+        Args:
+            columns (list[typing.Hashable]): The column labels.
+            chunk_size (int): The number of rows in a chunk.
+            row_count (typing.Optional[int]): The total number of rows, if known.
+        """
+		self.columns = columns
+		self.chunk_size = chunk_size
+		self.row_count = row_count
+	
+	@abc.abstractmethod
+	def read_chunk(self, chunk_index: int) -> typing.Optional[pandas.DataFrame]:
+		"""
+        Reads a chunk of rows.
+
+        Args:
+            chunk_index (int): The index of the chunk.
+
+        Returns:
+            typing.Optional[pandas.DataFrame]: The rows of the chunk, or None if the chunk is past the end of the source.
+        """
+
+
+class IteratorChunkProvider(TableChunkProvider):
+	"""
+    A chunk provider reading chunks from an iterator of DataFrames, such as a generator or a pandas chunked reader.
+
+    Chunks are read sequentially. Reading a chunk before the current position restarts the iterator from the beginning.
+
+    Attributes:
+        chunks_factory (typing.Callable[[], typing.Iterable[pandas.DataFrame]]): A callable returning a new iterator over the chunks.
+        chunks_iterator (typing.Optional[typing.Iterator[pandas.DataFrame]]): The current iterator over the chunks.
+        next_chunk_index (int): The index of the chunk the current iterator returns next.
+
+    :Usage:
+        provider = IteratorChunkProvider(lambda: pandas.read_csv("trades.csv", chunksize=50_000), ["time", "price"], 50_000)
+    """
+	
+	def __init__(
+			self,
+			chunks_factory: typing.Callable[[], typing.Iterable[pandas.DataFrame]],
+			columns: list[typing.Hashable],
+			chunk_size: int
+	):
+		"""
+        Initializes an IteratorChunkProvider object.
+
+        Args:
+            chunks_factory (typing.Callable[[], typing.Iterable[pandas.DataFrame]]): A callable returning a new iterator over the chunks.
+            columns (list[typing.Hashable]): The column labels.
+            chunk_size (int): The number of rows in a chunk.
+        """
+		super().__init__(columns, chunk_size)
+		
+		self.chunks_factory = chunks_factory
+		self.chunks_iterator: typing.Optional[typing.Iterator[pandas.DataFrame]] = None
+		self.next_chunk_index = 0
+	
+	def read_chunk(self, chunk_index: int) -> typing.Optional[pandas.DataFrame]:
+		"""
+        Reads a chunk of rows, advancing or restarting the iterator as needed.
+
+        Args:
+            chunk_index (int): The index of the chunk.
+
+        Returns:
+            typing.Optional[pandas.DataFrame]: The rows of the chunk, or None if the iterator is exhausted before it.
+        """
+		if self.chunks_iterator is None or chunk_index < self.next_chunk_index:
+			self.chunks_iterator = iter(self.chunks_factory())
+			self.next_chunk_index = 0
+		
+		for chunk in self.chunks_iterator:
+			self.next_chunk_index += 1
+			
+			if self.next_chunk_index - 1 == chunk_index:
+				return chunk
+		
+		return None
+
+
+class CSVChunkProvider(IteratorChunkProvider):
+	"""
+    A chunk provider reading a CSV file with the pandas chunked reader.
+
+    Chunks at or after the position of the open reader are read from it, so scrolling down parses every line once. Chunks before it (for example after being evicted) are read directly by skipping the preceding lines without parsing them. The file is expected to have a single header line.
+
+    Attributes:
+        path (str): The path of the CSV file.
+        read_csv_kwargs (dict[str, typing.Any]): Extra keyword arguments passed to pandas.read_csv.
+
+    :Usage:
+        provider = CSVChunkProvider("trades.csv", chunk_size=100_000, sep=";")
+    """
+	
+	def __init__(self, path: str, chunk_size: int = 100_000, **read_csv_kwargs: typing.Any):
+		"""
+        Initializes a CSVChunkProvider object.
+
+        Args:
+            path (str): The path of the CSV file.
+            chunk_size (int): The number of rows in a chunk. Defaults to 100000.
+            **read_csv_kwargs (typing.Any): Extra keyword arguments passed to pandas.read_csv.
+        """
+		self.path = path
+		self.read_csv_kwargs = read_csv_kwargs
+		
+		super().__init__(
+				lambda: pandas.read_csv(self.path, chunksize=self.chunk_size, **self.read_csv_kwargs),
+				pandas.read_csv(path, nrows=0, **read_csv_kwargs).columns.tolist(),
+				chunk_size
+		)
+	
+	def read_chunk(self, chunk_index: int) -> typing.Optional[pandas.DataFrame]:
+		"""
+        Reads a chunk of rows from the CSV file.
+
+        Args:
+            chunk_index (int): The index of the chunk.
+
+        Returns:
+            typing.Optional[pandas.DataFrame]: The rows of the chunk, or None if the file ends before it.
+        """
+		if chunk_index >= self.next_chunk_index:
+			return super().read_chunk(chunk_index)
+		
+		chunk = pandas.read_csv(
+				self.path,
+				skiprows=chunk_index * self.chunk_size + 1,
+				nrows=self.chunk_size,
+				**{**self.read_csv_kwargs, "header": None, "names": self.columns}
+		)
+		
+		return chunk if chunk.shape[0] > 0 else None
+
+
+class NumpyChunkProvider(TableChunkProvider):
+	"""
+    A chunk provider slicing NumPy arrays, for example arrays memory-mapped with `numpy.load(path, mmap_mode="r")`.
+
+    Only the pages of the sliced rows are read from a memory-mapped file.
+
+    Attributes:
+        arrays (list[numpy.ndarray]): The arrays of every column.
+
+    :Usage:
+        provider = NumpyChunkProvider(numpy.load("trades.npy", mmap_mode="r"), chunk_size=100_000)
+    """
+	
+	def __init__(
+			self,
+			data: typing.Union[numpy.ndarray, dict[typing.Hashable, numpy.ndarray]],
+			chunk_size: int = 100_000
+	):
+		"""
+        Initializes a NumpyChunkProvider object.
+
+        Args:
+            data (typing.Union[numpy.ndarray, dict[typing.Hashable, numpy.ndarray]]): A structured array, a 2D array with one column per array column, or a dictionary mapping column labels to 1D arrays.
+            chunk_size (int): The number of rows in a chunk. Defaults to 100000.
+        """
+		if isinstance(data, dict):
+			columns, self.arrays = list(data.keys()), list(data.values())
+		elif data.dtype.names is not None:
+			columns, self.arrays = list(data.dtype.names), [data[name] for name in data.dtype.names]
+		else:
+			columns, self.arrays = list(range(data.shape[1])), [data[:, column] for column in range(data.shape[1])]
+		
+		super().__init__(columns, chunk_size, len(self.arrays[0]) if self.arrays else 0)
+	
+	def read_chunk(self, chunk_index: int) -> typing.Optional[pandas.DataFrame]:
+		"""
+        Slices a chunk of rows out of the arrays.
+
+        Args:
+            chunk_index (int): The index of the chunk.
+
+        Returns:
+            typing.Optional[pandas.DataFrame]: The rows of the chunk, or None if the chunk is past the end of the arrays.
+        """
+		start = chunk_index * self.chunk_size
+		
+		if start >= self.row_count:
+			return None
+		
+		chunk = pandas.DataFrame(
+				{
+					position: array[start:start + self.chunk_size]
+					for position, array in enumerate(self.arrays)
+				},
+				copy=False
+		)
+		chunk.columns = self.columns
+		
+		return chunk
+
+
+class ChunkedTableModelInit:
+	"""
+    Data class to hold initialization parameters for chunked table models.
+
+    Attributes:
+        chunk_provider (TableChunkProvider): The source of the table rows.
+        max_resident_chunks (int): The maximum number of chunks kept in memory. Defaults to 8.
+        format_data (typing.Optional[typing.Callable[[typing.Any], str]]): A callable to format all data in the table. Defaults to None.
+        format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary mapping column indices to callables for formatting specific columns. Defaults to None.
+    """
+	
+	def __init__(
+			self,
+			chunk_provider: TableChunkProvider,
+			max_resident_chunks: int = 8,
+			format_data: typing.Optional[typing.Callable[[typing.Any], str]] = None,
+			format_data_by_column: typing.Optional[dict[int, typing.Callable[[typing.Any], str]]] = None
+	):
+		"""
+        Initializes a ChunkedTableModelInit object.
+
+        Args:
+            chunk_provider (TableChunkProvider): The source of the rows.
+            max_resident_chunks (int): The maximum number of chunks kept in memory.
+            format_data (typing.Optional[typing.Callable[[typing.Any], str]]): A callable to format all data.
+            format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary to format data by column.
+        """
+		self.chunk_provider = chunk_provider
+		self.max_resident_chunks = max_resident_chunks
+		self.format_data = format_data
+		self.format_data_by_column = format_data_by_column
+
+
+class PyChunkedTableModel(QAbstractTableModel):
+	"""
+    A table model that loads rows on demand from a chunk provider and keeps only a bounded number of chunks in memory.
+
+    If the provider knows its row count, the model exposes every row at once and loads chunks when they are displayed. Otherwise, rows are exposed incrementally through canFetchMore/fetchMore as the view scrolls down.
+
+    Attributes:
+        chunk_provider (TableChunkProvider): The source of the table rows.
+        max_resident_chunks (int): The maximum number of chunks kept in memory.
+        format_data (typing.Optional[typing.Callable[[typing.Any], str]]): A callable to format all data in the table.
+        format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary mapping column indices to callables for formatting specific columns.
+        chunks (collections.OrderedDict[int, list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]]]): The resident chunks as column values, least recently used first.
+        fetched_row_count (int): The number of rows exposed so far when the row count of the provider is unknown.
+        exhausted (bool): Whether the provider has no more rows to fetch.
+        horizontal_header_labels (list[str]): The cached labels of the horizontal header.
+    """
+	
+	def __init__(self, chunked_table_model_init: ChunkedTableModelInit):
+		"""
+        Initializes a PyChunkedTableModel object.
+
+        Args:
+            chunked_table_model_init (ChunkedTableModelInit): Initialization parameters for the model.
+        """
+		super().__init__()
+		
+		self.max_resident_chunks = max(1, chunked_table_model_init.max_resident_chunks)
+		self.format_data = chunked_table_model_init.format_data
+		self.format_data_by_column = chunked_table_model_init.format_data_by_column
+		self.chunk_provider = chunked_table_model_init.chunk_provider
+		self.chunks: collections.OrderedDict[int, list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]]] = collections.OrderedDict()
+		self.fetched_row_count = 0
+		self.exhausted = False
+		self.horizontal_header_labels: list[str] = []
+		self.reset_state()
+	
+	def canFetchMore(self, parent: QModelIndex) -> bool:
+		"""
+        Checks whether more rows can be fetched from the provider.
+
+        Args:
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            bool: True if the provider's row count is unknown and it is not exhausted yet.
+        """
+		return not parent.isValid() and self.chunk_provider.row_count is None and not self.exhausted
+	
+	def columnCount(self, index: QModelIndex = QModelIndex()) -> int:
+		"""
+        Returns the number of columns in the model.
+
+        Args:
+            index (QModelIndex): The parent index. Defaults to QModelIndex()
+
+        Returns:
+            int: The number of columns.
+        """
+		return len(self.chunk_provider.columns)
+	
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Optional[str]:
+		"""
+        Returns the data for the given index and role, loading the chunk of the row if it is not resident.
+
+        Args:
+            index (QModelIndex): The index of the data item.
+            role (int): The data role. Defaults to Qt.ItemDataRole.DisplayRole.
+
+        Returns:
+            typing.Optional[str]: The data.
+        """
+		if role == Qt.ItemDataRole.DisplayRole:
+			chunk_index, offset = divmod(index.row(), self.chunk_provider.chunk_size)
+			chunk = self.get_chunk(chunk_index)
+			
+			if chunk is None or offset >= len(chunk[index.column()]):
+				return None
+			
+			return self.get_column_formatter(index.column())(chunk[index.column()][offset])
+		
+		return None
+	
+	def fetchMore(self, parent: QModelIndex):
+		"""
+        Fetches the next chunk from the provider and exposes its rows.
+
+        Args:
+            parent (QModelIndex): The parent index.
+        """
+		if not self.canFetchMore(parent):
+			return
+		
+		chunk_index = self.fetched_row_count // self.chunk_provider.chunk_size
+		chunk = self.get_chunk(chunk_index)
+		chunk_length = 0 if chunk is None or not chunk else len(chunk[0])
+		
+		if chunk_length < self.chunk_provider.chunk_size:
+			self.exhausted = True
+		
+		if chunk_length > 0:
+			self.beginInsertRows(QModelIndex(), self.fetched_row_count, self.fetched_row_count + chunk_length - 1)
+			self.fetched_row_count += chunk_length
+			self.endInsertRows()
+	
+	def get_chunk(
+			self,
+			chunk_index: int
+	) -> typing.Optional[list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]]]:
+		"""
+        Returns a resident chunk, reading it from the provider and evicting the least recently used chunk if needed.
+
+        Args:
+            chunk_index (int): The index of the chunk.
+
+        Returns:
+            typing.Optional[list[typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]]]: The column values of the chunk, or None if it is past the end of the provider.
+        """
+		chunk = self.chunks.get(chunk_index)
+		
+		if chunk is not None:
+			self.chunks.move_to_end(chunk_index)
+			return chunk
+		
+		chunk_data = self.chunk_provider.read_chunk(chunk_index)
+		
+		if chunk_data is None:
+			return None
+		
+		chunk = [get_column_values(chunk_data.iloc[:, column]) for column in range(chunk_data.shape[1])]
+		self.chunks[chunk_index] = chunk
+		
+		while len(self.chunks) > self.max_resident_chunks:
+			self.chunks.popitem(last=False)
+		
+		return chunk
+	
+	def get_column_formatter(self, column: int) -> typing.Callable[[typing.Any], str]:
+		"""
+        Returns the callable used to format the values of a column.
+
+        Args:
+            column (int): The column index.
+
+        Returns:
+            typing.Callable[[typing.Any], str]: The formatter of the column.
+        """
+		return get_column_formatter(column, self.format_data, self.format_data_by_column)
+	
+	def headerData(
+			self,
+			section: int,
+			orientation: Qt.Orientation,
+			role: int = Qt.ItemDataRole.DisplayRole
+	) -> typing.Optional[str]:
+		"""
+        Returns the header data for the given section and orientation.
+
+        Args:
+            section (int): The section index.
+            orientation (Qt.Orientation): The orientation (horizontal or vertical).
+            role (int): The data role. Defaults to Qt.ItemDataRole.DisplayRole.
+
+        Returns:
+            typing.Optional[str]: The header data.
+        """
+		if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.UserRole:
+			if orientation == Qt.Orientation.Horizontal:
+				return self.horizontal_header_labels[section]
+			elif orientation == Qt.Orientation.Vertical:
+				return str(section + 1)
+		
+		return None
+	
+	def reset_chunk_provider(self, chunk_provider: TableChunkProvider):
+		"""
+        Resets the model with a new chunk provider.
+
+        Args:
+            chunk_provider (TableChunkProvider): The new source of rows.
+        """
+		self.beginResetModel()
+		self.chunk_provider = chunk_provider
+		self.reset_state()
+		self.endResetModel()
+	
+	def reset_state(self):
+		"""Drops the resident chunks and the fetched rows, and takes the header labels from the chunk provider."""
+		self.chunks.clear()
+		self.fetched_row_count = 0
+		self.exhausted = False
+		self.horizontal_header_labels = [str(column) for column in self.chunk_provider.columns]
+	
+	def rowCount(self, index: QModelIndex = QModelIndex()) -> int:
+		"""
+        Returns the number of rows in the model.
+
+        Args:
+            index (QModelIndex): The parent index. Defaults to QModelIndex().
+
+        Returns:
+            int: The known row count of the provider, or the number of rows fetched so far.
+        """
+		if self.chunk_provider.row_count is not None:
+			return self.chunk_provider.row_count
+		
+		return self.fetched_row_count
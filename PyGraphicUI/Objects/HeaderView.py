@@ -1,6 +1,14 @@
+import numpy
 import typing
-from PyQt6.QtCore import QRect, QSize, Qt
-from PyQt6.QtGui import QFont, QFontMetrics
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+	QAbstractItemModel,
+	QEvent,
+	QSize,
+	Qt,
+	pyqtBoundSignal
+)
+from PyGraphicUI.Functions import text_measurer
 from PyGraphicUI.Objects.Widgets import WidgetInit
 from PyGraphicUI.Attributes import ObjectSize, PyFont
 from PyQt6.QtWidgets import (
@@ -82,6 +90,15 @@ class HeaderViewInit(WidgetInit):
 class PyHeaderView(QHeaderView):
 	"""
     A custom header view class with enhanced initialization.
+
+    The sizes of the sections are measured in one batch when the model resets or the font changes and kept in arrays. Afterwards only the sections whose header text or section size changed are measured again.
+
+    Attributes:
+        font (QFont): The font the header texts are measured with.
+        section_texts (typing.Optional[list[str]]): The header text of every section, or None if every section must be measured again.
+        measured_sizes (numpy.ndarray): The section size every content size was measured for, -1 if the section must be measured again.
+        content_widths (numpy.ndarray): The measured content width of every section.
+        content_heights (numpy.ndarray): The measured content height of every section.
     """
 	
 	def __init__(self, header_view_init: HeaderViewInit):
@@ -97,6 +114,10 @@ class PyHeaderView(QHeaderView):
 			super().__init__(header_view_init.orientation, header_view_init.parent)
 		
 		self.font = header_view_init.font
+		self.section_texts: typing.Optional[list[str]] = None
+		self.measured_sizes = numpy.empty(0, dtype=numpy.int64)
+		self.content_widths = numpy.empty(0, dtype=numpy.int64)
+		self.content_heights = numpy.empty(0, dtype=numpy.int64)
 		self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
 		self.setEnabled(header_view_init.enabled)
 		self.setGraphicsEffect(header_view_init.graphic_effect)
@@ -111,6 +132,107 @@ class PyHeaderView(QHeaderView):
 		if header_view_init.size_policy is not None:
 			self.setSizePolicy(header_view_init.size_policy)
 	
+	def changeEvent(self, event: QEvent):
+		"""
+        Measures every section again when the font of the header view changes.
+
+        Args:
+            event (QEvent): The change event.
+        """
+		if event.type() == QEvent.Type.FontChange:
+			self.font = QHeaderView.font(self)
+			self.reset_section_sizes()
+		
+		super().changeEvent(event)
+	
+	def get_section_signals(self, model: QAbstractItemModel) -> list[pyqtBoundSignal]:
+		"""
+        Returns the signals of a model after which every section must be measured again.
+
+        Args:
+            model (QAbstractItemModel): The model.
+
+        Returns:
+            list[pyqtBoundSignal]: The reset, layout change and section insertion and removal signals.
+        """
+		if self.orientation() == Qt.Orientation.Horizontal:
+			return [model.modelReset, model.layoutChanged, model.columnsInserted, model.columnsRemoved]
+		
+		return [model.modelReset, model.layoutChanged, model.rowsInserted, model.rowsRemoved]
+	
+	def get_header_text(self, logical_index: int) -> str:
+		"""
+        Returns the display text of a section.
+
+        Args:
+            logical_index (int): The logical index of the section.
+
+        Returns:
+            str: The header text, or an empty string if the model has none.
+        """
+		header_text = self.model().headerData(logical_index, self.orientation(), Qt.ItemDataRole.DisplayRole)
+		
+		return "" if header_text is None else str(header_text)
+	
+	def measure_section(self, logical_index: int):
+		"""
+        Measures the content size of a section for its current section size.
+
+        Args:
+            logical_index (int): The logical index of the section.
+        """
+		max_width = self.sectionSize(logical_index)
+		
+		rect = text_measurer.measure(
+				self.section_texts[logical_index],
+				self.font,
+				max_width,
+				self.defaultAlignment() | Qt.TextFlag.TextWordWrap | Qt.TextFlag.TextExpandTabs,
+				4
+		)
+		
+		self.measured_sizes[logical_index] = max_width
+		self.content_widths[logical_index] = rect.width()
+		self.content_heights[logical_index] = rect.height()
+	
+	def measure_sections(self):
+		"""Fetches the header text of every section and measures every section."""
+		count = self.count()
+		
+		self.section_texts = [self.get_header_text(logical_index) for logical_index in range(count)]
+		self.measured_sizes = numpy.full(count, -1, dtype=numpy.int64)
+		self.content_widths = numpy.zeros(count, dtype=numpy.int64)
+		self.content_heights = numpy.zeros(count, dtype=numpy.int64)
+		
+		for logical_index in range(count):
+			self.measure_section(logical_index)
+	
+	def reset_section_sizes(self):
+		"""Drops the measured sizes, so every section is measured again on the next size query."""
+		self.section_texts = None
+	
+	def setModel(self, model: typing.Optional[QAbstractItemModel]):
+		"""
+        Sets the model of the header view and follows the changes of its sections.
+
+        Args:
+            model (typing.Optional[QAbstractItemModel]): The model.
+        """
+		if self.model() is not None:
+			for signal in self.get_section_signals(self.model()):
+				signal.disconnect(self.reset_section_sizes)
+			
+			self.model().headerDataChanged.disconnect(self.source_header_data_changed)
+		
+		super().setModel(model)
+		self.reset_section_sizes()
+		
+		if model is not None:
+			for signal in self.get_section_signals(model):
+				signal.connect(self.reset_section_sizes)
+			
+			model.headerDataChanged.connect(self.source_header_data_changed)
+	
 	def set_minimum_size(self, minimum_size: typing.Optional[ObjectSize]):
 		"""
         Sets the minimum size of the header view.
@@ -160,6 +282,8 @@ class PyHeaderView(QHeaderView):
 		"""
         Calculates the size of a section based on its contents.
 
+        The size is read from the measured arrays. Every section is measured in one batch if the arrays were reset, and a single section is measured again if its section size changed since it was measured.
+
         Args:
             logicalIndex (int): The logical index of the section.
 
@@ -167,17 +291,30 @@ class PyHeaderView(QHeaderView):
             QSize: The calculated size of the section.
         """
 		if self.model():
-			header_text = self.model().headerData(logicalIndex, self.orientation(), Qt.ItemDataRole.DisplayRole)
-		
-			metrics = QFontMetrics(self.font)
-			max_width = self.sectionSize(logicalIndex)
+			if self.section_texts is None or len(self.section_texts) != self.count():
+				self.measure_sections()
+			elif self.measured_sizes[logicalIndex] != self.sectionSize(logicalIndex):
+				self.measure_section(logicalIndex)
 		
-			rect = metrics.boundingRect(
-					QRect(0, 0, max_width, 5000),
-					self.defaultAlignment() | Qt.TextFlag.TextWordWrap | Qt.TextFlag.TextExpandTabs,
-					header_text,
-					4
-			)
-			return rect.size()
+			return QSize(int(self.content_widths[logicalIndex]), int(self.content_heights[logicalIndex]))
 		else:
 			return super().sectionSizeFromContents(logicalIndex)
+	
+	def source_header_data_changed(self, orientation: Qt.Orientation, first: int, last: int):
+		"""
+        Measures again the sections whose header text changed.
+
+        Args:
+            orientation (Qt.Orientation): The orientation of the changed sections.
+            first (int): The first changed section.
+            last (int): The last changed section.
+        """
+		if orientation != self.orientation() or self.section_texts is None:
+			return
+		
+		for logical_index in range(first, min(last + 1, len(self.section_texts))):
+			header_text = self.get_header_text(logical_index)
+			
+			if header_text != self.section_texts[logical_index]:
+				self.section_texts[logical_index] = header_text
+				self.measured_sizes[logical_index] = -1
@@ -0,0 +1,156 @@
+import os
+import numpy
+import typing
+from PyGraphicUI.Objects.ChunkedTableModel import (
+	ChunkedTableModelInit,
+	NumpyChunkProvider,
+	PyChunkedTableModel
+)
+
+
+def open_memory_mapped_columns(
+		path: str,
+		columns: typing.Optional[list[str]] = None
+) -> dict[str, numpy.ndarray]:
+	"""
+    Opens fixed-width columnar data as read-only memory-mapped NumPy arrays.
+
+    Supported layouts are a directory with one `<column>.npy` file per column, a single `.npy` file with a structured or 2D array, and an Arrow IPC file (`.arrow`, `.feather`, `.ipc`), which requires pyarrow. Arrow columns that are not fixed-width or contain nulls are copied into memory.
+
+    Args:
+        path (str): The path of the directory or file.
+        columns (typing.Optional[list[str]]): The columns to open, in display order. If None, every column is opened; the columns of a directory are sorted by name.
+
+    Returns:
+        dict[str, numpy.ndarray]: The memory-mapped arrays keyed by column name.
+
+    Raises:
+        ValueError: If the file format is not supported.
+        ImportError: If an Arrow IPC file is opened without pyarrow installed.
+    """
+	if os.path.isdir(path):
+		if columns is None:
+			columns = sorted(os.path.splitext(name)[0] for name in os.listdir(path) if name.endswith(".npy"))
+		
+		return {column: numpy.load(os.path.join(path, f"{column}.npy"), mmap_mode="r") for column in columns}
+	
+	extension = os.path.splitext(path)[1].lower()
+	
+	if extension == ".npy":
+		array = numpy.load(path, mmap_mode="r")
+		
+		if array.dtype.names is not None:
+			names = array.dtype.names
+			arrays = {name: array[name] for name in names}
+		else:
+			names = [str(column) for column in range(array.shape[1])]
+			arrays = {name: array[:, column] for column, name in enumerate(names)}
+		
+		return {column: arrays[column] for column in (columns if columns is not None else names)}
+	
+	if extension in (".arrow", ".feather", ".ipc"):
+		import pyarrow
+		
+		table = pyarrow.ipc.open_file(pyarrow.memory_map(path, "r")).read_all()
+		arrays = {}
+		
+		for column in (columns if columns is not None else table.column_names):
+			chunked_array = table.column(column)
+			array = chunked_array.chunk(0) if chunked_array.num_chunks == 1 else chunked_array.combine_chunks()
+			arrays[column] = array.to_numpy(zero_copy_only=False)
+		
+		return arrays
+	
+	raise ValueError(f"Unsupported memory-mapped table format: {path}")
+
+
+class MemoryMappedTableModelInit:
+	"""
+    Data class to hold initialization parameters for memory-mapped table models.
+
+    Attributes:
+        path (str): The path of a directory of `.npy` column files, a `.npy` file or an Arrow IPC file.
+        columns (typing.Optional[list[str]]): The columns to display, in order. Defaults to None (every column).
+        format_data (typing.Optional[typing.Callable[[typing.Any], str]]): A callable to format all data in the table. Defaults to None.
+        format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary mapping column indices to callables for formatting specific columns. Defaults to None.
+    """
+	
+	def __init__(
+			self,
+			path: str,
+			columns: typing.Optional[list[str]] = None,
+			format_data: typing.Optional[typing.Callable[[typing.Any], str]] = None,
+			format_data_by_column: typing.Optional[dict[int, typing.Callable[[typing.Any], str]]] = None
+	):
+		"""
+        Initializes a MemoryMappedTableModelInit object.
+
+        Args:
+            path (str): The path of the data.
+            columns (typing.Optional[list[str]]): The columns to display.
+            format_data (typing.Optional[typing.Callable[[typing.Any], str]]): A callable to format all data.
+            format_data_by_column (typing.Optional[dict[int, typing.Callable[[typing.Any], str]]]): A dictionary to format data by column.
+        """
+		self.path = path
+		self.columns = columns
+		self.format_data = format_data
+		self.format_data_by_column = format_data_by_column
+
+
+class PyMemoryMappedTableModel(PyChunkedTableModel):
+	"""
+    A table model backed by read-only memory-mapped columnar files.
+
+    The whole table is exposed as a single zero-copy chunk of memory-mapped arrays, so only the pages of the rows that are painted are read, and every view and process opening the same files shares one copy in the page cache.
+
+    Attributes:
+        path (str): The path of the displayed data.
+        arrays (dict[str, numpy.ndarray]): The memory-mapped arrays keyed by column name.
+
+    :Usage:
+        model = PyMemoryMappedTableModel(MemoryMappedTableModelInit("eod_trades/", columns=["time", "price", "size"]))
+        first_view.setModel(model)
+        second_view.setModel(model)
+    """
+	
+	def __init__(self, memory_mapped_table_model_init: MemoryMappedTableModelInit):
+		"""
+        Initializes a PyMemoryMappedTableModel object.
+
+        Args:
+            memory_mapped_table_model_init (MemoryMappedTableModelInit): Initialization parameters for the model.
+        """
+		self.path = memory_mapped_table_model_init.path
+		self.arrays = open_memory_mapped_columns(self.path, memory_mapped_table_model_init.columns)
+		
+		super().__init__(
+				ChunkedTableModelInit(
+						self.create_chunk_provider(),
+						1,
+						memory_mapped_table_model_init.format_data,
+						memory_mapped_table_model_init.format_data_by_column
+				)
+		)
+	
+	def create_chunk_provider(self) -> NumpyChunkProvider:
+		"""
+        Creates a provider exposing the memory-mapped arrays as a single chunk.
+
+        Returns:
+            NumpyChunkProvider: The chunk provider.
+        """
+		row_count = len(next(iter(self.arrays.values()))) if self.arrays else 0
+		
+		return NumpyChunkProvider(self.arrays, max(1, row_count))
+	
+	def reset_path(self, path: str, columns: typing.Optional[list[str]] = None):
+		"""
+        Resets the model with data from another path.
+
+        Args:
+            path (str): The path of the new data.
+            columns (typing.Optional[list[str]]): The columns to display.
+        """
+		self.path = path
+		self.arrays = open_memory_mapped_columns(path, columns)
+		self.reset_chunk_provider(self.create_chunk_provider())
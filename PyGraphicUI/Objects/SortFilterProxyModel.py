@@ -1,12 +1,102 @@
 import re
+import numpy
 import typing
 import pandas
+import functools
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from PyQt6.QtCore import (
 	QModelIndex,
 	QSortFilterProxyModel,
-	Qt
+	Qt,
+	pyqtSignal
 )
-from PyGraphicUI.Objects.AbstractTableModel import PyAbstractTableModel
+from PyGraphicUI.Objects.TableFilters import SortedColumnIndex, TableFilter
+from PyGraphicUI.Objects.AbstractTableModel import (
+	PyAbstractTableModel,
+	get_sort_permutation
+)
+
+
+def get_filter_mask(
+		values: typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray],
+		formatter: typing.Callable[[typing.Any], str],
+		pattern: re.Pattern,
+		replaces: list[tuple[str, str]]
+) -> numpy.ndarray:
+	"""
+    Evaluates a filter over the formatted values of a column.
+
+    Each distinct value is formatted and tested once, and the results are spread back to the values.
+
+    Args:
+        values (typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]): The raw values of the column.
+        formatter (typing.Callable[[typing.Any], str]): The formatter of the column.
+        pattern (re.Pattern): The filter searched in the formatted values.
+        replaces (list[tuple[str, str]]): Replaces to apply to the formatted values before searching.
+
+    Returns:
+        numpy.ndarray: The boolean mask of the accepted values.
+    """
+	try:
+		codes, unique_values = pandas.factorize(values, use_na_sentinel=False)
+	except TypeError:
+		codes, unique_values = numpy.arange(len(values)), values
+	
+	data_strings = pandas.Series(list(map(formatter, unique_values)), dtype=object)
+	
+	for replace in replaces:
+		data_strings = data_strings.str.replace(replace[0], replace[1], regex=False)
+	
+	return data_strings.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)[codes]
+
+
+def get_filter_masks(
+		filter_tasks: list[tuple[typing.Callable[..., numpy.ndarray], tuple]]
+) -> list[numpy.ndarray]:
+	"""
+    Evaluates several filters. Used as the task of asynchronous filtering.
+
+    The tasks only hold snapshots of the data, so they can be evaluated by a thread or a process pool.
+
+    Args:
+        filter_tasks (list[tuple[typing.Callable[..., numpy.ndarray], tuple]]): The function evaluating every filter and its arguments.
+
+    Returns:
+        list[numpy.ndarray]: The boolean mask of every filter, in the order of the tasks.
+    """
+	return [function(*arguments) for function, arguments in filter_tasks]
+
+
+def is_narrowing_filter(previous_regex: str, regex: str) -> bool:
+	"""
+    Checks if every string matched by a filter is also matched by the previous filter.
+
+    Only literal filters, optionally anchored at the start, are compared; any other pattern is never considered narrowing.
+
+    Args:
+        previous_regex (str): The previous filter.
+        regex (str): The new filter.
+
+    Returns:
+        bool: True if the new filter narrows the previous one.
+
+    :Usage:
+        is_narrowing_filter("AA", "AAP") # True
+        is_narrowing_filter("^AA", "^AAP") # True
+        is_narrowing_filter("AA", "A.") # False
+    """
+	anchored = previous_regex.startswith("^")
+	
+	if anchored:
+		if not regex.startswith("^"):
+			return False
+		
+		previous_regex, regex = previous_regex[1:], regex[1:]
+	
+	if re.search(r"[.^$*+?{}\[\]\\|()]", previous_regex + regex) is not None:
+		return False
+	
+	return regex.startswith(previous_regex) if anchored else previous_regex in regex
 
 
 class SortFilterProxyModelInit:
@@ -16,12 +106,22 @@ class SortFilterProxyModelInit:
     Attributes:
         table_model (PyAbstractTableModel): The table model to be filtered and sorted.
         less_than_key (typing.Optional[typing.Callable[[typing.Any], int]]): A callable to apply to data before comparison for sorting. Defaults to None.
+        native_sort (bool): Whether sorting is delegated to the vectorized sort of the table model over the raw column values instead of comparing display strings with lessThan. Defaults to False.
+        asynchronous (bool): Whether filter masks and native sort permutations are computed in the background on a snapshot of the data. Defaults to False.
+        executor (typing.Optional[Executor]): The executor of the background computations. A ProcessPoolExecutor suits CPU-heavy regular expressions but requires picklable formatters. Defaults to None (a thread pool owned by the proxy and shut down when the proxy is destroyed).
+        max_sort_retries (int): The number of times a background sort outdated by changed data is computed again before the sort is computed on the GUI thread instead. Defaults to 3.
+        max_filter_retries (int): The number of times a background filter computation outdated by a source reset or layout change is computed again before the filters are evaluated on the GUI thread instead. Defaults to 3.
     """
 	
 	def __init__(
 			self,
 			table_model: PyAbstractTableModel,
-			less_than_key: typing.Optional[typing.Callable[[typing.Any], int]] = None
+			less_than_key: typing.Optional[typing.Callable[[typing.Any], int]] = None,
+			native_sort: bool = False,
+			asynchronous: bool = False,
+			executor: typing.Optional[Executor] = None,
+			max_sort_retries: int = 3,
+			max_filter_retries: int = 3
 	):
 		"""
         Initializes a SortFilterProxyModelInit object.
@@ -29,9 +129,19 @@ class SortFilterProxyModelInit:
         Args:
             table_model (PyAbstractTableModel): The table model to use.
             less_than_key (typing.Optional[typing.Callable[[typing.Any], int]]): The key function for sorting.
+            native_sort (bool): Whether sorting is delegated to the table model.
+            asynchronous (bool): Whether filtering and native sorting run in the background.
+            executor (typing.Optional[Executor]): The executor of the background computations.
+            max_sort_retries (int): The number of background sort retries on changed data.
+            max_filter_retries (int): The number of background filter retries on reset data.
         """
 		self.table_model = table_model
 		self.less_than_key = less_than_key
+		self.native_sort = native_sort
+		self.asynchronous = asynchronous
+		self.executor = executor
+		self.max_sort_retries = max_sort_retries
+		self.max_filter_retries = max_filter_retries
 
 
 class PySortFilterProxyModel(QSortFilterProxyModel):
@@ -41,10 +151,45 @@ class PySortFilterProxyModel(QSortFilterProxyModel):
     Attributes:
         table_model (PyAbstractTableModel): The table model to be filtered and sorted.
         less_than_key (typing.Optional[typing.Callable[[typing.Any], int]]): A callable to apply to data before comparison for sorting. Defaults to None.
-        filters (dict[str, str]): Filters to apply to data before comparison for sorting.
-        replaces (dict[str, list[tuple[str, str]]]): Replaces to apply to data before comparison for sorting.
+        native_sort (bool): Whether sorting is delegated to the vectorized sort of the table model.
+        filters (dict[str, re.Pattern]): The compiled filter of every filtered column.
+        replaces (dict[str, list[tuple[str, str]]]): Replaces to apply to the formatted data of a column before filtering.
+        typed_filters (list[TableFilter]): The filters over raw column values.
+        indexed_columns (list[typing.Hashable]): The columns with a sorted index for range filters.
+        column_indexes (dict[typing.Hashable, SortedColumnIndex]): The sorted indexes of the indexed columns.
+        column_indexes_version (int): The data_version of the table model the column indexes were built on.
+        filter_masks (dict[typing.Hashable, numpy.ndarray]): The accepted source rows of every column filter, keyed by column, and of every typed filter, keyed by the filter.
+        filter_mask (typing.Optional[numpy.ndarray]): The accepted source rows of all filters combined, or None if it must be evaluated again.
+        filter_mask_version (int): The data_version of the table model the filter mask was evaluated on.
+        asynchronous (bool): Whether filter masks and native sort permutations are computed in the background.
+        executor (typing.Optional[Executor]): The executor of the background computations.
+        owns_executor (bool): Whether the executor was created by the proxy, which shuts it down when it is destroyed.
+        filter_generation (int): The number of background filter computations requested; only the result of the last one is applied.
+        filter_future (typing.Optional[Future]): The running background filter computation.
+        filter_keys (list[typing.Hashable]): The filtered columns and typed filters of the running filter computation, in the order of its results.
+        source_changes (typing.Optional[list[tuple[str, typing.Any]]]): The source rows changed, inserted, removed and permuted since the running filter computation took its snapshot, in order, or None if the source was reset or its layout changed otherwise.
+        source_changes_version (int): The data_version of the table model after the last recorded source change.
+        max_filter_retries (int): The number of times a background filter computation outdated by a source reset or layout change is computed again before the filters are evaluated on the GUI thread.
+        filter_retries (int): The number of times the running filter computation was computed again.
+        sort_generation (int): The number of background sort computations requested; only the result of the last one is applied.
+        sort_future (typing.Optional[Future]): The running background sort computation.
+        sort_request (typing.Optional[tuple[list[int], list[Qt.SortOrder]]]): The columns and orders of the running sort computation.
+        max_sort_retries (int): The number of times a background sort outdated by changed data is computed again before it is computed on the GUI thread.
+        sort_retries (int): The number of times the running sort computation was computed again.
+        busy (bool): Whether a background computation is running.
+
+    :Usage:
+        proxy_model = PySortFilterProxyModel(SortFilterProxyModelInit(table_model, native_sort=True, asynchronous=True))
+        proxy_model.busyChanged.connect(progress_indicator.setVisible)
+        proxy_model.setFilterByColumn("AAPL", [], "symbol")
+        proxy_model.create_column_index("price")
+        proxy_model.add_typed_filter(RangeFilter("price", 100, 200) & NullFilter("expiry", is_null=False))
     """
 	
+	busyChanged = pyqtSignal(bool)
+	computationFinished = pyqtSignal(str, int, int, object)
+	computationFailed = pyqtSignal(str, object)
+	
 	def __init__(self, sort_filter_proxy_model_init: SortFilterProxyModelInit):
 		"""
         Initializes a PySortFilterProxyModel object.
@@ -56,14 +201,222 @@ class PySortFilterProxyModel(QSortFilterProxyModel):
 		
 		self.table_model = sort_filter_proxy_model_init.table_model
 		self.less_than_key = sort_filter_proxy_model_init.less_than_key
-		self.filters: dict[str, str] = {}
+		self.native_sort = sort_filter_proxy_model_init.native_sort
+		self.filters: dict[str, re.Pattern] = {}
 		self.replaces: dict[str, list[tuple[str, str]]] = {}
+		self.typed_filters: list[TableFilter] = []
+		self.indexed_columns: list[typing.Hashable] = []
+		self.column_indexes: dict[typing.Hashable, SortedColumnIndex] = {}
+		self.column_indexes_version = -1
+		self.filter_masks: dict[typing.Hashable, numpy.ndarray] = {}
+		self.filter_mask: typing.Optional[numpy.ndarray] = None
+		self.filter_mask_version = -1
+		self.asynchronous = sort_filter_proxy_model_init.asynchronous
+		self.owns_executor = sort_filter_proxy_model_init.executor is None and self.asynchronous
+		self.executor = (
+				ThreadPoolExecutor(max_workers=2)
+				if self.owns_executor
+				else sort_filter_proxy_model_init.executor
+		)
+		self.filter_generation = 0
+		self.filter_future: typing.Optional[Future] = None
+		self.filter_keys: list[typing.Hashable] = []
+		self.source_changes: typing.Optional[list[tuple[str, typing.Any]]] = None
+		self.source_changes_version = -1
+		self.max_filter_retries = sort_filter_proxy_model_init.max_filter_retries
+		self.filter_retries = 0
+		self.sort_generation = 0
+		self.sort_future: typing.Optional[Future] = None
+		self.sort_request: typing.Optional[tuple[list[int], list[Qt.SortOrder]]] = None
+		self.max_sort_retries = sort_filter_proxy_model_init.max_sort_retries
+		self.sort_retries = 0
+		self.busy = False
+		
+		if self.owns_executor:
+			self.destroyed.connect(functools.partial(self.executor.shutdown, wait=False, cancel_futures=True))
+		
+		self.computationFinished.connect(self.apply_computation, Qt.ConnectionType.QueuedConnection)
+		self.table_model.dataChanged.connect(self.source_data_changed)
+		self.table_model.rowsInserted.connect(self.source_rows_inserted)
+		self.table_model.rowsRemoved.connect(self.source_rows_removed)
+		self.table_model.rowsPermuted.connect(self.source_rows_permuted)
+		self.table_model.layoutChanged.connect(self.source_layout_changed)
+		self.table_model.modelReset.connect(self.source_layout_changed)
+		
 		self.setSourceModel(self.table_model)
 	
+	def add_typed_filter(self, table_filter: TableFilter):
+		"""
+        Adds a filter over raw column values. Only this filter is evaluated.
+
+        Args:
+            table_filter (TableFilter): The filter to add.
+        """
+		self.typed_filters.append(table_filter)
+		
+		if self.asynchronous:
+			self.request_filter_masks()
+			return
+		
+		if self.filter_mask is not None and self.filter_mask_version == self.table_model.data_version:
+			self.filter_masks[table_filter] = self.evaluate_filter(table_filter)
+			self.combine_filter_masks()
+		else:
+			self.filter_mask = None
+		
+		self.invalidate()
+	
+	def append_rows(self, data: pandas.DataFrame):
+		"""
+        Appends rows to the underlying table model.
+
+        Args:
+            data (pandas.DataFrame): The rows to append.
+        """
+		self.table_model.append_rows(data)
+	
+	def apply_computation(self, kind: str, generation: int, data_version: int, future: Future):
+		"""
+        Swaps in the result of a background computation on the GUI thread.
+
+        Results of superseded or cancelled computations are dropped. A filter result computed on data that was changed meanwhile is patched with the rows changed, inserted, removed and permuted since its snapshot. If the source was reset or its layout changed otherwise, the filters are computed again up to max_filter_retries times, then evaluated on the GUI thread. A sort result computed on changed data is computed again up to max_sort_retries times, then the sort is computed on the GUI thread so that it is applied even while the data keeps changing.
+
+        A computation that raised is reported through computationFailed with its kind and exception. A failed filter computation accepts every row until the filters or the data change.
+
+        Args:
+            kind (str): "filter" or "sort".
+            generation (int): The generation of the computation.
+            data_version (int): The data_version of the table model when the snapshot was taken.
+            future (Future): The finished computation.
+        """
+		if kind == "filter":
+			if generation != self.filter_generation:
+				return
+			
+			self.filter_future = None
+			
+			try:
+				filter_masks = future.result()
+			except Exception as exception:
+				self.source_changes = None
+				self.filter_masks = {}
+				self.combine_filter_masks()
+				self.invalidate()
+				self.update_busy()
+				self.computationFailed.emit(kind, exception)
+				return
+			
+			if self.source_changes is not None and self.patch_filter_masks(dict(zip(self.filter_keys, filter_masks))):
+				self.source_changes = None
+				self.invalidate()
+			elif self.filter_retries < self.max_filter_retries:
+				filter_retries = self.filter_retries + 1
+				self.request_filter_masks()
+				self.filter_retries = filter_retries
+			else:
+				self.source_changes = None
+				self.evaluate_filter_mask()
+				self.invalidate()
+		else:
+			if generation != self.sort_generation:
+				return
+			
+			self.sort_future = None
+			
+			try:
+				permutation = future.result()
+			except Exception as exception:
+				self.update_busy()
+				self.computationFailed.emit(kind, exception)
+				return
+			
+			if data_version == self.table_model.data_version:
+				self.table_model.apply_sort_permutation(permutation)
+				super().sort(-1)
+			elif self.sort_retries < self.max_sort_retries:
+				sort_retries = self.sort_retries + 1
+				self.request_sort(*self.sort_request)
+				self.sort_retries = sort_retries
+			else:
+				self.table_model.sort_by_columns(*self.sort_request)
+				super().sort(-1)
+		
+		self.update_busy()
+	
+	def combine_filter_masks(self):
+		"""Combines the column filter masks into filter_mask."""
+		self.filter_mask = numpy.ones(self.table_model.table_data.shape[0], dtype=bool)
+		self.filter_mask_version = self.table_model.data_version
+		
+		for filter_mask in self.filter_masks.values():
+			self.filter_mask &= filter_mask
+	
+	def create_column_index(self, column: typing.Hashable):
+		"""
+        Declares a sorted index for a numeric or datetime column, so that range filters over it use binary search. The index is built when first needed and rebuilt after the data changes.
+
+        Args:
+            column (typing.Hashable): The label of the column.
+        """
+		if column not in self.indexed_columns:
+			self.indexed_columns.append(column)
+			self.column_indexes_version = -1
+	
+	def evaluate_changed_rows(self, rows: numpy.ndarray):
+		"""
+        Re-evaluates the filters over changed source rows and updates the masks in place.
+
+        Args:
+            rows (numpy.ndarray): The positions of the changed rows in the source model.
+        """
+		for column, filter_mask in self.evaluate_filter_rows(rows).items():
+			self.filter_masks[column][rows] = filter_mask
+		
+		self.filter_mask[rows] = numpy.logical_and.reduce(
+				[self.filter_masks[column][rows] for column in self.filter_masks],
+				initial=True
+		)
+		self.filter_mask_version = self.table_model.data_version
+	
+	def evaluate_filter(self, key: typing.Hashable, rows: typing.Optional[numpy.ndarray] = None) -> numpy.ndarray:
+		"""
+        Evaluates a column filter or a typed filter over source rows.
+
+        Args:
+            key (typing.Hashable): The filtered column, or the typed filter.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		if isinstance(key, TableFilter):
+			return key.get_mask(self.table_model.table_data, rows, self.get_column_indexes() if rows is None else None)
+		
+		return self.get_column_filter_mask(key, rows)
+	
+	def evaluate_filter_mask(self):
+		"""Evaluates every filter over the whole source model at once and combines the results into filter_mask."""
+		self.filter_masks = {key: self.evaluate_filter(key) for key in [*self.filters, *self.typed_filters]}
+		self.combine_filter_masks()
+	
+	def evaluate_filter_rows(self, rows: numpy.ndarray) -> dict[typing.Hashable, numpy.ndarray]:
+		"""
+        Evaluates every filter over some source rows.
+
+        Args:
+            rows (numpy.ndarray): The positions of the rows in the source model.
+
+        Returns:
+            dict[typing.Hashable, numpy.ndarray]: The accepted rows among the given ones for every filter.
+        """
+		return {key: self.evaluate_filter(key, rows) for key in self.filter_masks}
+	
 	def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
 		"""
         Checks if a row should be accepted by the filter.
 
+        The filters are evaluated vectorized for all rows at once whenever the source data changes, so this is a lookup in filter_mask. In asynchronous mode rows are accepted until the first masks are computed.
+
         Args:
             source_row (int): The row index in the source model.
             source_parent (QModelIndex): The parent index.
@@ -71,23 +424,62 @@ class PySortFilterProxyModel(QSortFilterProxyModel):
         Returns:
             bool: True if the row is accepted, False otherwise.
         """
-		for key, regex in self.filters.items():
-			ix = self.sourceModel().index(
-					source_row,
-					self.table_model.table_data.columns.get_loc(key),
-					source_parent
-			)
+		if not self.filters and not self.typed_filters:
+			return True
 		
-			if ix.isValid():
-				data_string = str(self.sourceModel().data(ix, Qt.ItemDataRole.DisplayRole))
+		if self.filter_mask is None or self.filter_mask_version != self.table_model.data_version:
+			if not self.asynchronous:
+				self.evaluate_filter_mask()
+			elif self.filter_future is None:
+				self.request_filter_masks()
+			
+			if self.filter_mask is None:
+				return True
 		
-				for replace in self.replaces.get(key, []):
-					data_string = data_string.replace(replace[0], replace[1])
+		return source_row < self.filter_mask.size and bool(self.filter_mask[source_row])
+	
+	def get_column_filter_mask(self, column: str, rows: typing.Optional[numpy.ndarray] = None) -> numpy.ndarray:
+		"""
+        Evaluates the filter of a column over the formatted data of source rows.
+
+        Args:
+            column (str): The filtered column.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		position = self.table_model.table_data.columns.get_loc(column)
+		values = self.table_model.column_values[position]
 		
-				if re.search(regex, data_string) is None:
-					return False
+		if rows is not None:
+			values = values[rows]
 		
-		return True
+		return get_filter_mask(
+				values,
+				self.table_model.get_column_formatter(position),
+				self.filters[column],
+				self.replaces.get(column, [])
+		)
+	
+	def get_column_indexes(self) -> dict[typing.Hashable, SortedColumnIndex]:
+		"""
+        Returns the sorted indexes of the indexed columns, building them again if the data changed.
+
+        Returns:
+            dict[typing.Hashable, SortedColumnIndex]: The sorted index of every indexed numeric or datetime column.
+        """
+		if self.column_indexes_version != self.table_model.data_version:
+			self.column_indexes = {}
+			self.column_indexes_version = self.table_model.data_version
+			
+			for column in self.indexed_columns:
+				values = self.table_model.table_data[column].to_numpy()
+				
+				if values.dtype.kind in "biufmM":
+					self.column_indexes[column] = SortedColumnIndex(values)
+		
+		return self.column_indexes
 	
 	def headerData(
 			self,
@@ -128,6 +520,168 @@ class PySortFilterProxyModel(QSortFilterProxyModel):
 		
 		return left_data > right_data
 	
+	def patch_filter_masks(self, filter_masks: dict[typing.Hashable, numpy.ndarray]) -> bool:
+		"""
+        Replays the recorded source changes onto masks computed on an older snapshot, then evaluates the filters over the inserted and changed rows only.
+
+        Args:
+            filter_masks (dict[typing.Hashable, numpy.ndarray]): The masks of the background filter computation, keyed like filter_masks.
+
+        Returns:
+            bool: True if the masks were patched and swapped in, False if they do not match the source rows.
+        """
+		if not filter_masks:
+			self.filter_masks = {}
+			self.combine_filter_masks()
+			return True
+		
+		dirty_mask = numpy.zeros(next(iter(filter_masks.values())).size, dtype=bool)
+		
+		for change, argument in self.source_changes:
+			if change == "changed":
+				dirty_mask[argument] = True
+			elif change == "inserted":
+				first, last = argument
+				filter_masks = {
+					key: numpy.insert(filter_mask, first, numpy.zeros(last - first + 1, dtype=bool))
+					for key, filter_mask in filter_masks.items()
+				}
+				dirty_mask = numpy.insert(dirty_mask, first, numpy.ones(last - first + 1, dtype=bool))
+			elif change == "removed":
+				first, last = argument
+				filter_masks = {
+					key: numpy.delete(filter_mask, slice(first, last + 1))
+					for key, filter_mask in filter_masks.items()
+				}
+				dirty_mask = numpy.delete(dirty_mask, slice(first, last + 1))
+			else:
+				filter_masks = {key: filter_mask[argument] for key, filter_mask in filter_masks.items()}
+				dirty_mask = dirty_mask[argument]
+		
+		if dirty_mask.size != self.table_model.row_count:
+			return False
+		
+		self.filter_masks = filter_masks
+		self.combine_filter_masks()
+		
+		dirty_rows = numpy.flatnonzero(dirty_mask)
+		
+		if dirty_rows.size:
+			self.evaluate_changed_rows(dirty_rows)
+		
+		return True
+	
+	def record_source_change(self, change: str, argument: typing.Any):
+		"""
+        Records a source change while a background filter computation runs, so that its result can be patched when it lands.
+
+        Args:
+            change (str): "changed", "inserted", "removed" or "permuted".
+            argument (typing.Any): The changed rows, the (first, last) inserted or removed rows, or the permutation.
+        """
+		if self.filter_future is not None and self.source_changes is not None:
+			self.source_changes.append((change, argument))
+			self.source_changes_version = self.table_model.data_version
+	
+	def remove_rows(self, rows: typing.Iterable[int]):
+		"""
+        Removes rows from the underlying table model.
+
+        Args:
+            rows (typing.Iterable[int]): The positions of the rows in the source model.
+        """
+		self.table_model.remove_rows(rows)
+	
+	def request_filter_masks(self):
+		"""
+        Starts the background evaluation of every filter on a snapshot of the filtered columns, superseding the running one.
+
+        Typed filters reading live state, such as a search index, are evaluated into their snapshot on the GUI thread, so the background tasks never touch the table model or its indexes.
+        """
+		if self.filter_future is not None:
+			self.filter_future.cancel()
+		
+		filter_tasks = {}
+		column_indexes = (
+				self.column_indexes
+				if self.column_indexes_version == self.table_model.data_version
+				else None
+		)
+		
+		for column in self.filters:
+			position = self.table_model.table_data.columns.get_loc(column)
+			
+			filter_tasks[column] = (
+					get_filter_mask,
+					(
+							self.table_model.column_values[position].copy(),
+							self.table_model.get_column_formatter(position),
+							self.filters[column],
+							self.replaces.get(column, [])
+					)
+			)
+		
+		for table_filter in self.typed_filters:
+			snapshot = table_filter.get_snapshot(self.table_model.table_data)
+			filter_tasks[table_filter] = (
+					snapshot.get_mask,
+					(self.table_model.table_data.loc[:, snapshot.get_columns()].copy(), None, column_indexes)
+			)
+		
+		self.filter_generation += 1
+		self.filter_retries = 0
+		self.source_changes = []
+		self.source_changes_version = self.table_model.data_version
+		self.filter_keys = list(filter_tasks)
+		self.filter_future = self.executor.submit(get_filter_masks, list(filter_tasks.values()))
+		self.watch_future("filter", self.filter_generation, self.filter_future)
+	
+	def request_sort(self, columns: list[int], orders: list[Qt.SortOrder]):
+		"""
+        Starts the background computation of a sort permutation on a snapshot of the sort columns, superseding the running one.
+
+        Args:
+            columns (list[int]): The columns to sort by.
+            orders (list[Qt.SortOrder]): The sort order of every column.
+        """
+		if self.sort_future is not None:
+			self.sort_future.cancel()
+		
+		self.sort_generation += 1
+		self.sort_request = (columns, orders)
+		self.sort_retries = 0
+		self.sort_future = self.executor.submit(
+				get_sort_permutation,
+				self.table_model.table_data.iloc[:, columns].copy(),
+				list(range(len(columns))),
+				orders
+		)
+		self.watch_future("sort", self.sort_generation, self.sort_future)
+	
+	def remove_typed_filter(self, table_filter: TableFilter):
+		"""
+        Removes a filter over raw column values.
+
+        Args:
+            table_filter (TableFilter): The filter to remove.
+        """
+		self.typed_filters.remove(table_filter)
+		self.filter_masks.pop(table_filter, None)
+		
+		if self.filter_future is not None:
+			self.request_filter_masks()
+		elif self.filter_mask is not None and self.filter_mask_version == self.table_model.data_version:
+			self.combine_filter_masks()
+		else:
+			self.filter_mask = None
+		
+		self.invalidate()
+	
+	def reset_filter_masks(self):
+		"""Drops the filter masks, so that they are evaluated again over the whole source model when needed."""
+		self.filter_masks = {}
+		self.filter_mask = None
+	
 	def reset_table_data(self, data: pandas.DataFrame):
 		"""
         Resets the table data in the underlying table model.
@@ -141,11 +695,223 @@ class PySortFilterProxyModel(QSortFilterProxyModel):
 		"""
         Sets a filter for a specific column.
 
+        Only the filter of this column is evaluated again. If the new filter narrows the previous one, for example when a character is typed into a literal filter, only the rows accepted by the previous filter are tested. Otherwise, in asynchronous mode, the filters are evaluated in the background and the current rows stay visible until the result is swapped in.
+
         Args:
             regex (str): The regular expression to filter by.
             replaces_in_data (list[tuple[str, str]]): Replacements to perfrom before filtering.
             column (str): The column to filter.
         """
-		self.filters[column] = regex
+		masks_valid = self.filter_mask is not None and self.filter_mask_version == self.table_model.data_version
+		narrowing = (
+				masks_valid
+				and self.filter_future is None
+				and column in self.filter_masks
+				and self.replaces.get(column) == replaces_in_data
+				and is_narrowing_filter(self.filters[column].pattern, regex)
+		)
+		
+		self.filters[column] = re.compile(regex)
 		self.replaces[column] = replaces_in_data
-		self.invalidateFilter()
+		
+		if self.asynchronous and not narrowing:
+			self.request_filter_masks()
+			return
+		
+		if narrowing:
+			accepted_rows = numpy.flatnonzero(self.filter_masks[column])
+			self.filter_masks[column] = numpy.zeros_like(self.filter_masks[column])
+			self.filter_masks[column][accepted_rows] = self.get_column_filter_mask(column, accepted_rows)
+			self.combine_filter_masks()
+		elif masks_valid:
+			self.filter_masks[column] = self.get_column_filter_mask(column)
+			self.combine_filter_masks()
+		else:
+			self.filter_mask = None
+		
+		self.invalidate()
+	
+	def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+		"""
+        Sorts the proxy by a column.
+
+        With native_sort the table model reorders its rows by the raw column values through sort_by_columns, whether or not its sort_enabled is set, and the proxy keeps the source order, so no lessThan call is made. In asynchronous mode the permutation is computed in the background.
+
+        Args:
+            column (int): The column to sort by.
+            order (Qt.SortOrder): The sort order. Defaults to Qt.SortOrder.AscendingOrder.
+        """
+		if self.native_sort and self.asynchronous:
+			if 0 <= column < self.table_model.columnCount():
+				self.request_sort([column], [order])
+		elif self.native_sort:
+			if 0 <= column < self.table_model.columnCount():
+				self.table_model.sort_by_columns([column], [order])
+			
+			super().sort(-1, order)
+		else:
+			super().sort(column, order)
+	
+	def sort_by_columns(
+			self,
+			columns: typing.Sequence[int],
+			orders: typing.Optional[typing.Sequence[Qt.SortOrder]] = None
+	):
+		"""
+        Sorts the underlying table model by several columns with a stable vectorized sort, and keeps the source order in the proxy.
+
+        Args:
+            columns (typing.Sequence[int]): The columns to sort by, from the primary to the last tie-breaker.
+            orders (typing.Optional[typing.Sequence[Qt.SortOrder]]): The sort order of every column.
+        """
+		if self.asynchronous:
+			self.request_sort(
+					list(columns),
+					list(orders) if orders is not None else [Qt.SortOrder.AscendingOrder] * len(columns)
+			)
+		else:
+			self.table_model.sort_by_columns(columns, orders)
+			super().sort(-1)
+	
+	def source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: typing.Iterable[int] = ()):
+		"""
+        Re-evaluates the filters over the changed source rows only.
+
+        Args:
+            top_left (QModelIndex): The top left changed index.
+            bottom_right (QModelIndex): The bottom right changed index.
+            roles (typing.Iterable[int]): The changed roles.
+        """
+		rows = numpy.arange(top_left.row(), bottom_right.row() + 1)
+		self.record_source_change("changed", rows)
+		
+		if self.filter_mask is not None:
+			self.evaluate_changed_rows(rows)
+	
+	def source_layout_changed(self, parents: typing.Iterable[QModelIndex] = (), hint: int = 0):
+		"""
+        Drops the filter masks when the source rows were reordered or reset without being permuted by a sort. A running filter computation can then no longer be patched.
+
+        Args:
+            parents (typing.Iterable[QModelIndex]): The parents of the changed layout.
+            hint (int): The layout change hint.
+        """
+		if self.filter_mask is not None and self.filter_mask_version != self.table_model.data_version:
+			self.reset_filter_masks()
+		
+		if self.source_changes_version != self.table_model.data_version:
+			self.source_changes = None
+	
+	def source_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+		"""
+        Evaluates the filters over the inserted source rows only and inserts the results into the masks.
+
+        Args:
+            parent (QModelIndex): The parent index.
+            first (int): The first inserted row.
+            last (int): The last inserted row.
+        """
+		self.record_source_change("inserted", (first, last))
+		
+		if self.filter_mask is None:
+			return
+		
+		rows = numpy.arange(first, last + 1)
+		filter_mask = numpy.ones(rows.size, dtype=bool)
+		
+		for column, column_filter_mask in self.evaluate_filter_rows(rows).items():
+			self.filter_masks[column] = numpy.insert(self.filter_masks[column], first, column_filter_mask)
+			filter_mask &= column_filter_mask
+		
+		self.filter_mask = numpy.insert(self.filter_mask, first, filter_mask)
+		self.filter_mask_version = self.table_model.data_version
+	
+	def source_rows_permuted(self, permutation: numpy.ndarray):
+		"""
+        Reorders the filter masks along with the source rows.
+
+        Args:
+            permutation (numpy.ndarray): The previous position of every source row, in the new order.
+        """
+		self.record_source_change("permuted", permutation)
+		
+		if self.filter_mask is None or self.filter_mask_version != self.table_model.data_version - 1:
+			return
+		
+		self.filter_masks = {column: filter_mask[permutation] for column, filter_mask in self.filter_masks.items()}
+		self.filter_mask = self.filter_mask[permutation]
+		self.filter_mask_version = self.table_model.data_version
+	
+	def source_rows_removed(self, parent: QModelIndex, first: int, last: int):
+		"""
+        Removes the rows from the filter masks without evaluating the filters.
+
+        Args:
+            parent (QModelIndex): The parent index.
+            first (int): The first removed row.
+            last (int): The last removed row.
+        """
+		self.record_source_change("removed", (first, last))
+		
+		if self.filter_mask is None:
+			return
+		
+		for column in self.filter_masks:
+			self.filter_masks[column] = numpy.delete(self.filter_masks[column], slice(first, last + 1))
+		
+		self.filter_mask = numpy.delete(self.filter_mask, slice(first, last + 1))
+		self.filter_mask_version = self.table_model.data_version
+	
+	def update_cells(
+			self,
+			rows: typing.Sequence[int],
+			columns: typing.Sequence[int],
+			values: typing.Sequence[typing.Any]
+	):
+		"""
+        Updates single cells of the underlying table model.
+
+        Args:
+            rows (typing.Sequence[int]): The row of every changed cell in the source model.
+            columns (typing.Sequence[int]): The column of every changed cell.
+            values (typing.Sequence[typing.Any]): The new value of every changed cell.
+        """
+		self.table_model.update_cells(rows, columns, values)
+	
+	def update_rows(self, rows: typing.Sequence[int], data: pandas.DataFrame):
+		"""
+        Updates whole rows of the underlying table model.
+
+        Args:
+            rows (typing.Sequence[int]): The positions of the changed rows in the source model.
+            data (pandas.DataFrame): The new values of the rows.
+        """
+		self.table_model.update_rows(rows, data)
+	
+	def update_busy(self):
+		"""Emits busyChanged when background computations start or all of them finish."""
+		busy = self.filter_future is not None or self.sort_future is not None
+		
+		if busy != self.busy:
+			self.busy = busy
+			self.busyChanged.emit(busy)
+	
+	def watch_future(self, kind: str, generation: int, future: Future):
+		"""
+        Routes the result of a background computation to the GUI thread. Results finishing after the proxy was destroyed are dropped.
+
+        Args:
+            kind (str): "filter" or "sort".
+            generation (int): The generation of the computation.
+            future (Future): The running computation.
+        """
+		data_version = self.table_model.data_version
+		
+		def emit_computation_finished(done_future: Future):
+			try:
+				self.computationFinished.emit(kind, generation, data_version, done_future)
+			except RuntimeError:
+				pass
+		
+		future.add_done_callback(emit_computation_finished)
+		self.update_busy()
@@ -0,0 +1,610 @@
+import abc
+import numpy
+import typing
+import pandas
+
+
+class SortedColumnIndex:
+	"""
+    A sorted copy of a numeric or datetime column, used to evaluate range filters with binary search.
+
+    Missing values are kept at the end of the sorted values. If the column is already sorted and has no missing values, it is used as is and no copy is made.
+
+    Attributes:
+        sorted_values (numpy.ndarray): The values of the column in ascending order.
+        order (typing.Optional[numpy.ndarray]): The row of every sorted value, or None if the column is already sorted.
+        valid_count (int): The number of values that are not missing.
+
+    :Usage:
+        price_index = SortedColumnIndex(table_data["price"].to_numpy())
+        mask = price_index.get_range_mask(100, 200)
+    """
+	
+	def __init__(self, values: numpy.ndarray):
+		"""
+        Initializes a SortedColumnIndex object.
+
+        Args:
+            values (numpy.ndarray): The values of the column.
+
+        Raises:
+            ValueError: If the values are not numeric or datetime values.
+        """
+		if values.dtype.kind not in "biufmM":
+			raise ValueError(f"Cannot index values of dtype {values.dtype}")
+		
+		self.valid_count = int(values.size - pandas.isna(values).sum())
+		
+		if self.valid_count == values.size and (values.size < 2 or bool(numpy.all(values[1:] >= values[:-1]))):
+			self.sorted_values = values
+			self.order = None
+		else:
+			self.order = numpy.argsort(values, kind="stable")
+			self.sorted_values = values[self.order]
+	
+	def get_range_mask(
+			self,
+			minimum: typing.Any = None,
+			maximum: typing.Any = None,
+			include_minimum: bool = True,
+			include_maximum: bool = True
+	) -> numpy.ndarray:
+		"""
+        Finds the rows with values in a range with two binary searches.
+
+        Args:
+            minimum (typing.Any): The lower bound. Defaults to None (unbounded).
+            maximum (typing.Any): The upper bound. Defaults to None (unbounded).
+            include_minimum (bool): Whether the lower bound is included. Defaults to True.
+            include_maximum (bool): Whether the upper bound is included. Defaults to True.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the rows in the range. Missing values are never in the range.
+        """
+		first = 0 if minimum is None else int(
+				numpy.searchsorted(
+						self.sorted_values[:self.valid_count],
+						self.get_bound(minimum),
+						side="left" if include_minimum else "right"
+				)
+		)
+		stop = self.valid_count if maximum is None else int(
+				numpy.searchsorted(
+						self.sorted_values[:self.valid_count],
+						self.get_bound(maximum),
+						side="right" if include_maximum else "left"
+				)
+		)
+		
+		mask = numpy.zeros(self.sorted_values.size, dtype=bool)
+		
+		if self.order is None:
+			mask[first:stop] = True
+		else:
+			mask[self.order[first:stop]] = True
+		
+		return mask
+	
+	def get_bound(self, bound: typing.Any) -> typing.Any:
+		"""
+        Converts a range bound to the type of the indexed values.
+
+        Args:
+            bound (typing.Any): The bound, such as a number, a string, a datetime or a pandas.Timestamp.
+
+        Returns:
+            typing.Any: The bound comparable with the sorted values.
+        """
+		if self.sorted_values.dtype.kind == "M":
+			return pandas.Timestamp(bound).to_datetime64().astype(self.sorted_values.dtype)
+		
+		if self.sorted_values.dtype.kind == "m":
+			return pandas.Timedelta(bound).to_timedelta64().astype(self.sorted_values.dtype)
+		
+		return bound
+
+
+class TableFilter(abc.ABC):
+	"""
+    Base class for filters evaluated vectorized over the raw values of table columns.
+
+    Filters can be combined with the & and | operators.
+    """
+	
+	def __and__(self, other: "TableFilter") -> "AndFilter":
+		"""
+        Combines two filters into one accepting the rows accepted by both.
+
+        Args:
+            other (TableFilter): The other filter.
+
+        Returns:
+            AndFilter: The combined filter.
+        """
+		return AndFilter(self, other)
+	
+	def __or__(self, other: "TableFilter") -> "OrFilter":
+		"""
+        Combines two filters into one accepting the rows accepted by either.
+
+        Args:
+            other (TableFilter): The other filter.
+
+        Returns:
+            OrFilter: The combined filter.
+        """
+		return OrFilter(self, other)
+	
+	@abc.abstractmethod
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns the columns the filter reads.
+
+        Returns:
+            list[typing.Hashable]: The column labels.
+        """
+	
+	@abc.abstractmethod
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Evaluates the filter.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Sorted indexes of columns of data, used when every row is tested.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+	
+	def get_snapshot(self, data: pandas.DataFrame) -> "TableFilter":
+		"""
+        Returns a filter that can be evaluated in the background over a copy of the data.
+
+        Filters reading only the data they are given return themselves. Filters reading live state, such as a search index, evaluate it on the calling thread and return a MaskFilter.
+
+        Args:
+            data (pandas.DataFrame): The current table data.
+
+        Returns:
+            TableFilter: The filter to evaluate in the background.
+        """
+		return self
+
+
+class MaskFilter(TableFilter):
+	"""
+    Accepts the rows of a precomputed mask. Used as the background snapshot of filters reading live state.
+
+    Attributes:
+        mask (numpy.ndarray): The boolean mask of the accepted rows.
+
+    :Usage:
+        MaskFilter(table_data["symbol"].isin(watchlist).to_numpy())
+    """
+	
+	def __init__(self, mask: numpy.ndarray):
+		"""
+        Initializes a MaskFilter object.
+
+        Args:
+            mask (numpy.ndarray): The boolean mask of the accepted rows.
+        """
+		self.mask = mask
+	
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns no columns, as the mask is precomputed.
+
+        Returns:
+            list[typing.Hashable]: An empty list.
+        """
+		return []
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Returns the precomputed mask.
+
+        Args:
+            data (pandas.DataFrame): The table data. Unused.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Unused.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		return self.mask if rows is None else self.mask[rows]
+
+
+class ColumnFilter(TableFilter):
+	"""
+    Base class for filters over the values of a single column.
+
+    Attributes:
+        column (typing.Hashable): The label of the filtered column.
+    """
+	
+	def __init__(self, column: typing.Hashable):
+		"""
+        Initializes a ColumnFilter object.
+
+        Args:
+            column (typing.Hashable): The label of the filtered column.
+        """
+		self.column = column
+	
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns the filtered column.
+
+        Returns:
+            list[typing.Hashable]: The label of the filtered column.
+        """
+		return [self.column]
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Evaluates the filter over the column.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Sorted indexes of columns of data.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		values = data[self.column]
+		
+		return self.get_values_mask(values if rows is None else values.iloc[rows])
+	
+	@abc.abstractmethod
+	def get_values_mask(self, values: pandas.Series) -> numpy.ndarray:
+		"""
+        Evaluates the filter over column values.
+
+        Args:
+            values (pandas.Series): The values to test.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted values.
+        """
+
+
+class RangeFilter(ColumnFilter):
+	"""
+    Accepts the rows with a column value inside a range. Missing values are rejected.
+
+    If the column has a SortedColumnIndex, the range is found with binary search instead of comparing every value.
+
+    Attributes:
+        column (typing.Hashable): The label of the filtered column.
+        minimum (typing.Any): The lower bound. Defaults to None (unbounded).
+        maximum (typing.Any): The upper bound. Defaults to None (unbounded).
+        include_minimum (bool): Whether the lower bound is included. Defaults to True.
+        include_maximum (bool): Whether the upper bound is included. Defaults to True.
+
+    :Usage:
+        expensive = RangeFilter("price", minimum=100, include_minimum=False)
+    """
+	
+	def __init__(
+			self,
+			column: typing.Hashable,
+			minimum: typing.Any = None,
+			maximum: typing.Any = None,
+			include_minimum: bool = True,
+			include_maximum: bool = True
+	):
+		"""
+        Initializes a RangeFilter object.
+
+        Args:
+            column (typing.Hashable): The label of the filtered column.
+            minimum (typing.Any): The lower bound.
+            maximum (typing.Any): The upper bound.
+            include_minimum (bool): Whether the lower bound is included.
+            include_maximum (bool): Whether the upper bound is included.
+        """
+		super().__init__(column)
+		
+		self.minimum = minimum
+		self.maximum = maximum
+		self.include_minimum = include_minimum
+		self.include_maximum = include_maximum
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Evaluates the filter over the column, with binary search if the column is indexed and every row is tested.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Sorted indexes of columns of data.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		if rows is None and column_indexes is not None and self.column in column_indexes:
+			return column_indexes[self.column].get_range_mask(
+					self.minimum,
+					self.maximum,
+					self.include_minimum,
+					self.include_maximum
+			)
+		
+		return super().get_mask(data, rows, column_indexes)
+	
+	def get_values_mask(self, values: pandas.Series) -> numpy.ndarray:
+		"""
+        Compares the values with the bounds.
+
+        Args:
+            values (pandas.Series): The values to test.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the values inside the range.
+        """
+		mask = values.notna().to_numpy(dtype=bool)
+		
+		if self.minimum is not None:
+			mask &= (values >= self.minimum if self.include_minimum else values > self.minimum).to_numpy(dtype=bool, na_value=False)
+		
+		if self.maximum is not None:
+			mask &= (values <= self.maximum if self.include_maximum else values < self.maximum).to_numpy(dtype=bool, na_value=False)
+		
+		return mask
+
+
+class DateRangeFilter(RangeFilter):
+	"""
+    Accepts the rows with a datetime column value inside a range, by default from start included to end excluded.
+
+    Attributes:
+        column (typing.Hashable): The label of the filtered column.
+        minimum (typing.Optional[pandas.Timestamp]): The start of the range.
+        maximum (typing.Optional[pandas.Timestamp]): The end of the range.
+        include_minimum (bool): Whether the start is included.
+        include_maximum (bool): Whether the end is included.
+
+    :Usage:
+        january = DateRangeFilter("time", "2024-01-01", "2024-02-01")
+    """
+	
+	def __init__(
+			self,
+			column: typing.Hashable,
+			start: typing.Any = None,
+			end: typing.Any = None,
+			include_end: bool = False
+	):
+		"""
+        Initializes a DateRangeFilter object.
+
+        Args:
+            column (typing.Hashable): The label of the filtered column.
+            start (typing.Any): The start of the range, as anything pandas.Timestamp accepts. Defaults to None (unbounded).
+            end (typing.Any): The end of the range, as anything pandas.Timestamp accepts. Defaults to None (unbounded).
+            include_end (bool): Whether the end is included. Defaults to False.
+        """
+		super().__init__(
+				column,
+				pandas.Timestamp(start) if start is not None else None,
+				pandas.Timestamp(end) if end is not None else None,
+				True,
+				include_end
+		)
+
+
+class IsInFilter(ColumnFilter):
+	"""
+    Accepts the rows with a column value in a set of values.
+
+    Attributes:
+        column (typing.Hashable): The label of the filtered column.
+        values (list[typing.Any]): The accepted values.
+        invert (bool): Whether the rows with a value outside of the set are accepted instead. Defaults to False.
+
+    :Usage:
+        tech = IsInFilter("symbol", ["AAPL", "MSFT", "GOOG"])
+    """
+	
+	def __init__(
+			self,
+			column: typing.Hashable,
+			values: typing.Iterable[typing.Any],
+			invert: bool = False
+	):
+		"""
+        Initializes an IsInFilter object.
+
+        Args:
+            column (typing.Hashable): The label of the filtered column.
+            values (typing.Iterable[typing.Any]): The accepted values.
+            invert (bool): Whether the values outside of the set are accepted instead.
+        """
+		super().__init__(column)
+		
+		self.values = list(values)
+		self.invert = invert
+	
+	def get_values_mask(self, values: pandas.Series) -> numpy.ndarray:
+		"""
+        Looks the values up in the set with a hash table.
+
+        Args:
+            values (pandas.Series): The values to test.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted values.
+        """
+		mask = values.isin(self.values).to_numpy(dtype=bool)
+		
+		return ~mask if self.invert else mask
+
+
+class NullFilter(ColumnFilter):
+	"""
+    Accepts the rows with a missing column value, or with a present one.
+
+    Attributes:
+        column (typing.Hashable): The label of the filtered column.
+        is_null (bool): Whether the rows with a missing value are accepted, rather than the rows with a present value. Defaults to True.
+
+    :Usage:
+        unfilled = NullFilter("fill_price")
+    """
+	
+	def __init__(self, column: typing.Hashable, is_null: bool = True):
+		"""
+        Initializes a NullFilter object.
+
+        Args:
+            column (typing.Hashable): The label of the filtered column.
+            is_null (bool): Whether the rows with a missing value are accepted.
+        """
+		super().__init__(column)
+		
+		self.is_null = is_null
+	
+	def get_values_mask(self, values: pandas.Series) -> numpy.ndarray:
+		"""
+        Checks the values for missing values.
+
+        Args:
+            values (pandas.Series): The values to test.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted values.
+        """
+		mask = values.isna().to_numpy(dtype=bool)
+		
+		return mask if self.is_null else ~mask
+
+
+class AndFilter(TableFilter):
+	"""
+    Accepts the rows accepted by every one of several filters.
+
+    Attributes:
+        filters (list[TableFilter]): The combined filters.
+
+    :Usage:
+        liquid_tech = AndFilter(IsInFilter("symbol", ["AAPL", "MSFT"]), RangeFilter("volume", minimum=1_000_000))
+    """
+	
+	def __init__(self, *filters: TableFilter):
+		"""
+        Initializes an AndFilter object.
+
+        Args:
+            *filters (TableFilter): The combined filters.
+        """
+		self.filters = list(filters)
+	
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns the columns the combined filters read.
+
+        Returns:
+            list[typing.Hashable]: The column labels, without duplicates.
+        """
+		return list(dict.fromkeys(column for table_filter in self.filters for column in table_filter.get_columns()))
+	
+	def get_snapshot(self, data: pandas.DataFrame) -> "TableFilter":
+		"""
+        Combines the background snapshots of the combined filters.
+
+        Args:
+            data (pandas.DataFrame): The current table data.
+
+        Returns:
+            TableFilter: The combined snapshot, or this filter if every combined filter is its own snapshot.
+        """
+		snapshots = [table_filter.get_snapshot(data) for table_filter in self.filters]
+		
+		if all(snapshot is table_filter for snapshot, table_filter in zip(snapshots, self.filters)):
+			return self
+		
+		return type(self)(*snapshots)
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Evaluates every combined filter and intersects the results.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Sorted indexes of columns of data.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		mask = numpy.ones(data.shape[0] if rows is None else len(rows), dtype=bool)
+		
+		for table_filter in self.filters:
+			mask &= table_filter.get_mask(data, rows, column_indexes)
+		
+		return mask
+
+
+class OrFilter(AndFilter):
+	"""
+    Accepts the rows accepted by any of several filters.
+
+    Attributes:
+        filters (list[TableFilter]): The combined filters.
+
+    :Usage:
+        extremes = OrFilter(RangeFilter("change", maximum=-0.05), RangeFilter("change", minimum=0.05))
+    """
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Evaluates every combined filter and unites the results.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Sorted indexes of columns of data.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		mask = numpy.zeros(data.shape[0] if rows is None else len(rows), dtype=bool)
+		
+		for table_filter in self.filters:
+			mask |= table_filter.get_mask(data, rows, column_indexes)
+		
+		return mask
@@ -0,0 +1,704 @@
+import sys
+import numpy
+import typing
+import pandas
+import collections
+from PyQt6.QtCore import QModelIndex, QObject
+from PyGraphicUI.Objects.TableFilters import MaskFilter, SortedColumnIndex, TableFilter
+from PyGraphicUI.Objects.AbstractTableModel import PyAbstractTableModel
+
+
+PREFIX_MARKER = "\x02"
+
+
+class ColumnSearchIndex:
+	"""
+    An n-gram index over the formatted, lowercased values of a single column.
+
+    Every distinct string is stored once with a leading PREFIX_MARKER, so that prefix queries are n-gram queries too. The postings map every n-gram to the ids of the distinct strings containing it, and the rows are grouped by string id to turn matching strings into rows without scanning the column. Strings no row refers to anymore are dropped once their share of the distinct strings exceeds compaction_threshold.
+
+    Attributes:
+        formatter (typing.Callable[[typing.Any], str]): The formatter of the column.
+        ngram_size (int): The length of the indexed n-grams.
+        compaction_threshold (float): The share of unreferenced distinct strings above which they are dropped.
+        checked_strings (int): The number of distinct strings when unreferenced strings were last looked for.
+        codes (numpy.ndarray): The string id of every row.
+        unique_strings (list[str]): The distinct marked strings, by id.
+        unique_ids (dict[str, int]): The id of every distinct marked string.
+        postings (dict[str, numpy.ndarray]): The sorted string ids of every n-gram.
+        pending_postings (dict[str, list[int]]): The string ids added since the n-gram's posting was last merged.
+        row_order (typing.Optional[numpy.ndarray]): The rows sorted by string id, or None if the grouping must be rebuilt.
+        code_offsets (typing.Optional[numpy.ndarray]): The start of every string id in row_order.
+        dirty_rows (set[int]): The rows changed or appended since the grouping was built.
+    """
+	
+	def __init__(
+			self,
+			values: typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray],
+			formatter: typing.Callable[[typing.Any], str],
+			ngram_size: int = 3,
+			compaction_threshold: float = 0.5
+	):
+		"""
+        Initializes a ColumnSearchIndex object and indexes the values.
+
+        Args:
+            values (typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]): The raw values of the column.
+            formatter (typing.Callable[[typing.Any], str]): The formatter of the column.
+            ngram_size (int): The length of the indexed n-grams.
+            compaction_threshold (float): The share of unreferenced distinct strings above which they are dropped.
+        """
+		self.formatter = formatter
+		self.ngram_size = ngram_size
+		self.compaction_threshold = compaction_threshold
+		
+		try:
+			codes, unique_values = pandas.factorize(values, use_na_sentinel=False)
+		except TypeError:
+			codes, unique_values = numpy.arange(len(values)), values
+		
+		self.codes = codes.astype(numpy.int64, copy=False)
+		self.unique_strings = [PREFIX_MARKER + formatter(value).lower() for value in unique_values]
+		self.unique_ids: dict[str, int] = {}
+		self.pending_postings: dict[str, list[int]] = {}
+		self.checked_strings = len(self.unique_strings)
+		
+		ngram_ids = collections.defaultdict(list)
+		
+		for unique_id, unique_string in enumerate(self.unique_strings):
+			self.unique_ids.setdefault(unique_string, unique_id)
+			
+			for ngram in self.get_ngrams(unique_string):
+				ngram_ids[ngram].append(unique_id)
+		
+		self.postings = {ngram: numpy.array(ids, dtype=numpy.int64) for ngram, ids in ngram_ids.items()}
+		
+		self.row_order: typing.Optional[numpy.ndarray] = None
+		self.code_offsets: typing.Optional[numpy.ndarray] = None
+		self.dirty_rows: set[int] = set()
+		
+		self.group_rows()
+	
+	def check_unused_strings(self):
+		"""Looks for unreferenced strings whenever the number of distinct strings doubled since the last check, so that the cost of counting them is amortized."""
+		if len(self.unique_strings) > 2 * max(self.checked_strings, 1024):
+			self.drop_unused_strings()
+	
+	def drop_unused_strings(self, counts: typing.Optional[numpy.ndarray] = None) -> bool:
+		"""
+        Drops the distinct strings no row refers to if their share exceeds compaction_threshold, renumbering the remaining strings and their postings.
+
+        Args:
+            counts (typing.Optional[numpy.ndarray]): The number of rows of every string id, if already counted.
+
+        Returns:
+            bool: True if strings were dropped, which also drops the grouping of the rows.
+        """
+		if counts is None:
+			counts = numpy.bincount(self.codes, minlength=len(self.unique_strings))
+		
+		self.checked_strings = len(self.unique_strings)
+		referenced_ids = numpy.flatnonzero(counts)
+		
+		if len(self.unique_strings) - referenced_ids.size <= self.compaction_threshold * len(self.unique_strings):
+			return False
+		
+		for ngram in list(self.pending_postings):
+			self.get_posting(ngram)
+		
+		new_ids = numpy.full(len(self.unique_strings), -1, dtype=numpy.int64)
+		new_ids[referenced_ids] = numpy.arange(referenced_ids.size)
+		
+		self.codes = new_ids[self.codes]
+		self.unique_strings = [self.unique_strings[unique_id] for unique_id in referenced_ids.tolist()]
+		self.unique_ids = {unique_string: unique_id for unique_id, unique_string in enumerate(self.unique_strings)}
+		postings = {}
+		
+		for ngram, posting in self.postings.items():
+			new_posting = new_ids[posting]
+			new_posting = new_posting[new_posting >= 0]
+			
+			if new_posting.size:
+				postings[ngram] = new_posting
+		
+		self.postings = postings
+		self.checked_strings = len(self.unique_strings)
+		self.row_order = None
+		self.code_offsets = None
+		self.dirty_rows = set()
+		
+		return True
+	
+	def get_codes(self, values: typing.Iterable[typing.Any]) -> numpy.ndarray:
+		"""
+        Returns the string ids of values, adding the strings that are not indexed yet.
+
+        Args:
+            values (typing.Iterable[typing.Any]): The raw values.
+
+        Returns:
+            numpy.ndarray: The string id of every value.
+        """
+		codes = []
+		
+		for value in values:
+			unique_string = PREFIX_MARKER + self.formatter(value).lower()
+			unique_id = self.unique_ids.get(unique_string)
+			
+			if unique_id is None:
+				unique_id = len(self.unique_strings)
+				self.unique_strings.append(unique_string)
+				self.unique_ids[unique_string] = unique_id
+				
+				for ngram in self.get_ngrams(unique_string):
+					self.pending_postings.setdefault(ngram, []).append(unique_id)
+			
+			codes.append(unique_id)
+		
+		return numpy.array(codes, dtype=numpy.int64)
+	
+	def get_memory_usage(self) -> int:
+		"""
+        Estimates the memory used by the index.
+
+        Returns:
+            int: The approximate size in bytes.
+        """
+		memory_usage = self.codes.nbytes + sys.getsizeof(self.unique_strings) + sys.getsizeof(self.unique_ids)
+		memory_usage += sum(sys.getsizeof(unique_string) for unique_string in self.unique_strings)
+		memory_usage += sys.getsizeof(self.postings) + sum(
+				sys.getsizeof(ngram) + posting.nbytes
+				for ngram, posting in self.postings.items()
+		)
+		memory_usage += sum(8 * len(ids) for ids in self.pending_postings.values())
+		
+		if self.row_order is not None:
+			memory_usage += self.row_order.nbytes + self.code_offsets.nbytes
+		
+		return memory_usage
+	
+	def get_ngrams(self, string: str) -> set[str]:
+		"""
+        Splits a string into its distinct n-grams.
+
+        Args:
+            string (str): The string to split.
+
+        Returns:
+            set[str]: The n-grams.
+        """
+		return {string[start:start + self.ngram_size] for start in range(len(string) - self.ngram_size + 1)}
+	
+	def get_posting(self, ngram: str) -> numpy.ndarray:
+		"""
+        Returns the string ids containing an n-gram, merging the pending ids first.
+
+        Args:
+            ngram (str): The n-gram.
+
+        Returns:
+            numpy.ndarray: The sorted string ids.
+        """
+		pending_ids = self.pending_postings.pop(ngram, None)
+		posting = self.postings.get(ngram, numpy.empty(0, dtype=numpy.int64))
+		
+		if pending_ids:
+			posting = numpy.concatenate((posting, numpy.array(pending_ids, dtype=numpy.int64)))
+			self.postings[ngram] = posting
+		
+		return posting
+	
+	def get_unique_matches(self, key: str) -> numpy.ndarray:
+		"""
+        Finds the distinct strings containing a key.
+
+        Keys of at least ngram_size characters intersect the postings of their n-grams, starting with the shortest, and verify the candidates; shorter keys scan the distinct strings.
+
+        Args:
+            key (str): The lowercased key, starting with PREFIX_MARKER for prefix queries.
+
+        Returns:
+            numpy.ndarray: The ids of the matching strings.
+        """
+		if len(key) < self.ngram_size:
+			return numpy.flatnonzero(
+					numpy.fromiter(
+							(key in unique_string for unique_string in self.unique_strings),
+							dtype=bool,
+							count=len(self.unique_strings)
+					)
+			)
+		
+		ngrams = sorted((self.get_posting(ngram) for ngram in self.get_ngrams(key)), key=len)
+		candidates = ngrams[0]
+		
+		for posting in ngrams[1:]:
+			if candidates.size == 0:
+				break
+			
+			candidates = numpy.intersect1d(candidates, posting, assume_unique=True)
+		
+		if len(key) == self.ngram_size:
+			return candidates
+		
+		return numpy.array(
+				[unique_id for unique_id in candidates.tolist() if key in self.unique_strings[unique_id]],
+				dtype=numpy.int64
+		)
+	
+	def group_rows(self):
+		"""Sorts the rows by string id, so that the rows of a string are a slice of row_order. Unreferenced strings are dropped first if there are too many of them."""
+		counts = numpy.bincount(self.codes, minlength=len(self.unique_strings))
+		
+		if self.drop_unused_strings(counts):
+			counts = numpy.bincount(self.codes, minlength=len(self.unique_strings))
+		
+		self.row_order = numpy.argsort(self.codes, kind="stable")
+		self.code_offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+		self.dirty_rows = set()
+	
+	def insert_rows(self, first: int, values: typing.Iterable[typing.Any]):
+		"""
+        Indexes inserted rows.
+
+        Args:
+            first (int): The position of the first inserted row.
+            values (typing.Iterable[typing.Any]): The raw values of the inserted rows.
+        """
+		appended = first == self.codes.size
+		self.codes = numpy.insert(self.codes, first, self.get_codes(values))
+		
+		if appended:
+			self.mark_dirty(numpy.arange(first, self.codes.size))
+		else:
+			self.row_order = None
+		
+		self.check_unused_strings()
+	
+	def mark_dirty(self, rows: numpy.ndarray):
+		"""
+        Records rows that search must check directly, dropping the grouping once there are too many of them.
+
+        Args:
+            rows (numpy.ndarray): The positions of the rows.
+        """
+		if self.row_order is None:
+			return
+		
+		self.dirty_rows.update(rows.tolist())
+		
+		if len(self.dirty_rows) > max(1024, self.codes.size // 100):
+			self.row_order = None
+	
+	def permute_rows(self, permutation: numpy.ndarray):
+		"""
+        Reorders the rows. The grouping is kept by moving its rows to their new positions.
+
+        Args:
+            permutation (numpy.ndarray): The previous position of every row, in the new order.
+        """
+		self.codes = self.codes[permutation]
+		
+		if self.row_order is not None:
+			new_positions = numpy.empty_like(permutation)
+			new_positions[permutation] = numpy.arange(permutation.size)
+			
+			self.row_order = new_positions[self.row_order]
+			self.dirty_rows = set(new_positions[list(self.dirty_rows)].tolist())
+	
+	def remove_rows(self, first: int, last: int):
+		"""
+        Removes rows from the index. The strings of the rows stay indexed.
+
+        Args:
+            first (int): The first removed row.
+            last (int): The last removed row.
+        """
+		self.codes = numpy.delete(self.codes, slice(first, last + 1))
+		self.row_order = None
+	
+	def search(self, key: str) -> numpy.ndarray:
+		"""
+        Finds the rows containing a key.
+
+        Args:
+            key (str): The lowercased key, starting with PREFIX_MARKER for prefix queries.
+
+        Returns:
+            numpy.ndarray: The matching rows, in no particular order.
+        """
+		if self.row_order is None:
+			self.group_rows()
+		
+		unique_ids = self.get_unique_matches(key)
+		
+		if unique_ids.size == 0:
+			return numpy.empty(0, dtype=numpy.int64)
+		
+		if unique_ids.size > 256:
+			matches = numpy.zeros(len(self.unique_strings), dtype=bool)
+			matches[unique_ids] = True
+			
+			return numpy.flatnonzero(matches[self.codes])
+		
+		grouped_ids = unique_ids[unique_ids < self.code_offsets.size - 1]
+		rows = numpy.concatenate(
+				[self.row_order[self.code_offsets[unique_id]:self.code_offsets[unique_id + 1]] for unique_id in grouped_ids.tolist()]
+				+ [numpy.empty(0, dtype=numpy.int64)]
+		)
+		
+		if self.dirty_rows:
+			dirty_rows = numpy.fromiter(self.dirty_rows, dtype=numpy.int64, count=len(self.dirty_rows))
+			rows = numpy.concatenate(
+					(
+							rows[~numpy.isin(rows, dirty_rows)],
+							dirty_rows[numpy.isin(self.codes[dirty_rows], unique_ids)]
+					)
+			)
+		
+		return rows
+	
+	def update_rows(self, rows: numpy.ndarray, values: typing.Iterable[typing.Any]):
+		"""
+        Re-indexes changed rows.
+
+        Args:
+            rows (numpy.ndarray): The positions of the changed rows.
+            values (typing.Iterable[typing.Any]): The new raw values of the rows.
+        """
+		self.codes[rows] = self.get_codes(values)
+		self.mark_dirty(rows)
+		self.check_unused_strings()
+
+
+class TableSearchIndexInit:
+	"""
+    Data class to hold initialization parameters for table search indexes.
+
+    Attributes:
+        table_model (PyAbstractTableModel): The table model to index.
+        columns (typing.Optional[list[typing.Hashable]]): The columns to index. Defaults to None (every column).
+        ngram_size (int): The length of the indexed n-grams. Defaults to 3.
+        compaction_threshold (float): The share of distinct strings no row refers to anymore above which they are dropped from a column index. Defaults to 0.5.
+    """
+	
+	def __init__(
+			self,
+			table_model: PyAbstractTableModel,
+			columns: typing.Optional[list[typing.Hashable]] = None,
+			ngram_size: int = 3,
+			compaction_threshold: float = 0.5
+	):
+		"""
+        Initializes a TableSearchIndexInit object.
+
+        Args:
+            table_model (PyAbstractTableModel): The table model to index.
+            columns (typing.Optional[list[typing.Hashable]]): The columns to index.
+            ngram_size (int): The length of the indexed n-grams.
+            compaction_threshold (float): The share of unreferenced strings above which they are dropped.
+        """
+		self.table_model = table_model
+		self.columns = columns
+		self.ngram_size = ngram_size
+		self.compaction_threshold = compaction_threshold
+
+
+class PyTableSearchIndex(QObject):
+	"""
+    A case-insensitive substring and prefix search over the formatted values of several columns of a table model.
+
+    The index is built once and kept in sync with the inserted, removed, changed and sorted rows of the model. It is built again after a model reset or a layout change that is not a sort.
+
+    Attributes:
+        table_model (PyAbstractTableModel): The indexed table model.
+        columns (typing.Optional[list[typing.Hashable]]): The indexed columns, or None for every column.
+        ngram_size (int): The length of the indexed n-grams.
+        compaction_threshold (float): The share of unreferenced strings above which they are dropped from a column index.
+        column_indexes (dict[typing.Hashable, ColumnSearchIndex]): The index of every indexed column.
+        stale (bool): Whether the index must be built again before the next search.
+        layout_stale (bool): Whether the index was already stale when the current layout change began, so that a sort must not be applied to it.
+
+    :Usage:
+        search_index = PyTableSearchIndex(TableSearchIndexInit(table_model, columns=["symbol", "venue", "trader"]))
+        proxy_model.add_typed_filter(SearchFilter(search_index, search_line_edit.text()))
+        print(search_index.get_memory_usage())
+    """
+	
+	def __init__(self, table_search_index_init: TableSearchIndexInit):
+		"""
+        Initializes a PyTableSearchIndex object and builds the index.
+
+        Args:
+            table_search_index_init (TableSearchIndexInit): Initialization parameters for the index.
+        """
+		super().__init__()
+		
+		self.table_model = table_search_index_init.table_model
+		self.columns = table_search_index_init.columns
+		self.ngram_size = table_search_index_init.ngram_size
+		self.compaction_threshold = table_search_index_init.compaction_threshold
+		self.column_indexes: dict[typing.Hashable, ColumnSearchIndex] = {}
+		self.stale = True
+		self.layout_stale = True
+		
+		self.table_model.dataChanged.connect(self.source_data_changed)
+		self.table_model.rowsInserted.connect(self.source_rows_inserted)
+		self.table_model.rowsRemoved.connect(self.source_rows_removed)
+		self.table_model.rowsPermuted.connect(self.source_rows_permuted)
+		self.table_model.layoutAboutToBeChanged.connect(self.source_layout_about_to_be_changed)
+		self.table_model.modelAboutToBeReset.connect(self.mark_stale)
+		
+		self.build()
+	
+	def build(self):
+		"""Builds the index of every indexed column from the current data."""
+		self.column_indexes = {
+			column: ColumnSearchIndex(
+					self.table_model.column_values[self.table_model.table_data.columns.get_loc(column)],
+					self.table_model.get_column_formatter(self.table_model.table_data.columns.get_loc(column)),
+					self.ngram_size,
+					self.compaction_threshold
+			)
+			for column in self.get_columns()
+		}
+		self.stale = False
+	
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns the indexed columns.
+
+        Returns:
+            list[typing.Hashable]: The column labels.
+        """
+		return self.columns if self.columns is not None else list(self.table_model.table_data.columns)
+	
+	def get_memory_usage(self) -> int:
+		"""
+        Estimates the memory used by the index.
+
+        Returns:
+            int: The approximate size in bytes.
+        """
+		return sum(column_index.get_memory_usage() for column_index in self.column_indexes.values())
+	
+	def get_search_key(self, query: str, prefix: bool = False) -> str:
+		"""
+        Turns a query into the key searched in the marked strings.
+
+        Args:
+            query (str): The searched text.
+            prefix (bool): Whether values must start with the text.
+
+        Returns:
+            str: The lowercased key.
+        """
+		return (PREFIX_MARKER if prefix else "") + query.lower()
+	
+	def mark_stale(self):
+		"""Marks the index to be built again, unless the coming layout change turns out to be a sort."""
+		self.stale = True
+	
+	def match_rows(self, query: str, rows: numpy.ndarray, prefix: bool = False) -> numpy.ndarray:
+		"""
+        Tests some rows directly against a query, without using the index.
+
+        Args:
+            query (str): The searched text.
+            rows (numpy.ndarray): The positions of the rows to test.
+            prefix (bool): Whether values must start with the text.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the matching rows, aligned with rows.
+        """
+		key = self.get_search_key(query, prefix)
+		mask = numpy.zeros(len(rows), dtype=bool)
+		
+		for column in self.get_columns():
+			position = self.table_model.table_data.columns.get_loc(column)
+			formatter = self.table_model.get_column_formatter(position)
+			values = self.table_model.column_values[position][rows]
+			
+			mask |= numpy.fromiter(
+					(key in PREFIX_MARKER + formatter(value).lower() for value in values),
+					dtype=bool,
+					count=len(rows)
+			)
+		
+		return mask
+	
+	def search(self, query: str, prefix: bool = False) -> numpy.ndarray:
+		"""
+        Finds the rows where any indexed column contains a query, ignoring case.
+
+        Args:
+            query (str): The searched text.
+            prefix (bool): Whether values must start with the text instead of containing it. Defaults to False.
+
+        Returns:
+            numpy.ndarray: The sorted positions of the matching rows.
+        """
+		if self.stale:
+			self.build()
+		
+		key = self.get_search_key(query, prefix)
+		mask = numpy.zeros(self.table_model.row_count, dtype=bool)
+		
+		for column_index in self.column_indexes.values():
+			mask[column_index.search(key)] = True
+		
+		return numpy.flatnonzero(mask)
+	
+	def source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: typing.Iterable[int] = ()):
+		"""
+        Re-indexes the changed rows of the indexed columns.
+
+        Args:
+            top_left (QModelIndex): The top left changed index.
+            bottom_right (QModelIndex): The bottom right changed index.
+            roles (typing.Iterable[int]): The changed roles.
+        """
+		if self.stale:
+			return
+		
+		rows = numpy.arange(top_left.row(), bottom_right.row() + 1)
+		
+		for column, column_index in self.column_indexes.items():
+			position = self.table_model.table_data.columns.get_loc(column)
+			
+			if top_left.column() <= position <= bottom_right.column():
+				column_index.update_rows(rows, self.table_model.column_values[position][rows])
+	
+	def source_layout_about_to_be_changed(self, parents: typing.Iterable[QModelIndex] = (), hint: typing.Any = None):
+		"""
+        Records whether the index was already stale, then marks it stale unless the coming layout change turns out to be a sort.
+
+        Args:
+            parents (typing.Iterable[QModelIndex]): The parents whose layout changes.
+            hint (typing.Any): The layout change hint.
+        """
+		self.layout_stale = self.stale
+		self.mark_stale()
+	
+	def source_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+		"""
+        Indexes the inserted rows.
+
+        Args:
+            parent (QModelIndex): The parent index.
+            first (int): The first inserted row.
+            last (int): The last inserted row.
+        """
+		if self.stale:
+			return
+		
+		for column, column_index in self.column_indexes.items():
+			position = self.table_model.table_data.columns.get_loc(column)
+			column_index.insert_rows(first, self.table_model.column_values[position][first:last + 1])
+	
+	def source_rows_permuted(self, permutation: numpy.ndarray):
+		"""
+        Reorders the indexed rows after a sort.
+
+        An index that was already stale before the sort stays stale and is built again by the next search.
+
+        Args:
+            permutation (numpy.ndarray): The previous position of every row, in the new order.
+        """
+		if self.layout_stale:
+			return
+		
+		for column_index in self.column_indexes.values():
+			column_index.permute_rows(permutation)
+		
+		self.stale = False
+	
+	def source_rows_removed(self, parent: QModelIndex, first: int, last: int):
+		"""
+        Removes the rows from the index.
+
+        Args:
+            parent (QModelIndex): The parent index.
+            first (int): The first removed row.
+            last (int): The last removed row.
+        """
+		if self.stale:
+			return
+		
+		for column_index in self.column_indexes.values():
+			column_index.remove_rows(first, last)
+
+
+class SearchFilter(TableFilter):
+	"""
+    A typed filter accepting the rows where any column of a search index contains a query.
+
+    Attributes:
+        search_index (PyTableSearchIndex): The search index of the filtered table model.
+        query (str): The searched text.
+        prefix (bool): Whether values must start with the text. Defaults to False.
+
+    :Usage:
+        proxy_model.add_typed_filter(SearchFilter(search_index, "aap", prefix=True))
+    """
+	
+	def __init__(self, search_index: PyTableSearchIndex, query: str, prefix: bool = False):
+		"""
+        Initializes a SearchFilter object.
+
+        Args:
+            search_index (PyTableSearchIndex): The search index of the filtered table model.
+            query (str): The searched text.
+            prefix (bool): Whether values must start with the text.
+        """
+		self.search_index = search_index
+		self.query = query
+		self.prefix = prefix
+	
+	def get_columns(self) -> list[typing.Hashable]:
+		"""
+        Returns the indexed columns.
+
+        Returns:
+            list[typing.Hashable]: The column labels.
+        """
+		return self.search_index.get_columns()
+	
+	def get_snapshot(self, data: pandas.DataFrame) -> TableFilter:
+		"""
+        Searches the index on the calling thread, so that background filtering never reads the index while it is updated.
+
+        Args:
+            data (pandas.DataFrame): The current table data.
+
+        Returns:
+            TableFilter: A MaskFilter with the accepted rows.
+        """
+		return MaskFilter(self.get_mask(data))
+	
+	def get_mask(
+			self,
+			data: pandas.DataFrame,
+			rows: typing.Optional[numpy.ndarray] = None,
+			column_indexes: typing.Optional[dict[typing.Hashable, SortedColumnIndex]] = None
+	) -> numpy.ndarray:
+		"""
+        Searches the index, or tests the given rows directly.
+
+        The current data of the indexed table model is searched, so the filter must be evaluated on the GUI thread; background filtering evaluates get_snapshot instead.
+
+        Args:
+            data (pandas.DataFrame): The table data.
+            rows (typing.Optional[numpy.ndarray]): The positions of the rows to test. If None, every row is tested.
+            column_indexes (typing.Optional[dict[typing.Hashable, SortedColumnIndex]]): Unused.
+
+        Returns:
+            numpy.ndarray: The boolean mask of the accepted rows, aligned with rows.
+        """
+		if rows is not None:
+			return self.search_index.match_rows(self.query, rows, self.prefix)
+		
+		mask = numpy.zeros(data.shape[0], dtype=bool)
+		mask[self.search_index.search(self.query, self.prefix)] = True
+		
+		return mask
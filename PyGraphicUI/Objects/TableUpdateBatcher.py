@@ -0,0 +1,186 @@
+import typing
+import threading
+from time import monotonic
+from PyGraphicUI.Objects.AbstractTableModel import PyAbstractTableModel
+from PyQt6.QtCore import (
+	QObject,
+	QTimer,
+	Qt,
+	pyqtSignal
+)
+
+
+class TableUpdateBatcherInit:
+	"""
+    Data class to hold initialization parameters for table update batchers.
+
+    Attributes:
+        table_model (PyAbstractTableModel): The table model that receives the batched updates.
+        frame_interval (int): The minimum interval between two flushes in milliseconds. Defaults to 16.
+        max_pending_updates (typing.Optional[int]): The maximum number of distinct cells with a buffered update. The update of the cell buffered first is dropped when it is exceeded. Defaults to None (unbounded).
+    """
+	
+	def __init__(
+			self,
+			table_model: PyAbstractTableModel,
+			frame_interval: int = 16,
+			max_pending_updates: typing.Optional[int] = None
+	):
+		"""
+        Initializes a TableUpdateBatcherInit object.
+
+        Args:
+            table_model (PyAbstractTableModel): The table model to update.
+            frame_interval (int): The minimum interval between flushes in milliseconds.
+            max_pending_updates (typing.Optional[int]): The maximum number of cells with a buffered update.
+        """
+		self.table_model = table_model
+		self.frame_interval = frame_interval
+		self.max_pending_updates = max_pending_updates
+
+
+class PyTableUpdateBatcher(QObject):
+	"""
+    A front-end for PyAbstractTableModel that buffers cell updates from any thread and applies them on the GUI thread at most once per frame interval.
+
+    Repeated updates of the same cell within one interval are coalesced as they arrive, only the last value is buffered and written, so a frequently updated cell takes a single place in the buffer. Rows and columns are positions in the table model at the moment of the flush.
+
+    Attributes:
+        table_model (PyAbstractTableModel): The table model that receives the batched updates.
+        frame_interval (int): The minimum interval between two flushes in milliseconds.
+        max_pending_updates (typing.Optional[int]): The maximum number of cells with a buffered update, or None if unbounded.
+        pending_updates (dict[tuple[int, int], typing.Any]): The last buffered value of every updated (row, column) cell, in the order the cells were first updated.
+        buffer_lock (threading.Lock): Guards the buffer, flush_scheduled and the counters written by producer threads.
+        flush_scheduled (bool): Whether a flush is already scheduled on the GUI thread.
+        last_flush_time (float): The monotonic time of the last flush in seconds.
+        received_updates (int): The number of updates received.
+        coalesced_updates (int): The number of buffered updates overwritten by a later update of the same cell before being flushed.
+        dropped_updates (int): The number of updates dropped because the buffer was full of other cells or the cell no longer existed.
+        flushes (int): The number of flushes performed.
+        flush_timer (QTimer): The single shot timer that triggers the next flush.
+
+    :Usage:
+        batcher = PyTableUpdateBatcher(TableUpdateBatcherInit(table_model, frame_interval=33))
+        batcher.update_cell(row=10, column=2, value=101.5) # can be called from a worker thread
+    """
+	
+	flushRequested = pyqtSignal()
+	
+	def __init__(self, table_update_batcher_init: TableUpdateBatcherInit):
+		"""
+        Initializes a PyTableUpdateBatcher object. Must be created on the GUI thread.
+
+        Args:
+            table_update_batcher_init (TableUpdateBatcherInit): Initialization parameters for the batcher.
+        """
+		super().__init__()
+		
+		self.table_model = table_update_batcher_init.table_model
+		self.frame_interval = table_update_batcher_init.frame_interval
+		self.max_pending_updates = table_update_batcher_init.max_pending_updates
+		self.pending_updates: dict[tuple[int, int], typing.Any] = {}
+		self.buffer_lock = threading.Lock()
+		self.flush_scheduled = False
+		self.last_flush_time = 0.0
+		self.received_updates = 0
+		self.coalesced_updates = 0
+		self.dropped_updates = 0
+		self.flushes = 0
+		
+		self.flush_timer = QTimer(self)
+		self.flush_timer.setSingleShot(True)
+		self.flush_timer.setTimerType(Qt.TimerType.PreciseTimer)
+		self.flush_timer.timeout.connect(self.flush)
+		
+		self.flushRequested.connect(self.schedule_flush, Qt.ConnectionType.QueuedConnection)
+	
+	def flush(self):
+		"""Applies the buffered updates to the table model as merged dataChanged ranges. Runs on the GUI thread."""
+		with self.buffer_lock:
+			pending_updates = self.pending_updates
+			self.pending_updates = {}
+			self.flush_scheduled = False
+		
+		self.last_flush_time = monotonic()
+		
+		dropped_updates = 0
+		
+		rows, columns, values = [], [], []
+		row_count, column_count = self.table_model.rowCount(), self.table_model.columnCount()
+		
+		for (row, column), value in pending_updates.items():
+			if 0 <= row < row_count and 0 <= column < column_count:
+				rows.append(row)
+				columns.append(column)
+				values.append(value)
+			else:
+				dropped_updates += 1
+		
+		if rows:
+			self.table_model.update_cells(rows, columns, values)
+		
+		with self.buffer_lock:
+			self.dropped_updates += dropped_updates
+			self.flushes += 1
+	
+	def schedule_flush(self):
+		"""Starts the flush timer so that flushes are at least frame_interval apart. Runs on the GUI thread."""
+		if not self.flush_timer.isActive():
+			elapsed = int((monotonic() - self.last_flush_time) * 1000)
+			self.flush_timer.start(max(0, self.frame_interval - elapsed))
+	
+	def update_cell(self, row: int, column: int, value: typing.Any):
+		"""
+        Buffers an update of a single cell. Thread-safe.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+            value (typing.Any): The new value.
+        """
+		self.update_cells([row], [column], [value])
+	
+	def update_cells(
+			self,
+			rows: typing.Sequence[int],
+			columns: typing.Sequence[int],
+			values: typing.Sequence[typing.Any]
+	):
+		"""
+        Buffers updates of several cells. Thread-safe.
+
+        An update of a cell that already has a buffered update replaces its value. An update of a new cell evicts the cell buffered first when max_pending_updates cells are already buffered.
+
+        Args:
+            rows (typing.Sequence[int]): The row of every updated cell.
+            columns (typing.Sequence[int]): The column of every updated cell.
+            values (typing.Sequence[typing.Any]): The new value of every updated cell.
+        """
+		with self.buffer_lock:
+			for row, column, value in zip(rows, columns, values):
+				cell = (row, column)
+				
+				if cell in self.pending_updates:
+					self.coalesced_updates += 1
+				elif self.max_pending_updates is not None and len(self.pending_updates) >= self.max_pending_updates:
+					del self.pending_updates[next(iter(self.pending_updates))]
+					self.dropped_updates += 1
+				
+				self.pending_updates[cell] = value
+				self.received_updates += 1
+			
+			schedule_flush = not self.flush_scheduled
+			self.flush_scheduled = True
+		
+		if schedule_flush:
+			self.flushRequested.emit()
+	
+	def update_row(self, row: int, values: typing.Sequence[typing.Any]):
+		"""
+        Buffers an update of every cell of a row. Thread-safe.
+
+        Args:
+            row (int): The row to update.
+            values (typing.Sequence[typing.Any]): The new values, one per column.
+        """
+		self.update_cells([row] * len(values), range(len(values)), values)
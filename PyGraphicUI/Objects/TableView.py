@@ -1,28 +1,80 @@
+import numpy
 import typing
 import pandas
-from copy import deepcopy
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+	QItemSelection,
+	QItemSelectionModel,
+	QModelIndex,
+	Qt
+)
 from PyQt6.QtGui import QFont
+from PyGraphicUI.Functions import text_measurer
 from PyGraphicUI.Attributes import ObjectSize, PyFont
 from PyGraphicUI.Objects.Widgets import PyWidget, WidgetInit
-from PyGraphicUI.Objects.AbstractTableModel import PyAbstractTableModel
+from PyGraphicUI.Objects.AbstractTableModel import PyAbstractTableModel, get_contiguous_ranges
 from PyGraphicUI.Objects.SortFilterProxyModel import PySortFilterProxyModel
+from PyGraphicUI.Objects.TableWindowModel import PyTableWindowModel, TableWindowModelInit
 from PyQt6.QtWidgets import (
+	QAbstractItemView,
 	QGraphicsEffect,
 	QHeaderView,
+	QScrollBar,
 	QSizePolicy,
+	QStyle,
 	QTableView,
 	QWidget
 )
 
 
+def get_scroll_shift(position: int, visible_count: int, hint: QAbstractItemView.ScrollHint) -> int:
+	"""
+    Computes how far a windowed axis must scroll to place a window position as a scroll hint asks.
+
+    Args:
+        position (int): The row or column in the window.
+        visible_count (int): The number of fully visible rows or columns.
+        hint (QAbstractItemView.ScrollHint): Where the position should be placed.
+
+    Returns:
+        int: The scroll distance in rows or columns.
+    """
+	if hint == QAbstractItemView.ScrollHint.PositionAtTop:
+		return position
+	
+	if hint == QAbstractItemView.ScrollHint.PositionAtBottom:
+		return position - visible_count + 1
+	
+	if hint == QAbstractItemView.ScrollHint.PositionAtCenter:
+		return position - visible_count // 2
+	
+	return max(0, position - visible_count + 1)
+
+
+def update_window_scroll_bar(scroll_bar: QScrollBar, first: int, total: int, visible_count: int):
+	"""
+    Maps a scroll bar onto every row or column of a table model, with its value on the first row or column of the window.
+
+    Args:
+        scroll_bar (QScrollBar): The scroll bar of a windowed axis.
+        first (int): The first row or column of the window.
+        total (int): The number of rows or columns of the table model.
+        visible_count (int): The number of fully visible rows or columns.
+    """
+	scroll_bar.setRange(0, max(0, total - visible_count))
+	scroll_bar.setPageStep(visible_count)
+	scroll_bar.setSingleStep(1)
+	scroll_bar.setValue(first)
+
+
 class TableViewOptimize:
 	"""
     Configuration settings for optimizing table view performance.
 
+    When optimization is enabled on an axis, the view shows a window of view_length rows or columns of the model. The scroll bar of the axis spans the whole model and moves the window, so layout and paint only ever deal with view_length sections. view_length should be at least the number of sections that fit on screen.
+
     Attributes:
         optimize_enabled (bool): Whether optimization is enabled. Defaults to False.
-        view_length (int): The number of rows to display. Defaults to 100.
+        view_length (int): The number of rows or columns in the window. Defaults to 100.
     """
 	
 	def __init__(self, optimize_enabled: bool = False, view_length: int = 100):
@@ -30,12 +82,86 @@ class TableViewOptimize:
 
         Args:
             optimize_enabled (bool): Enables/disables optimization.
-            view_length (int): Number of rows to display when optimized.
+            view_length (int): Number of rows or columns in the window when optimized.
         """
 		self.optimize_enabled = optimize_enabled
 		self.view_length = view_length
 
 
+class TableRowSizing:
+	"""
+    Configuration settings for the row heights of a table view.
+
+    Attributes:
+        strategy (typing.Literal["contents", "sampled", "uniform"]): How row heights are computed. "contents" lets Qt measure every cell of every row on each reset, "sampled" gives every row the tallest height among sample_size evenly spaced rows, "uniform" gives every row default_height and grows only the visible rows that need more. Defaults to "sampled", so resetting a large table does not measure every row.
+        sample_size (int): The number of rows measured by the "sampled" strategy. Defaults to 200.
+        default_height (typing.Optional[int]): The row height of the "uniform" strategy. Defaults to None (the default section size of the vertical header).
+        cache_size (int): The maximum number of measured row heights kept by content hash. Defaults to 65536.
+    """
+	
+	def __init__(
+			self,
+			strategy: typing.Literal["contents", "sampled", "uniform"] = "sampled",
+			sample_size: int = 200,
+			default_height: typing.Optional[int] = None,
+			cache_size: int = 65536
+	):
+		"""
+        Initializes a TableRowSizing object.
+
+        Args:
+            strategy (typing.Literal["contents", "sampled", "uniform"]): How row heights are computed.
+            sample_size (int): The number of rows measured by the "sampled" strategy.
+            default_height (typing.Optional[int]): The row height of the "uniform" strategy.
+            cache_size (int): The maximum number of measured row heights kept by content hash.
+        """
+		self.strategy = strategy
+		self.sample_size = sample_size
+		self.default_height = default_height
+		self.cache_size = cache_size
+
+
+class TableViewState:
+	"""
+    The state of a table view saved across a model reset, with rows identified by key.
+
+    Attributes:
+        selected_ranges (list[tuple[numpy.ndarray, int, int]]): The keys of the rows and the first and last source column of every selected range.
+        current_key (typing.Any): The key of the row of the current index, or None.
+        current_column (int): The source column of the current index, or -1.
+        top_key (typing.Any): The key of the top visible row, or None.
+        sort_column (typing.Optional[str]): The label of the sorted column, or None if the view is not sorted.
+        sort_order (Qt.SortOrder): The sort order.
+    """
+	
+	def __init__(
+			self,
+			selected_ranges: list[tuple[numpy.ndarray, int, int]],
+			current_key: typing.Any,
+			current_column: int,
+			top_key: typing.Any,
+			sort_column: typing.Optional[str],
+			sort_order: Qt.SortOrder
+	):
+		"""
+        Initializes a TableViewState object.
+
+        Args:
+            selected_ranges (list[tuple[numpy.ndarray, int, int]]): The keys and source columns of every selected range.
+            current_key (typing.Any): The key of the row of the current index.
+            current_column (int): The source column of the current index.
+            top_key (typing.Any): The key of the top visible row.
+            sort_column (typing.Optional[str]): The label of the sorted column.
+            sort_order (Qt.SortOrder): The sort order.
+        """
+		self.selected_ranges = selected_ranges
+		self.current_key = current_key
+		self.current_column = current_column
+		self.top_key = top_key
+		self.sort_column = sort_column
+		self.sort_order = sort_order
+
+
 class TableViewInit(WidgetInit):
 	"""
     Data class to hold initialization parameters for table views.
@@ -55,6 +181,8 @@ class TableViewInit(WidgetInit):
         sorting_enabled (bool): Whether sorting is enabled. Defaults to True.
         vertical_optimize (TableViewOptimize): Vertical optimization settings. Defaults to a default TableViewOptimize.
         horizontal_optimize (TableViewOptimize): Horizontal optimization settings. Defaults to a default TableViewOptimize.
+        row_sizing (TableRowSizing): Row height settings. Defaults to a default TableRowSizing.
+        key_column (typing.Optional[typing.Hashable]): The column identifying rows across resets. Defaults to None (the diff_key_column of the table model, or the index of the data).
     """
 	
 	def __init__(
@@ -72,7 +200,9 @@ class TableViewInit(WidgetInit):
 			font: QFont = PyFont(),
 			sorting_enabled: bool = True,
 			vertical_optimize: TableViewOptimize = TableViewOptimize(),
-			horizontal_optimize: TableViewOptimize = TableViewOptimize()
+			horizontal_optimize: TableViewOptimize = TableViewOptimize(),
+			row_sizing: TableRowSizing = TableRowSizing(),
+			key_column: typing.Optional[typing.Hashable] = None
 	):
 		"""
         Initializes a TableViewInit object.
@@ -92,6 +222,8 @@ class TableViewInit(WidgetInit):
             sorting_enabled (bool): Whether sorting is enabled.
             vertical_optimize (TableViewOptimize): Vertical optimization settings.
             horizontal_optimize (TableViewOptimize): Horizontal optimization settings.
+            row_sizing (TableRowSizing): Row height settings.
+            key_column (typing.Optional[typing.Hashable]): The column identifying rows across resets.
         """
 		super().__init__(
 				name,
@@ -110,11 +242,26 @@ class TableViewInit(WidgetInit):
 		self.sorting_enabled = sorting_enabled
 		self.vertical_optimize = vertical_optimize
 		self.horizontal_optimize = horizontal_optimize
+		self.row_sizing = row_sizing
+		self.key_column = key_column
 
 
 class PyTableView(QTableView, PyWidget):
 	"""
     A custom table view class with enhanced features.
+
+    Attributes:
+        table_model (typing.Union[PySortFilterProxyModel, PyAbstractTableModel]): The displayed table model.
+        window_model (typing.Optional[PyTableWindowModel]): The window over the table model, or None if optimization is disabled on both axes.
+        updating_geometries (bool): Whether the base view is laying out the window, during which scrolling does not move the window.
+        vertical_optimize (TableViewOptimize): Vertical optimization settings.
+        horizontal_optimize (TableViewOptimize): Horizontal optimization settings.
+        row_sizing (TableRowSizing): Row height settings.
+        row_height_cache (dict[int, int]): The measured row heights, keyed by a hash of the font and the displayed texts of the row.
+        minimum_row_height (int): The smallest height of a measured row: the default_height of row_sizing, or the default section size of the vertical header before any row was measured.
+        key_column (typing.Optional[typing.Hashable]): The column identifying rows across resets.
+        user_sorted (bool): Whether the sort indicator was changed since the view was created, so that the sort is applied again after a reset.
+        pending_view_state (typing.Optional[TableViewState]): The state whose rows are restored once the asynchronous sort filter proxy model finishes its computations.
     """
 	
 	def __init__(
@@ -134,19 +281,270 @@ class PyTableView(QTableView, PyWidget):
 		self.table_model = table_model
 		self.vertical_optimize = table_view_init.vertical_optimize
 		self.horizontal_optimize = table_view_init.horizontal_optimize
+		self.row_sizing = table_view_init.row_sizing
+		self.row_height_cache: dict[int, int] = {}
+		self.minimum_row_height = (
+				self.row_sizing.default_height
+				if self.row_sizing.default_height is not None
+				else self.verticalHeader().defaultSectionSize()
+		)
+		self.key_column = table_view_init.key_column
 		self.sort_order = Qt.SortOrder.AscendingOrder
 		self.last_sorted_column = self.table_model.headerData(0, Qt.Orientation.Horizontal, Qt.ItemDataRole.UserRole)
-		self.setModel(self.table_model)
+		self.window_model = None
+		self.updating_geometries = False
+		self.user_sorted = False
+		self.pending_view_state: typing.Optional[TableViewState] = None
+		
+		if self.vertical_optimize.optimize_enabled or self.horizontal_optimize.optimize_enabled:
+			self.window_model = PyTableWindowModel(
+					TableWindowModelInit(
+							self.table_model,
+							self.vertical_optimize.view_length if self.vertical_optimize.optimize_enabled else None,
+							self.horizontal_optimize.view_length if self.horizontal_optimize.optimize_enabled else None
+					)
+			)
+			
+			self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+			self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+			self.table_model.rowsInserted.connect(self.updateGeometries)
+			self.table_model.rowsRemoved.connect(self.updateGeometries)
+			self.table_model.columnsInserted.connect(self.updateGeometries)
+			self.table_model.columnsRemoved.connect(self.updateGeometries)
+			self.table_model.modelReset.connect(self.updateGeometries)
+		
+		self.setModel(self.get_view_model())
 		self.setFont(table_view_init.font)
 		self.setSortingEnabled(table_view_init.sorting_enabled)
 		self.horizontalHeader().sectionClicked.connect(self.h_header_clicked)
+		self.horizontalHeader().sortIndicatorChanged.connect(self.sort_indicator_changed)
+		
+		if isinstance(self.table_model, PySortFilterProxyModel):
+			self.table_model.busyChanged.connect(self.proxy_busy_changed)
+		
+		if self.row_sizing.strategy == "uniform":
+			self.verticalScrollBar().valueChanged.connect(self.measure_visible_rows)
+			self.verticalScrollBar().rangeChanged.connect(self.measure_visible_rows)
+		
 		self.resize_columns()
+	
+	def get_view_model(self) -> typing.Union[PyTableWindowModel, PySortFilterProxyModel, PyAbstractTableModel]:
+		"""
+        Returns the model set on the view.
+
+        Returns:
+            typing.Union[PyTableWindowModel, PySortFilterProxyModel, PyAbstractTableModel]: The window model if optimization is enabled, the table model otherwise.
+        """
+		return self.window_model if self.window_model is not None else self.table_model
+	
+	def get_key_rows(self, key_index: pandas.Index, keys: typing.Any) -> numpy.ndarray:
+		"""
+        Finds the source rows of keys.
+
+        Args:
+            key_index (pandas.Index): The keys of every source row.
+            keys (typing.Any): The keys to find.
+
+        Returns:
+            numpy.ndarray: The rows holding the keys. Keys that are gone are skipped.
+        """
+		if key_index.is_unique:
+			rows = key_index.get_indexer(keys)
+			
+			return rows[rows >= 0]
 		
-		if self.vertical_optimize.optimize_enabled or self.horizontal_optimize.optimize_enabled:
-			if isinstance(table_model, PyAbstractTableModel):
-				self.current_data = deepcopy(table_model.table_data)
-			else:
-				self.current_data = deepcopy(table_model.table_model.table_data)
+		return numpy.flatnonzero(key_index.isin(keys))
+	
+	def get_proxy_models(self) -> list[typing.Union[PyTableWindowModel, PySortFilterProxyModel]]:
+		"""
+        Returns the proxy models between the view and the source table model.
+
+        Returns:
+            list[typing.Union[PyTableWindowModel, PySortFilterProxyModel]]: The proxy models, from the view to the source.
+        """
+		proxy_models = [self.window_model] if self.window_model is not None else []
+		
+		if isinstance(self.table_model, PySortFilterProxyModel):
+			proxy_models.append(self.table_model)
+		
+		return proxy_models
+	
+	def get_row_keys(self, rows: typing.Optional[numpy.ndarray] = None) -> typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]:
+		"""
+        Returns the keys of source rows.
+
+        Args:
+            rows (typing.Optional[numpy.ndarray]): The source rows. If None, the keys of every row are returned.
+
+        Returns:
+            typing.Union[numpy.ndarray, pandas.api.extensions.ExtensionArray]: The values of the key column, or of the index of the data if there is no key column.
+        """
+		source_model = self.get_source_model()
+		key_column = self.key_column if self.key_column is not None else source_model.diff_key_column
+		
+		if key_column is not None and key_column in source_model.table_data.columns:
+			keys = source_model.column_values[source_model.table_data.columns.get_loc(key_column)]
+		else:
+			keys = source_model.index_values
+		
+		return keys if rows is None else keys[rows]
+	
+	def get_row_height(self, row: int) -> int:
+		"""
+        Measures the height a row needs, reusing the height of a previously measured row with the same font, texts and column widths.
+
+        The texts are measured through the shared text_measurer cache, with the font and alignment of every cell and the word wrap of the view. The focus frame margins and the grid line are added like the item delegate and the view do, and the height is at least minimum_row_height.
+
+        Args:
+            row (int): The row in the view model.
+
+        Returns:
+            int: The height of the row.
+        """
+		model = self.get_view_model()
+		texts = tuple(str(model.index(row, column).data()) for column in range(model.columnCount()))
+		widths = tuple(self.columnWidth(column) for column in range(model.columnCount()))
+		content_hash = hash((self.font().key(), texts, widths))
+		height = self.row_height_cache.get(content_hash)
+		
+		if height is None:
+			if len(self.row_height_cache) >= self.row_sizing.cache_size:
+				self.row_height_cache.clear()
+			
+			horizontal_margin = 2 * (self.style().pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, self) + 1)
+			vertical_margin = 2 * self.style().pixelMetric(QStyle.PixelMetric.PM_FocusFrameVMargin, None, self)
+			text_flags = Qt.TextFlag.TextWordWrap if self.wordWrap() else Qt.TextFlag.TextSingleLine
+			height = 0
+			
+			for column, (text, width) in enumerate(zip(texts, widths)):
+				index = model.index(row, column)
+				font = index.data(Qt.ItemDataRole.FontRole) or self.font()
+				alignment = index.data(Qt.ItemDataRole.TextAlignmentRole) or Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+				
+				height = max(
+						height,
+						text_measurer.measure(text, font, max(1, width - horizontal_margin), alignment | text_flags).height()
+				)
+			
+			height = max(self.minimum_row_height, height + vertical_margin + int(self.showGrid()))
+			self.row_height_cache[content_hash] = height
+		
+		return height
+	
+	def get_source_model(self) -> PyAbstractTableModel:
+		"""
+        Returns the table model holding the data.
+
+        Returns:
+            PyAbstractTableModel: The table model, or the source model of the sort filter proxy model.
+        """
+		if isinstance(self.table_model, PySortFilterProxyModel):
+			return self.table_model.table_model
+		
+		return self.table_model
+	
+	def get_visible_count(self, header: QHeaderView) -> int:
+		"""
+        Returns the number of window sections fully visible along a header.
+
+        Args:
+            header (QHeaderView): The vertical or horizontal header.
+
+        Returns:
+            int: The number of fully visible sections, at least 1.
+        """
+		length = header.viewport().width() if header.orientation() == Qt.Orientation.Horizontal else header.viewport().height()
+		last_section = header.logicalIndexAt(length - 1)
+		
+		if last_section < 0:
+			return max(1, header.count())
+		
+		if header.sectionViewportPosition(last_section) + header.sectionSize(last_section) > length:
+			return max(1, header.visualIndex(last_section))
+		
+		return header.visualIndex(last_section) + 1
+	
+	def measure_visible_rows(self):
+		"""Grows the visible rows whose contents need more than the default height, and shrinks the ones grown before back to it."""
+		header = self.verticalHeader()
+		first_row = max(0, header.logicalIndexAt(0))
+		last_row = header.logicalIndexAt(header.viewport().height() - 1)
+		
+		if last_row < 0:
+			last_row = header.count() - 1
+		
+		for row in range(first_row, last_row + 1):
+			height = max(header.defaultSectionSize(), self.get_row_height(row))
+			
+			if header.sectionSize(row) != height:
+				header.resizeSection(row, height)
+	
+	def move_window(self):
+		"""
+        Moves the window to the positions of the scroll bars of the windowed axes.
+
+        The selection and the current index are shifted with the window, so they stay on the same cells of the table model; the parts that leave the window are dropped.
+        """
+		first_row = self.verticalScrollBar().value() if self.window_model.row_window_length is not None else 0
+		first_column = self.horizontalScrollBar().value() if self.window_model.column_window_length is not None else 0
+		
+		row_shift = first_row - self.window_model.first_row
+		column_shift = first_column - self.window_model.first_column
+		
+		if not row_shift and not column_shift:
+			return
+		
+		current_index = self.currentIndex()
+		selection = self.selectionModel().selection()
+		
+		self.window_model.set_window(first_row, first_column)
+		
+		shifted_selection = QItemSelection()
+		
+		for selection_range in selection:
+			top = max(selection_range.top() - row_shift, 0)
+			left = max(selection_range.left() - column_shift, 0)
+			bottom = min(selection_range.bottom() - row_shift, self.window_model.row_count - 1)
+			right = min(selection_range.right() - column_shift, self.window_model.column_count - 1)
+			
+			if top <= bottom and left <= right:
+				shifted_selection.select(self.window_model.index(top, left), self.window_model.index(bottom, right))
+		
+		self.selectionModel().select(shifted_selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+		
+		if current_index.isValid():
+			self.selectionModel().setCurrentIndex(
+					self.window_model.index(current_index.row() - row_shift, current_index.column() - column_shift),
+					QItemSelectionModel.SelectionFlag.NoUpdate
+			)
+	
+	def moveCursor(
+			self,
+			cursor_action: QAbstractItemView.CursorAction,
+			modifiers: Qt.KeyboardModifier
+	) -> QModelIndex:
+		"""
+        Scrolls a windowed axis before the cursor would leave the start of the window.
+
+        Args:
+            cursor_action (QAbstractItemView.CursorAction): The cursor movement.
+            modifiers (Qt.KeyboardModifier): The pressed keyboard modifiers.
+
+        Returns:
+            QModelIndex: The index the cursor moves to.
+        """
+		if self.window_model is not None and self.currentIndex().isValid():
+			if self.window_model.row_window_length is not None and self.currentIndex().row() == 0:
+				if cursor_action == QAbstractItemView.CursorAction.MoveUp:
+					self.verticalScrollBar().setValue(self.verticalScrollBar().value() - 1)
+				elif cursor_action == QAbstractItemView.CursorAction.MovePageUp:
+					self.verticalScrollBar().setValue(self.verticalScrollBar().value() - self.verticalScrollBar().pageStep())
+			
+			if self.window_model.column_window_length is not None and self.currentIndex().column() == 0:
+				if cursor_action == QAbstractItemView.CursorAction.MoveLeft:
+					self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - 1)
+		
+		return super().moveCursor(cursor_action, modifiers)
 	
 	def sort_table(self, column_index: int):
 		"""
@@ -171,24 +569,271 @@ class PyTableView(QTableView, PyWidget):
         """
 		self.sort_table(column_index)
 	
+	def sort_indicator_changed(self, section: int, order: Qt.SortOrder):
+		"""
+        Records that the view was sorted, so that the sort is applied again after a reset.
+
+        Args:
+            section (int): The sorted section.
+            order (Qt.SortOrder): The sort order.
+        """
+		self.user_sorted = True
+	
 	def resize_columns(self):
-		"""Resizes columns to fit content."""
-		for i in range(self.table_model.columnCount()):
+		"""Resizes columns to fit content and sizes rows with the row sizing strategy."""
+		for i in range(self.get_view_model().columnCount()):
 			self.horizontalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.Stretch)
 		
-		for i in range(self.table_model.rowCount()):
-			self.verticalHeader().setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+		if self.row_sizing.strategy == "contents":
+			self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+		elif self.row_sizing.strategy == "sampled":
+			row_count = self.get_view_model().rowCount()
+			sample_rows = range(0, row_count, max(1, row_count // max(1, self.row_sizing.sample_size)))
+			
+			self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+			self.verticalHeader().setDefaultSectionSize(
+					max((self.get_row_height(row) for row in sample_rows), default=self.verticalHeader().defaultSectionSize())
+			)
+		else:
+			self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+			
+			if self.row_sizing.default_height is not None:
+				self.verticalHeader().setDefaultSectionSize(self.row_sizing.default_height)
+			
+			self.measure_visible_rows()
+	
+	def proxy_busy_changed(self, busy: bool):
+		"""
+        Restores the rows of a pending state once the asynchronous sort filter proxy model finished its computations.
+
+        Args:
+            busy (bool): Whether the proxy model is still computing.
+        """
+		if busy or self.pending_view_state is None:
+			return
+		
+		state = self.pending_view_state
+		self.pending_view_state = None
+		
+		self.executeDelayedItemsLayout()
+		self.restore_view_rows(state)
 	
 	def reset_model(self, data: pandas.DataFrame):
 		"""
-        Resets the table model with new data.
+        Resets the table model with new data, keeping the selection, the current index, the top visible row and the sort.
 
         Args:
             data (pandas.DataFrame): The new data for the model.
         """
+		state = self.pending_view_state if self.pending_view_state is not None else self.save_view_state()
+		
 		self.table_model.reset_table_data(data)
+		self.resize_columns()
+		self.restore_view_state(state)
+	
+	def restore_view_state(self, state: TableViewState):
+		"""
+        Restores a saved state after the data changed.
+
+        The sort is applied again, then the rows are restored with restore_view_rows. If an asynchronous sort filter proxy model is still computing its filters or sort, the rows are restored once it finishes.
+
+        Args:
+            state (TableViewState): The saved state.
+        """
+		source_model = self.get_source_model()
 		
-		self.setModel(self.table_model)
-		self.reset()
+		if state.sort_column in source_model.horizontal_header_labels:
+			sort_column = source_model.horizontal_header_labels.index(state.sort_column)
+			sort_section = sort_column - (self.window_model.first_column if self.window_model is not None else 0)
+			
+			self.table_model.sort(sort_column, state.sort_order)
+			
+			header_blocked = self.horizontalHeader().blockSignals(True)
+			self.horizontalHeader().setSortIndicator(sort_section, state.sort_order)
+			self.horizontalHeader().blockSignals(header_blocked)
 		
-		self.resize_columns()
+		self.executeDelayedItemsLayout()
+		
+		if isinstance(self.table_model, PySortFilterProxyModel) and self.table_model.busy:
+			self.pending_view_state = state
+			return
+		
+		self.restore_view_rows(state)
+	
+	def restore_view_rows(self, state: TableViewState):
+		"""
+        Restores the top row, the selection and the current index of a saved state.
+
+        They are found by key in one vectorized lookup and mapped to the view range by range. Rows whose key is gone are dropped.
+
+        Args:
+            state (TableViewState): The saved state.
+        """
+		source_model = self.get_source_model()
+		proxy_models = self.get_proxy_models()
+		key_index = pandas.Index(self.get_row_keys())
+		
+		if state.top_key is not None:
+			top_rows = self.get_key_rows(key_index, [state.top_key])
+			
+			if top_rows.size:
+				top_index = source_model.index(int(top_rows[0]), 0)
+				
+				if isinstance(self.table_model, PySortFilterProxyModel):
+					top_index = self.table_model.mapFromSource(top_index)
+				
+				if self.window_model is not None and self.window_model.row_window_length is not None:
+					self.verticalScrollBar().setValue(top_index.row())
+				elif top_index.isValid():
+					self.scrollTo(
+							self.window_model.mapFromSource(top_index) if self.window_model is not None else top_index,
+							QAbstractItemView.ScrollHint.PositionAtTop
+					)
+		
+		selection = QItemSelection()
+		
+		for keys, left, right in state.selected_ranges:
+			for first_row, last_row in get_contiguous_ranges(self.get_key_rows(key_index, keys)):
+				selection.select(source_model.index(first_row, left), source_model.index(last_row, right))
+		
+		current_index = QModelIndex()
+		
+		if state.current_key is not None:
+			current_rows = self.get_key_rows(key_index, [state.current_key])
+			
+			if current_rows.size:
+				current_index = source_model.index(int(current_rows[0]), state.current_column)
+		
+		for proxy_model in reversed(proxy_models):
+			selection = proxy_model.mapSelectionFromSource(selection)
+			current_index = proxy_model.mapFromSource(current_index)
+		
+		self.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+		
+		if current_index.isValid():
+			self.selectionModel().setCurrentIndex(current_index, QItemSelectionModel.SelectionFlag.NoUpdate)
+	
+	def save_view_state(self) -> TableViewState:
+		"""
+        Saves the selection, the current index, the top visible row and the sort, with rows identified by key.
+
+        The selection is mapped to the source table model range by range, and the keys of every range are taken with one array lookup.
+
+        Returns:
+            TableViewState: The saved state.
+        """
+		selection = self.selectionModel().selection()
+		current_index = self.currentIndex()
+		top_index = self.indexAt(self.viewport().rect().topLeft())
+		
+		for proxy_model in self.get_proxy_models():
+			selection = proxy_model.mapSelectionToSource(selection)
+			current_index = proxy_model.mapToSource(current_index)
+			top_index = proxy_model.mapToSource(top_index)
+		
+		sort_column = None
+		sort_section = self.horizontalHeader().sortIndicatorSection()
+		
+		if self.isSortingEnabled() and self.user_sorted and 0 <= sort_section < self.get_view_model().columnCount():
+			sort_column = self.get_view_model().headerData(sort_section, Qt.Orientation.Horizontal, Qt.ItemDataRole.UserRole)
+		
+		return TableViewState(
+				[
+					(self.get_row_keys(numpy.arange(selection_range.top(), selection_range.bottom() + 1)), selection_range.left(), selection_range.right())
+					for selection_range in selection
+				],
+				self.get_row_keys(numpy.array([current_index.row()]))[0] if current_index.isValid() else None,
+				current_index.column(),
+				self.get_row_keys(numpy.array([top_index.row()]))[0] if top_index.isValid() else None,
+				sort_column,
+				self.horizontalHeader().sortIndicatorOrder()
+		)
+	
+	def scrollContentsBy(self, dx: int, dy: int):
+		"""
+        Moves the window instead of the contents along the windowed axes.
+
+        Args:
+            dx (int): The horizontal scroll distance.
+            dy (int): The vertical scroll distance.
+        """
+		if self.window_model is not None:
+			if self.window_model.row_window_length is not None:
+				dy = 0
+			
+			if self.window_model.column_window_length is not None:
+				dx = 0
+			
+			if not self.updating_geometries:
+				self.move_window()
+		
+		super().scrollContentsBy(dx, dy)
+	
+	def scrollTo(self, index: QModelIndex, hint: QAbstractItemView.ScrollHint = QAbstractItemView.ScrollHint.EnsureVisible):
+		"""
+        Scrolls to an index. Along the windowed axes the window is moved so that the index lands where the hint asks.
+
+        Args:
+            index (QModelIndex): The window index to show.
+            hint (QAbstractItemView.ScrollHint): Where the index should be placed.
+        """
+		if self.window_model is None or not index.isValid():
+			super().scrollTo(index, hint)
+			return
+		
+		first_row, first_column = self.window_model.first_row, self.window_model.first_column
+		
+		if self.window_model.row_window_length is not None:
+			self.verticalScrollBar().setValue(
+					self.verticalScrollBar().value()
+					+ get_scroll_shift(index.row(), self.get_visible_count(self.verticalHeader()), hint)
+			)
+		
+		if self.window_model.column_window_length is not None:
+			self.horizontalScrollBar().setValue(
+					self.horizontalScrollBar().value()
+					+ get_scroll_shift(index.column(), self.get_visible_count(self.horizontalHeader()), hint)
+			)
+		
+		super().scrollTo(
+				self.window_model.index(
+						index.row() - self.window_model.first_row + first_row,
+						index.column() - self.window_model.first_column + first_column
+				),
+				QAbstractItemView.ScrollHint.EnsureVisible
+		)
+	
+	def updateGeometries(self):
+		"""Updates the view geometry, then maps the scroll bars of the windowed axes onto the full table model."""
+		if getattr(self, "window_model", None) is None:
+			super().updateGeometries()
+			return
+		
+		updating_geometries = self.updating_geometries
+		self.updating_geometries = True
+		vertical_blocked = self.verticalScrollBar().blockSignals(self.window_model.row_window_length is not None)
+		horizontal_blocked = self.horizontalScrollBar().blockSignals(self.window_model.column_window_length is not None)
+		
+		super().updateGeometries()
+		
+		self.verticalScrollBar().blockSignals(vertical_blocked)
+		self.horizontalScrollBar().blockSignals(horizontal_blocked)
+		self.updating_geometries = updating_geometries
+		
+		if self.window_model.row_window_length is not None:
+			self.verticalHeader().setOffset(0)
+			update_window_scroll_bar(
+					self.verticalScrollBar(),
+					self.window_model.first_row,
+					self.table_model.rowCount(),
+					self.get_visible_count(self.verticalHeader())
+			)
+		
+		if self.window_model.column_window_length is not None:
+			self.horizontalHeader().setOffset(0)
+			update_window_scroll_bar(
+					self.horizontalScrollBar(),
+					self.window_model.first_column,
+					self.table_model.columnCount(),
+					self.get_visible_count(self.horizontalHeader())
+			)
@@ -0,0 +1,430 @@
+import typing
+from PyQt6.QtCore import (
+	QAbstractItemModel,
+	QAbstractProxyModel,
+	QItemSelection,
+	QModelIndex,
+	QPersistentModelIndex,
+	Qt
+)
+
+
+def get_window_count(first: int, length: typing.Optional[int], total: int) -> int:
+	"""
+    Returns the number of rows or columns of a window.
+
+    Args:
+        first (int): The first source row or column of the window.
+        length (typing.Optional[int]): The length of the window, or None if the axis is not windowed.
+        total (int): The number of rows or columns of the source model.
+
+    Returns:
+        int: The number of rows or columns exposed by the window.
+    """
+	if length is None:
+		return total
+	
+	return max(0, min(length, total - first))
+
+
+class TableWindowModelInit:
+	"""
+    Data class to hold initialization parameters for table window models.
+
+    Attributes:
+        table_model (QAbstractItemModel): The table model to expose a window of.
+        row_window_length (typing.Optional[int]): The number of rows of the window. Defaults to None (every row).
+        column_window_length (typing.Optional[int]): The number of columns of the window. Defaults to None (every column).
+    """
+	
+	def __init__(
+			self,
+			table_model: QAbstractItemModel,
+			row_window_length: typing.Optional[int] = None,
+			column_window_length: typing.Optional[int] = None
+	):
+		"""
+        Initializes a TableWindowModelInit object.
+
+        Args:
+            table_model (QAbstractItemModel): The table model to expose a window of.
+            row_window_length (typing.Optional[int]): The number of rows of the window.
+            column_window_length (typing.Optional[int]): The number of columns of the window.
+        """
+		self.table_model = table_model
+		self.row_window_length = row_window_length
+		self.column_window_length = column_window_length
+
+
+class PyTableWindowModel(QAbstractProxyModel):
+	"""
+    A proxy model exposing a fixed size window of rows and columns of a table model.
+
+    The window only stores its position: data, headers and sorting are forwarded to the table model with the position added. Moving the window emits data changed signals over the window, and only changes the row or column count when the window reaches the end of the table. Layout changes of the table model, such as sorts, are forwarded and move the persistent indexes of the window, such as the selection of the view, with their source cells; the ones whose cells leave the window are dropped.
+
+    Attributes:
+        table_model (QAbstractItemModel): The table model the window is taken from.
+        row_window_length (typing.Optional[int]): The number of rows of the window, or None if rows are not windowed.
+        column_window_length (typing.Optional[int]): The number of columns of the window, or None if columns are not windowed.
+        first_row (int): The first source row of the window.
+        first_column (int): The first source column of the window.
+        row_count (int): The number of rows exposed by the window.
+        column_count (int): The number of columns exposed by the window.
+        layout_indexes (list[tuple[QModelIndex, QPersistentModelIndex]]): The persistent indexes of the window and their source cells, saved while the layout of the table model changes.
+
+    :Usage:
+        window_model = PyTableWindowModel(TableWindowModelInit(table_model, row_window_length=100))
+        table_view.setModel(window_model)
+        window_model.set_window(first_row=250000, first_column=0)
+    """
+	
+	def __init__(self, table_window_model_init: TableWindowModelInit):
+		"""
+        Initializes a PyTableWindowModel object.
+
+        Args:
+            table_window_model_init (TableWindowModelInit): Initialization parameters for the window model.
+        """
+		super().__init__()
+		
+		self.table_model = table_window_model_init.table_model
+		self.row_window_length = table_window_model_init.row_window_length
+		self.column_window_length = table_window_model_init.column_window_length
+		self.first_row = 0
+		self.first_column = 0
+		self.row_count = 0
+		self.column_count = 0
+		self.layout_indexes: list[tuple[QModelIndex, QPersistentModelIndex]] = []
+		
+		self.table_model.dataChanged.connect(self.source_data_changed)
+		self.table_model.headerDataChanged.connect(self.source_header_data_changed)
+		self.table_model.rowsInserted.connect(self.refresh_window)
+		self.table_model.rowsRemoved.connect(self.refresh_window)
+		self.table_model.columnsInserted.connect(self.refresh_window)
+		self.table_model.columnsRemoved.connect(self.refresh_window)
+		self.table_model.layoutAboutToBeChanged.connect(self.source_layout_about_to_be_changed)
+		self.table_model.layoutChanged.connect(self.source_layout_changed)
+		self.table_model.modelAboutToBeReset.connect(self.beginResetModel)
+		self.table_model.modelReset.connect(self.source_model_reset)
+		
+		self.setSourceModel(self.table_model)
+		self.update_counts()
+	
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		"""
+        Returns the number of columns of the window.
+
+        Args:
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            int: The number of columns.
+        """
+		return 0 if parent.isValid() else self.column_count
+	
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
+		"""
+        Returns the data of the source cell under a window cell.
+
+        Args:
+            index (QModelIndex): The window index.
+            role (int): The data role.
+
+        Returns:
+            typing.Any: The data of the source cell.
+        """
+		if not index.isValid():
+			return None
+		
+		return self.table_model.data(
+				self.table_model.index(index.row() + self.first_row, index.column() + self.first_column),
+				role
+		)
+	
+	def headerData(
+			self,
+			section: int,
+			orientation: Qt.Orientation,
+			role: int = Qt.ItemDataRole.DisplayRole
+	) -> typing.Any:
+		"""
+        Returns the header data of the source section under a window section.
+
+        Args:
+            section (int): The window section.
+            orientation (Qt.Orientation): The header orientation.
+            role (int): The data role.
+
+        Returns:
+            typing.Any: The header data of the source section.
+        """
+		if orientation == Qt.Orientation.Horizontal:
+			return self.table_model.headerData(section + self.first_column, orientation, role)
+		
+		return self.table_model.headerData(section + self.first_row, orientation, role)
+	
+	def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+		"""
+        Returns the window index of a cell.
+
+        Args:
+            row (int): The window row.
+            column (int): The window column.
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            QModelIndex: The window index, or an invalid index outside the window.
+        """
+		if parent.isValid() or not (0 <= row < self.row_count and 0 <= column < self.column_count):
+			return QModelIndex()
+		
+		return self.createIndex(row, column)
+	
+	def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+		"""
+        Maps a source index to the window.
+
+        Args:
+            source_index (QModelIndex): The source index.
+
+        Returns:
+            QModelIndex: The window index, or an invalid index if the source cell is outside the window.
+        """
+		if not source_index.isValid():
+			return QModelIndex()
+		
+		return self.index(source_index.row() - self.first_row, source_index.column() - self.first_column)
+	
+	def mapSelectionFromSource(self, source_selection: QItemSelection) -> QItemSelection:
+		"""
+        Maps a source selection to the window by shifting its ranges, clipped to the window.
+
+        Args:
+            source_selection (QItemSelection): The source selection.
+
+        Returns:
+            QItemSelection: The window selection.
+        """
+		proxy_selection = QItemSelection()
+		
+		for selection_range in source_selection:
+			top = max(selection_range.top() - self.first_row, 0)
+			left = max(selection_range.left() - self.first_column, 0)
+			bottom = min(selection_range.bottom() - self.first_row, self.row_count - 1)
+			right = min(selection_range.right() - self.first_column, self.column_count - 1)
+			
+			if top <= bottom and left <= right:
+				proxy_selection.select(self.index(top, left), self.index(bottom, right))
+		
+		return proxy_selection
+	
+	def mapSelectionToSource(self, proxy_selection: QItemSelection) -> QItemSelection:
+		"""
+        Maps a window selection to the source model by shifting its ranges.
+
+        Args:
+            proxy_selection (QItemSelection): The window selection.
+
+        Returns:
+            QItemSelection: The source selection.
+        """
+		source_selection = QItemSelection()
+		
+		for selection_range in proxy_selection:
+			source_selection.select(
+					self.mapToSource(selection_range.topLeft()),
+					self.mapToSource(selection_range.bottomRight())
+			)
+		
+		return source_selection
+	
+	def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+		"""
+        Maps a window index to the source model.
+
+        Args:
+            proxy_index (QModelIndex): The window index.
+
+        Returns:
+            QModelIndex: The source index.
+        """
+		if not proxy_index.isValid():
+			return QModelIndex()
+		
+		return self.table_model.index(proxy_index.row() + self.first_row, proxy_index.column() + self.first_column)
+	
+	def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+		"""
+        Returns the parent of an index. Table indexes have no parent.
+
+        Args:
+            index (QModelIndex): The index.
+
+        Returns:
+            QModelIndex: An invalid index.
+        """
+		return QModelIndex()
+	
+	def refresh_window(self):
+		"""Adjusts the window to the current size of the source model and reports its content as changed."""
+		self.set_window(self.first_row, self.first_column)
+	
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		"""
+        Returns the number of rows of the window.
+
+        Args:
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            int: The number of rows.
+        """
+		return 0 if parent.isValid() else self.row_count
+	
+	def set_window(self, first_row: int, first_column: int):
+		"""
+        Moves the window.
+
+        The first row and column are clamped to the source model. Rows or columns are inserted or removed at the end of the window only when its size changes; the rest of the window is reported through dataChanged and headerDataChanged.
+
+        Args:
+            first_row (int): The first source row of the window.
+            first_column (int): The first source column of the window.
+        """
+		source_rows = self.table_model.rowCount()
+		source_columns = self.table_model.columnCount()
+		
+		self.first_row = max(0, min(first_row, source_rows - 1)) if self.row_window_length is not None else 0
+		self.first_column = max(0, min(first_column, source_columns - 1)) if self.column_window_length is not None else 0
+		
+		row_count = get_window_count(self.first_row, self.row_window_length, source_rows)
+		column_count = get_window_count(self.first_column, self.column_window_length, source_columns)
+		
+		if row_count < self.row_count:
+			self.beginRemoveRows(QModelIndex(), row_count, self.row_count - 1)
+			self.row_count = row_count
+			self.endRemoveRows()
+		elif row_count > self.row_count:
+			self.beginInsertRows(QModelIndex(), self.row_count, row_count - 1)
+			self.row_count = row_count
+			self.endInsertRows()
+		
+		if column_count < self.column_count:
+			self.beginRemoveColumns(QModelIndex(), column_count, self.column_count - 1)
+			self.column_count = column_count
+			self.endRemoveColumns()
+		elif column_count > self.column_count:
+			self.beginInsertColumns(QModelIndex(), self.column_count, column_count - 1)
+			self.column_count = column_count
+			self.endInsertColumns()
+		
+		if self.row_count and self.column_count:
+			self.dataChanged.emit(self.index(0, 0), self.index(self.row_count - 1, self.column_count - 1))
+			self.headerDataChanged.emit(Qt.Orientation.Vertical, 0, self.row_count - 1)
+			self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.column_count - 1)
+	
+	def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+		"""
+        Sorts the source model by the source column under a window column.
+
+        Args:
+            column (int): The window column.
+            order (Qt.SortOrder): The sort order.
+        """
+		if column < 0:
+			return
+		
+		self.table_model.sort(column + self.first_column, order)
+	
+	def source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: typing.Iterable[int] = ()):
+		"""
+        Reports the changed source cells that lie inside the window.
+
+        Args:
+            top_left (QModelIndex): The top left changed source index.
+            bottom_right (QModelIndex): The bottom right changed source index.
+            roles (typing.Iterable[int]): The changed roles.
+        """
+		first_row = max(top_left.row() - self.first_row, 0)
+		last_row = min(bottom_right.row() - self.first_row, self.row_count - 1)
+		first_column = max(top_left.column() - self.first_column, 0)
+		last_column = min(bottom_right.column() - self.first_column, self.column_count - 1)
+		
+		if first_row <= last_row and first_column <= last_column:
+			self.dataChanged.emit(self.index(first_row, first_column), self.index(last_row, last_column), list(roles))
+	
+	def source_header_data_changed(self, orientation: Qt.Orientation, first: int, last: int):
+		"""
+        Reports the changed source header sections that lie inside the window.
+
+        Args:
+            orientation (Qt.Orientation): The header orientation.
+            first (int): The first changed source section.
+            last (int): The last changed source section.
+        """
+		if orientation == Qt.Orientation.Horizontal:
+			offset, count = self.first_column, self.column_count
+		else:
+			offset, count = self.first_row, self.row_count
+		
+		first, last = max(first - offset, 0), min(last - offset, count - 1)
+		
+		if first <= last:
+			self.headerDataChanged.emit(orientation, first, last)
+	
+	def source_layout_about_to_be_changed(
+			self,
+			parents: typing.Iterable[QPersistentModelIndex] = (),
+			hint: QAbstractItemModel.LayoutChangeHint = QAbstractItemModel.LayoutChangeHint.NoLayoutChangeHint
+	):
+		"""
+        Forwards the start of a layout change and saves the source cell of every persistent index of the window.
+
+        Args:
+            parents (typing.Iterable[QPersistentModelIndex]): The source parents of the changed layout.
+            hint (QAbstractItemModel.LayoutChangeHint): The layout change hint.
+        """
+		self.layoutAboutToBeChanged.emit([], hint)
+		self.layout_indexes = [
+			(index, QPersistentModelIndex(self.mapToSource(index)))
+			for index in self.persistentIndexList()
+		]
+	
+	def source_layout_changed(
+			self,
+			parents: typing.Iterable[QPersistentModelIndex] = (),
+			hint: QAbstractItemModel.LayoutChangeHint = QAbstractItemModel.LayoutChangeHint.NoLayoutChangeHint
+	):
+		"""
+        Moves every persistent index of the window to the new position of its source cell and forwards the end of the layout change. Adjusts the window afterwards if the size of the source model changed.
+
+        Args:
+            parents (typing.Iterable[QPersistentModelIndex]): The source parents of the changed layout.
+            hint (QAbstractItemModel.LayoutChangeHint): The layout change hint.
+        """
+		if self.layout_indexes:
+			self.changePersistentIndexList(
+					[index for index, source_index in self.layout_indexes],
+					[self.mapFromSource(QModelIndex(source_index)) for index, source_index in self.layout_indexes]
+			)
+			self.layout_indexes = []
+		
+		self.layoutChanged.emit([], hint)
+		
+		if (self.row_count, self.column_count) != (
+				get_window_count(self.first_row, self.row_window_length, self.table_model.rowCount()),
+				get_window_count(self.first_column, self.column_window_length, self.table_model.columnCount())
+		):
+			self.refresh_window()
+	
+	def source_model_reset(self):
+		"""Moves the window back to the start of the reset source model."""
+		self.first_row = 0
+		self.first_column = 0
+		self.update_counts()
+		self.endResetModel()
+	
+	def update_counts(self):
+		"""Takes the row and column counts of the window from the source model, without emitting signals."""
+		self.row_count = get_window_count(self.first_row, self.row_window_length, self.table_model.rowCount())
+		self.column_count = get_window_count(self.first_column, self.column_window_length, self.table_model.columnCount())
@@ -1,7 +1,10 @@
+import math
+import numpy
 import typing
-from time import time
-from datetime import datetime
-from PyQt6.QtCore import QTimer, Qt
+from functools import partial
+from time import monotonic_ns, time_ns
+from datetime import datetime, timedelta
+from PyQt6.QtCore import QObject, QThread, QTimer, Qt
 from dateutil.relativedelta import relativedelta
 from PyGraphicUI.Attributes import ObjectSize, PyFont
 from PyGraphicUI.Objects.Label import LabelInit, PyLabel
@@ -12,6 +15,509 @@ from PyQt6.QtWidgets import (
 )
 
 
+def get_milliseconds_to_next_second(nanoseconds: int) -> float:
+	"""
+    Returns the time until a growing duration reaches its next whole second.
+
+    Args:
+        nanoseconds (int): The non-negative duration in nanoseconds.
+
+    Returns:
+        float: The time in milliseconds.
+    """
+	return (1_000_000_000 - nanoseconds % 1_000_000_000) / 1_000_000
+
+
+def get_milliseconds_to_previous_second(nanoseconds: int) -> float:
+	"""
+    Returns the time until a shrinking duration drops below its current whole second.
+
+    Args:
+        nanoseconds (int): The non-negative duration in nanoseconds.
+
+    Returns:
+        float: The time in milliseconds.
+    """
+	return nanoseconds % 1_000_000_000 / 1_000_000
+
+
+class TimeFormatter:
+	"""
+    Formats durations the way the watch widgets display them, compiled once from their format settings.
+
+    The strings of every month, week, day, hour, minute and second value are rendered up front, so formatting a duration is integer arithmetic and list lookups. Durations shorter than 28 days cannot span a month and are decomposed with integer division; longer ones are decomposed calendar-aware by relativedelta against a reference datetime. As with relativedelta, the days include the weeks.
+
+    Attributes:
+        prefix (str): The string put before every formatted duration.
+        postfix (str): The string put after every formatted duration.
+        always_print_years (bool): Whether years are printed when zero.
+        always_print_months (bool): Whether months are printed when zero.
+        always_print_weeks (bool): Whether weeks are printed when zero.
+        always_print_days (bool): Whether days are printed when zero.
+        always_print_hours (bool): Whether hours are printed when zero.
+        always_print_minutes (bool): Whether minutes are printed when zero.
+        always_print_seconds (bool): Whether seconds are printed when zero.
+        years_format (str): Format string for years.
+        months_format (str): Format string for months.
+        weeks_format (str): Format string for weeks.
+        days_format (str): Format string for days.
+        hours_format (str): Format string for hours.
+        minutes_format (str): Format string for minutes.
+        seconds_format (str): Format string for seconds.
+        years_strings (list[str]): The rendered string of zero years.
+        months_strings (list[str]): The rendered strings of 0-11 months.
+        weeks_strings (list[str]): The rendered strings of 0-4 weeks.
+        days_strings (list[str]): The rendered strings of 0-30 days.
+        hours_strings (list[str]): The rendered strings of 0-23 hours.
+        minutes_strings (list[str]): The rendered strings of 0-59 minutes.
+        seconds_strings (list[str]): The rendered strings of 0-59 seconds.
+
+    :Usage:
+        time_formatter = TimeFormatter(always_print_days=True)
+        time_formatter.format_duration(90_061_000_000_000)
+    """
+	
+	def __init__(
+			self,
+			always_print_years: bool = False,
+			always_print_months: bool = False,
+			always_print_weeks: bool = False,
+			always_print_days: bool = False,
+			always_print_hours: bool = True,
+			always_print_minutes: bool = True,
+			always_print_seconds: bool = True,
+			years_format: str = "{value}y",
+			months_format: str = "{value}mon",
+			weeks_format: str = "{value}w",
+			days_format: str = "{value}d",
+			hours_format: str = "{value:02d}",
+			minutes_format: str = "{value:02d}",
+			seconds_format: str = "{value:02d}",
+			prefix: str = "",
+			postfix: str = ""
+	):
+		"""
+        Initializes a TimeFormatter object.
+
+        Args:
+            always_print_years (bool): Whether to always print years, even if zero. Defaults to False.
+            always_print_months (bool): Whether to always print months, even if zero. Defaults to False.
+            always_print_weeks (bool): Whether to always print weeks, even if zero. Defaults to False.
+            always_print_days (bool): Whether to always print days, even if zero. Defaults to False.
+            always_print_hours (bool): Whether to always print hours, even if zero. Defaults to True.
+            always_print_minutes (bool): Whether to always print minutes, even if zero. Defaults to True.
+            always_print_seconds (bool): Whether to always print seconds, even if zero. Defaults to True.
+            years_format (str): Format string for years. Defaults to "{value}y".
+            months_format (str): Format string for months. Defaults to "{value}mon".
+            weeks_format (str): Format string for weeks. Defaults to "{value}w".
+            days_format (str): Format string for days. Defaults to "{value}d".
+            hours_format (str): Format string for hours. Defaults to "{value:02d}".
+            minutes_format (str): Format string for minutes. Defaults to "{value:02d}".
+            seconds_format (str): Format string for seconds. Defaults to "{value:02d}".
+            prefix (str): The string put before every formatted duration. Defaults to "".
+            postfix (str): The string put after every formatted duration. Defaults to "".
+        """
+		self.prefix = prefix
+		self.postfix = postfix
+		self.always_print_years = always_print_years
+		self.always_print_months = always_print_months
+		self.always_print_weeks = always_print_weeks
+		self.always_print_days = always_print_days
+		self.always_print_hours = always_print_hours
+		self.always_print_minutes = always_print_minutes
+		self.always_print_seconds = always_print_seconds
+		self.years_format = years_format
+		self.months_format = months_format
+		self.weeks_format = weeks_format
+		self.days_format = days_format
+		self.hours_format = hours_format
+		self.minutes_format = minutes_format
+		self.seconds_format = seconds_format
+		self.years_strings = self.render_unit(years_format, always_print_years, 1)
+		self.months_strings = self.render_unit(months_format, always_print_months, 12)
+		self.weeks_strings = self.render_unit(weeks_format, always_print_weeks, 5)
+		self.days_strings = self.render_unit(days_format, always_print_days, 31)
+		self.hours_strings = self.render_unit(hours_format, always_print_hours, 24)
+		self.minutes_strings = self.render_unit(minutes_format, always_print_minutes, 60)
+		self.seconds_strings = self.render_unit(seconds_format, always_print_seconds, 60)
+	
+	@staticmethod
+	def get_unit_string(strings: list[str], format_: str, always_print: bool, value: int) -> str:
+		"""
+        Returns the string of a unit value, rendering values outside the rendered range on demand.
+
+        Args:
+            strings (list[str]): The rendered strings of the unit.
+            format_ (str): The format string of the unit.
+            always_print (bool): Whether zero is printed.
+            value (int): The value.
+
+        Returns:
+            str: The string of the value.
+        """
+		if 0 <= value < len(strings):
+			return strings[value]
+		
+		return format_.format(value=value) if value or always_print else ""
+	
+	@staticmethod
+	def join_parts(
+			years: str,
+			months: str,
+			weeks: str,
+			days: str,
+			hours: str,
+			minutes: str,
+			seconds: str
+	) -> str:
+		"""
+        Joins the strings of the units, leaving out empty ones.
+
+        Args:
+            years (str): The string of the years.
+            months (str): The string of the months.
+            weeks (str): The string of the weeks.
+            days (str): The string of the days.
+            hours (str): The string of the hours.
+            minutes (str): The string of the minutes.
+            seconds (str): The string of the seconds.
+
+        Returns:
+            str: The units out of the day joined by spaces, followed by the units in the day joined by colons.
+        """
+		out_of_day = " ".join([part for part in (years, months, weeks, days) if part])
+		in_day = ":".join([part for part in (hours, minutes, seconds) if part])
+		
+		if out_of_day and in_day:
+			return out_of_day + " " + in_day
+		
+		return out_of_day or in_day
+	
+	@staticmethod
+	def render_unit(format_: str, always_print: bool, size: int) -> list[str]:
+		"""
+        Renders the strings of the values of a unit.
+
+        Args:
+            format_ (str): The format string of the unit.
+            always_print (bool): Whether zero is printed.
+            size (int): The number of values to render, starting from zero.
+
+        Returns:
+            list[str]: The rendered strings.
+        """
+		return [format_.format(value=value) if value or always_print else "" for value in range(size)]
+	
+	def format(self, nanoseconds: int, reference: typing.Optional[datetime] = None) -> str:
+		"""
+        Formats a duration between the prefix and the postfix.
+
+        Args:
+            nanoseconds (int): The duration in nanoseconds. Negative durations are prefixed with "-".
+            reference (typing.Optional[datetime]): The later end of the duration, used to decompose durations of 28 days or more. Defaults to now.
+
+        Returns:
+            str: The formatted duration.
+        """
+		return self.prefix + self.format_duration(nanoseconds, reference) + self.postfix
+	
+	def format_duration(self, nanoseconds: int, reference: typing.Optional[datetime] = None) -> str:
+		"""
+        Formats a duration.
+
+        Args:
+            nanoseconds (int): The duration in nanoseconds. Negative durations are prefixed with "-".
+            reference (typing.Optional[datetime]): The later end of the duration, used to decompose durations of 28 days or more. Defaults to now.
+
+        Returns:
+            str: The formatted duration.
+        """
+		if nanoseconds < 0:
+			return "-" + self.format_duration(-nanoseconds, reference)
+		
+		seconds = nanoseconds // 1_000_000_000
+		
+		if seconds < 2_419_200:
+			days, seconds = divmod(seconds, 86400)
+			hours, seconds = divmod(seconds, 3600)
+			minutes, seconds = divmod(seconds, 60)
+			
+			return self.join_parts(
+					self.years_strings[0],
+					self.months_strings[0],
+					self.weeks_strings[days // 7],
+					self.days_strings[days],
+					self.hours_strings[hours],
+					self.minutes_strings[minutes],
+					self.seconds_strings[seconds]
+			)
+		
+		if reference is None:
+			reference = datetime.now()
+		
+		time_ = relativedelta(reference, reference - timedelta(microseconds=nanoseconds // 1000))
+		
+		return self.format_units(
+				time_.years,
+				time_.months,
+				time_.weeks,
+				time_.days,
+				time_.hours,
+				time_.minutes,
+				time_.seconds
+		)
+	
+	def format_units(
+			self,
+			years: int = 0,
+			months: int = 0,
+			weeks: int = 0,
+			days: int = 0,
+			hours: int = 0,
+			minutes: int = 0,
+			seconds: int = 0
+	) -> str:
+		"""
+        Formats a duration that is already decomposed into units.
+
+        Args:
+            years (int): The years. Defaults to 0.
+            months (int): The months. Defaults to 0.
+            weeks (int): The weeks. Defaults to 0.
+            days (int): The days, including the weeks. Defaults to 0.
+            hours (int): The hours. Defaults to 0.
+            minutes (int): The minutes. Defaults to 0.
+            seconds (int): The seconds. Defaults to 0.
+
+        Returns:
+            str: The formatted duration.
+        """
+		return self.join_parts(
+				self.get_unit_string(self.years_strings, self.years_format, self.always_print_years, years),
+				self.get_unit_string(self.months_strings, self.months_format, self.always_print_months, months),
+				self.get_unit_string(self.weeks_strings, self.weeks_format, self.always_print_weeks, weeks),
+				self.get_unit_string(self.days_strings, self.days_format, self.always_print_days, days),
+				self.get_unit_string(self.hours_strings, self.hours_format, self.always_print_hours, hours),
+				self.get_unit_string(self.minutes_strings, self.minutes_format, self.always_print_minutes, minutes),
+				self.get_unit_string(self.seconds_strings, self.seconds_format, self.always_print_seconds, seconds)
+		)
+
+
+class TickScheduler:
+	"""
+    Drives the periodic updates of watch widgets from one timer per update interval.
+
+    Widgets that share an update interval are grouped and called back in one batch per tick, so the event loop wakes up once per distinct interval instead of once per widget. Ticks are aligned to multiples of the interval on the wall clock, which puts them on second boundaries for every interval that divides a second, while deadlines and wake times run on the monotonic clock, so a jump of the wall clock only shifts the phase of the ticks. A callback may return the number of milliseconds until its output changes next, math.inf if it only changes on a wake up; the widget is then skipped until that moment and a group whose widgets are all waiting sleeps through the ticks in between. A widget is unregistered when it stops or when it is destroyed.
+
+    Attributes:
+        groups (dict[int, dict[int, typing.Callable[[], typing.Optional[float]]]]): The callbacks of every interval, keyed by the id of their widget.
+        intervals (dict[int, int]): The interval of every registered widget, keyed by the id of the widget.
+        wake_times (dict[int, float]): The monotonic clock time in milliseconds from which every registered widget is called back again, keyed by the id of the widget.
+        connections (dict[int, QMetaObject.Connection]): The destroyed signal connections of the registered widgets.
+        timers (dict[int, QTimer]): The single shot timer of every interval.
+        deadlines (dict[int, float]): The monotonic clock time in milliseconds of the next tick of every running interval.
+
+    :Usage:
+        tick_scheduler.register(widget, widget.print_time, 100)
+        tick_scheduler.unregister(widget)
+    """
+	
+	def __init__(self):
+		"""Initializes a TickScheduler object."""
+		self.groups: dict[int, dict[int, typing.Callable[[], typing.Optional[float]]]] = {}
+		self.intervals: dict[int, int] = {}
+		self.wake_times: dict[int, float] = {}
+		self.connections: dict[int, typing.Any] = {}
+		self.timers: dict[int, QTimer] = {}
+		self.deadlines: dict[int, float] = {}
+	
+	def fire(self, interval: int):
+		"""
+        Calls back every due widget of an interval and schedules the next tick.
+
+        Args:
+            interval (int): The interval whose timer fired.
+        """
+		group = self.groups.get(interval)
+		
+		if not group:
+			return
+		
+		now = monotonic_ns() / 1_000_000
+		due = max(now, self.deadlines.pop(interval, now))
+		
+		for key, callback in list(group.items()):
+			if key in group and self.wake_times[key] <= due:
+				delay = callback()
+				
+				if key in group:
+					self.wake_times[key] = 0.0 if delay is None else now + delay
+		
+		if interval in self.groups:
+			self.start_timer(interval, due)
+	
+	@staticmethod
+	def get_next_tick(interval: int, after: float, earliest: float = 0.0) -> float:
+		"""
+        Returns the first tick of an interval that follows a time and does not precede another.
+
+        Ticks lie on multiples of the interval on the wall clock; the times are read from the monotonic clock.
+
+        Args:
+            interval (int): The interval in milliseconds.
+            after (float): The monotonic clock time in milliseconds the tick has to follow.
+            earliest (float): The monotonic clock time in milliseconds the tick may not precede. Defaults to 0.
+
+        Returns:
+            float: The monotonic clock time in milliseconds of the tick.
+        """
+		offset = (time_ns() - monotonic_ns()) / 1_000_000
+		
+		return max((after + offset) // interval + 1, math.ceil((earliest + offset) / interval)) * interval - offset
+	
+	def get_statistics(self) -> dict[str, int]:
+		"""
+        Returns the scheduler statistics.
+
+        Returns:
+            dict[str, int]: The number of registered widgets and the number of running timers.
+        """
+		return {"widgets": len(self.intervals), "timers": len(self.deadlines)}
+	
+	def register(self, widget: QObject, callback: typing.Callable[[], typing.Optional[float]], interval: int):
+		"""
+        Registers a widget to be called back on the ticks of an interval.
+
+        A widget that is already registered is moved to the new interval.
+
+        Args:
+            widget (QObject): The widget that owns the callback.
+            callback (typing.Callable[[], typing.Optional[float]]): The function called on the ticks. It returns the milliseconds until it needs to be called again, or None to be called on every tick.
+            interval (int): The interval in milliseconds.
+        """
+		self.unregister(widget)
+		
+		key = id(widget)
+		interval = max(1, int(interval))
+		
+		self.intervals[key] = interval
+		self.wake_times[key] = 0.0
+		self.connections[key] = widget.destroyed.connect(partial(self.remove, key))
+		self.groups.setdefault(interval, {})[key] = callback
+		
+		self.wake(widget)
+	
+	def remove(self, key: int):
+		"""
+        Removes a widget from its group.
+
+        The timer of an emptied group is left to run out, since this is also called while the application is torn down.
+
+        Args:
+            key (int): The id of the widget.
+        """
+		self.connections.pop(key, None)
+		self.wake_times.pop(key, None)
+		interval = self.intervals.pop(key, None)
+		
+		if interval is None:
+			return
+		
+		group = self.groups[interval]
+		del group[key]
+		
+		if not group:
+			del self.groups[interval]
+			self.deadlines.pop(interval, None)
+	
+	def start_timer(self, interval: int, after: typing.Optional[float] = None):
+		"""
+        Starts the timer of an interval for the first aligned tick at which one of its widgets is due.
+
+        Ticks that were missed while the event loop was busy are skipped. The timer is stopped if no widget is waiting for a time.
+
+        Args:
+            interval (int): The interval in milliseconds.
+            after (typing.Optional[float]): The monotonic clock time in milliseconds the tick has to follow. Defaults to now.
+        """
+		timer = self.timers.get(interval)
+		
+		if timer is None:
+			timer = QTimer()
+			timer.setSingleShot(True)
+			timer.setTimerType(Qt.TimerType.PreciseTimer)
+			timer.timeout.connect(partial(self.fire, interval))
+			self.timers[interval] = timer
+		
+		earliest = min(self.wake_times[key] for key in self.groups[interval])
+		
+		if earliest == math.inf:
+			self.deadlines.pop(interval, None)
+			timer.stop()
+			return
+		
+		now = monotonic_ns() / 1_000_000
+		
+		if after is None:
+			after = now
+		
+		deadline = self.get_next_tick(interval, after, earliest)
+		
+		self.deadlines[interval] = deadline
+		timer.start(max(0, math.ceil(deadline - now)))
+	
+	def unregister(self, widget: QObject):
+		"""
+        Unregisters a widget and stops the timer of its interval if no widget is left.
+
+        Args:
+            widget (QObject): The widget to unregister.
+        """
+		key = id(widget)
+		connection = self.connections.get(key)
+		
+		if connection is None:
+			return
+		
+		QObject.disconnect(connection)
+		
+		interval = self.intervals[key]
+		self.remove(key)
+		
+		if interval not in self.groups:
+			self.timers[interval].stop()
+	
+	def wake(self, widget: QObject):
+		"""
+        Calls a registered widget back on the next tick of its interval.
+
+        Widgets call it when their output changes for a reason their last returned delay did not foresee. Called from another thread, it takes effect on the next tick the interval already has.
+
+        Args:
+            widget (QObject): The widget to wake up.
+        """
+		key = id(widget)
+		interval = self.intervals.get(key)
+		
+		if interval is None:
+			return
+		
+		self.wake_times[key] = 0.0
+		
+		timer = self.timers.get(interval)
+		
+		if timer is not None and QThread.currentThread() is not timer.thread():
+			return
+		
+		deadline = self.deadlines.get(interval)
+		
+		if deadline is None or deadline > self.get_next_tick(interval, monotonic_ns() / 1_000_000):
+			self.start_timer(interval)
+
+
+tick_scheduler = TickScheduler()
+
+
 class TimerInit(LabelInit):
 	"""
     Data class for initializing timer widgets. Inherits from LabelInit.
@@ -205,14 +711,43 @@ class PyTimer(PyLabel):
 		self.minutes_format = timer_init.minutes_format
 		self.seconds_format = timer_init.seconds_format
 		self.end_time: typing.Optional[datetime] = None
+		self.end_ns: typing.Optional[int] = None
 		self.disable_negative_time = timer_init.disable_negative_time
 		self.prefix = timer_init.prefix
 		self.postfix = timer_init.postfix
+		self.performed_repaints = 0
+		self.skipped_repaints = 0
+		self.time_formatter = self.get_time_formatter()
 		
-		self.timer = QTimer(self)
-		self.timer.timeout.connect(self.print_time)
-		
-		self.setText("%s%s%s" % (self.prefix, self.get_time_string(), self.postfix))
+		self.setText(self.time_formatter.format(0))
+	
+	def get_time_formatter(self) -> TimeFormatter:
+		"""
+        Compiles the format settings into a time formatter.
+
+        Assign the result to time_formatter after changing the always_print_*, *_format, prefix or postfix attributes.
+
+        Returns:
+            TimeFormatter: The compiled formatter.
+        """
+		return TimeFormatter(
+				self.always_print_years,
+				self.always_print_months,
+				self.always_print_weeks,
+				self.always_print_days,
+				self.always_print_hours,
+				self.always_print_minutes,
+				self.always_print_seconds,
+				self.years_format,
+				self.months_format,
+				self.weeks_format,
+				self.days_format,
+				self.hours_format,
+				self.minutes_format,
+				self.seconds_format,
+				self.prefix,
+				self.postfix
+		)
 	
 	def get_time_string(self, time_: typing.Optional[relativedelta] = None) -> str:
 		"""
@@ -225,62 +760,129 @@ class PyTimer(PyLabel):
             str: The formatted time string.
         """
 		if time_ is None:
-			time_ = relativedelta(years=0, months=0, weeks=0, days=0, hours=0, minutes=0, seconds=0)
-		
-		years_s = self.years_format.format(value=time_.years) if time_.years or self.always_print_years else ""
-		months_s = self.months_format.format(value=time_.months) if time_.months or self.always_print_months else ""
-		weeks_s = self.weeks_format.format(value=time_.weeks) if time_.weeks or self.always_print_weeks else ""
-		days_s = self.days_format.format(value=time_.days) if time_.days or self.always_print_days else ""
-		hours_s = self.hours_format.format(value=time_.hours) if time_.hours or self.always_print_hours else ""
-		minutes_s = (
-				self.minutes_format.format(value=time_.minutes)
-				if time_.minutes
-				or self.always_print_minutes
-				else ""
-		)
-		seconds_s = (
-				self.seconds_format.format(value=time_.seconds)
-				if time_.seconds
-				or self.always_print_seconds
-				else ""
-		)
-		
-		time_out_of_day = " ".join(list(filter(None, [years_s, months_s, weeks_s, days_s])))
-		time_in_day_string = ":".join(list(filter(None, [hours_s, minutes_s, seconds_s])))
+			return self.time_formatter.format_units()
 		
-		return " ".join(list(filter(None, [time_out_of_day, time_in_day_string])))
+		return self.time_formatter.format_units(
+				time_.years,
+				time_.months,
+				time_.weeks,
+				time_.days,
+				time_.hours,
+				time_.minutes,
+				time_.seconds
+		)
 	
-	def get_estimated_time_string(self) -> str:
+	def get_estimated_time_string(self, now: typing.Optional[int] = None) -> str:
 		"""
         Calculates and formats the estimated time string.
 
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
         Returns:
             str: The estimated time string.
         """
-		if self.end_time is not None:
-			time_diff = self.end_time.timestamp() - datetime.now().timestamp()
-			if time_diff >= 0:
-				return self.get_time_string(relativedelta(self.end_time, datetime.now()))
-			else:
-				if self.disable_negative_time:
-					return self.get_time_string()
-				else:
-					return "-" + self.get_time_string(relativedelta(datetime.now(), self.end_time))
-		else:
-			return self.get_time_string()
+		remaining = self.get_remaining_nanoseconds(now)
+		
+		return self.time_formatter.format_duration(remaining, self.end_time if remaining > 0 else None)
+	
+	def get_next_change_delay(self, now: typing.Optional[int] = None) -> float:
+		"""
+        Calculates the time until the displayed time changes.
+
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
+        Returns:
+            float: The time in milliseconds, or math.inf if the displayed time does not change anymore.
+        """
+		if self.end_ns is None:
+			return math.inf
+		
+		if now is None:
+			now = monotonic_ns()
+		
+		remaining = self.end_ns - now
+		
+		if remaining >= 0:
+			return get_milliseconds_to_previous_second(remaining)
+		
+		if self.disable_negative_time:
+			return math.inf
+		
+		return get_milliseconds_to_next_second(-remaining)
+	
+	def get_remaining_nanoseconds(self, now: typing.Optional[int] = None) -> int:
+		"""
+        Calculates the displayed remaining time.
+
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
+        Returns:
+            int: The remaining time in nanoseconds. It is negative once the end time has passed unless negative time is disabled, and zero if no end time is set.
+        """
+		if self.end_ns is None:
+			return 0
+		
+		if now is None:
+			now = monotonic_ns()
+		
+		remaining = self.end_ns - now
+		
+		if remaining < 0 and self.disable_negative_time:
+			return 0
+		
+		return remaining
 	
-	def print_time(self):
-		"""Updates the timer display with the current time."""
-		self.setText("%s%s%s" % (self.prefix, self.get_estimated_time_string(), self.postfix))
+	def get_repaint_statistics(self) -> dict[str, int]:
+		"""
+        Returns the number of performed and skipped repaints.
+
+        Returns:
+            dict[str, int]: The number of ticks that changed the displayed text and of ticks that left it unchanged.
+        """
+		return {"performed": self.performed_repaints, "skipped": self.skipped_repaints}
+	
+	def print_time(self) -> float:
+		"""
+        Updates the timer display with the current time.
+
+        Returns:
+            float: The time in milliseconds until the displayed time changes.
+        """
+		now = monotonic_ns()
+		remaining = self.get_remaining_nanoseconds(now)
+		
+		self.set_output_text(self.time_formatter.format(remaining, self.end_time if remaining > 0 else None))
+		
+		return self.get_next_change_delay(now)
 	
 	def set_end_time(self, end_time: datetime):
 		"""
         Sets the target end time for the timer.
 
+        The end time is converted to the monotonic clock once, so later changes of the wall clock do not move it.
+
         Args:
             end_time (datetime): The datetime object representing the end time.
         """
 		self.end_time = end_time
+		self.end_ns = monotonic_ns() + (end_time - datetime.now()) // timedelta(microseconds=1) * 1000
+		tick_scheduler.wake(self)
+	
+	def set_output_text(self, text: str):
+		"""
+        Displays a text unless it is already displayed.
+
+        Args:
+            text (str): The text to display.
+        """
+		if text == self.text():
+			self.skipped_repaints += 1
+		else:
+			self.performed_repaints += 1
+			self.setText(text)
 	
 	def start_timer(self, end_time: datetime):
 		"""
@@ -290,12 +892,13 @@ class PyTimer(PyLabel):
             end_time (datetime): The end time for the timer.
         """
 		self.set_end_time(end_time)
-		self.timer.start(self.update_interval)
+		tick_scheduler.register(self, self.print_time, self.update_interval)
 	
 	def stop_timer(self):
 		"""Stops the timer and resets the end time."""
-		self.timer.stop()
+		tick_scheduler.unregister(self)
 		self.end_time = None
+		self.end_ns = None
 	
 	def restart_watch(self, end_time: datetime):
 		"""
@@ -491,13 +1094,74 @@ class PyStopWatch(PyLabel):
 		self.minutes_format = stop_watch_init.minutes_format
 		self.seconds_format = stop_watch_init.seconds_format
 		self.start_time: typing.Optional[datetime] = None
+		self.start_ns: typing.Optional[int] = None
+		self.pause_ns: typing.Optional[int] = None
+		self.lap_start_ns = 0
+		self.laps: list[int] = []
 		self.prefix = stop_watch_init.prefix
 		self.postfix = stop_watch_init.postfix
+		self.performed_repaints = 0
+		self.skipped_repaints = 0
+		self.time_formatter = self.get_time_formatter()
 		
-		self.timer = QTimer(self)
-		self.timer.timeout.connect(self.print_time)
+		self.setText(self.time_formatter.format(0))
+	
+	def get_elapsed_nanoseconds(self, now: typing.Optional[int] = None) -> int:
+		"""
+        Calculates the elapsed time, leaving out the time spent paused.
+
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
+        Returns:
+            int: The elapsed time in nanoseconds, or zero if the stopwatch is not running.
+        """
+		if self.start_ns is None:
+			return 0
 		
-		self.setText("%s%s%s" % (self.prefix, self.get_time_string(), self.postfix))
+		if self.pause_ns is not None:
+			now = self.pause_ns
+		elif now is None:
+			now = monotonic_ns()
+		
+		return now - self.start_ns
+	
+	def get_time_formatter(self) -> TimeFormatter:
+		"""
+        Compiles the format settings into a time formatter.
+
+        Assign the result to time_formatter after changing the always_print_*, *_format, prefix or postfix attributes.
+
+        Returns:
+            TimeFormatter: The compiled formatter.
+        """
+		return TimeFormatter(
+				self.always_print_years,
+				self.always_print_months,
+				self.always_print_weeks,
+				self.always_print_days,
+				self.always_print_hours,
+				self.always_print_minutes,
+				self.always_print_seconds,
+				self.years_format,
+				self.months_format,
+				self.weeks_format,
+				self.days_format,
+				self.hours_format,
+				self.minutes_format,
+				self.seconds_format,
+				self.prefix,
+				self.postfix
+		)
+	
+	def get_lap_strings(self) -> list[str]:
+		"""
+        Formats the recorded laps.
+
+        Returns:
+            list[str]: The duration of every lap as a formatted string.
+        """
+		return [self.time_formatter.format_duration(lap) for lap in self.laps]
 	
 	def get_time_string(self, time_: typing.Optional[relativedelta] = None) -> str:
 		"""
@@ -510,56 +1174,131 @@ class PyStopWatch(PyLabel):
             str: A formatted time string.
         """
 		if time_ is None:
-			time_ = relativedelta(years=0, months=0, weeks=0, days=0, hours=0, minutes=0, seconds=0)
-		
-		years_s = self.years_format.format(value=time_.years) if time_.years or self.always_print_years else ""
-		months_s = self.months_format.format(value=time_.months) if time_.months or self.always_print_months else ""
-		weeks_s = self.weeks_format.format(value=time_.weeks) if time_.weeks or self.always_print_weeks else ""
-		days_s = self.days_format.format(value=time_.days) if time_.days or self.always_print_days else ""
-		hours_s = self.hours_format.format(value=time_.hours) if time_.hours or self.always_print_hours else ""
-		minutes_s = (
-				self.minutes_format.format(value=time_.minutes)
-				if time_.minutes
-				or self.always_print_minutes
-				else ""
-		)
-		seconds_s = (
-				self.seconds_format.format(value=time_.seconds)
-				if time_.seconds
-				or self.always_print_seconds
-				else ""
-		)
+			return self.time_formatter.format_units()
 		
-		time_out_of_day = " ".join(list(filter(None, [years_s, months_s, weeks_s, days_s])))
-		time_in_day_string = ":".join(list(filter(None, [hours_s, minutes_s, seconds_s])))
-		
-		return " ".join(list(filter(None, [time_out_of_day, time_in_day_string])))
+		return self.time_formatter.format_units(
+				time_.years,
+				time_.months,
+				time_.weeks,
+				time_.days,
+				time_.hours,
+				time_.minutes,
+				time_.seconds
+		)
 	
-	def get_time_gone_string(self) -> str:
+	def get_time_gone_string(self, now: typing.Optional[int] = None) -> str:
 		"""
         Gets the elapsed time as a formatted string.
 
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
         Returns:
             str: The elapsed time string.
         """
-		if self.start_time is not None:
-			return self.get_time_string(relativedelta(datetime.now(), self.start_time))
-		else:
-			return self.get_time_string()
+		return self.time_formatter.format_duration(self.get_elapsed_nanoseconds(now))
+	
+	def get_next_change_delay(self, now: typing.Optional[int] = None) -> float:
+		"""
+        Calculates the time until the displayed elapsed time changes.
+
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
+        Returns:
+            float: The time in milliseconds, or math.inf if the stopwatch is not running or paused.
+        """
+		if self.start_ns is None or self.pause_ns is not None:
+			return math.inf
+		
+		return get_milliseconds_to_next_second(self.get_elapsed_nanoseconds(now))
+	
+	def get_repaint_statistics(self) -> dict[str, int]:
+		"""
+        Returns the number of performed and skipped repaints.
+
+        Returns:
+            dict[str, int]: The number of ticks that changed the displayed text and of ticks that left it unchanged.
+        """
+		return {"performed": self.performed_repaints, "skipped": self.skipped_repaints}
+	
+	def lap_watch(self) -> int:
+		"""
+        Records a lap without stopping the stopwatch.
+
+        Returns:
+            int: The duration of the lap in nanoseconds, or zero if the stopwatch is not running.
+        """
+		if self.start_ns is None:
+			return 0
+		
+		elapsed = self.get_elapsed_nanoseconds()
+		lap = elapsed - self.lap_start_ns
+		
+		self.lap_start_ns = elapsed
+		self.laps.append(lap)
+		
+		return lap
+	
+	def pause_watch(self):
+		"""Pauses the stopwatch, freezing the displayed elapsed time."""
+		if self.start_ns is None or self.pause_ns is not None:
+			return
+		
+		self.pause_ns = monotonic_ns()
+		tick_scheduler.unregister(self)
+		self.print_time()
+	
+	def print_time(self) -> float:
+		"""
+        Updates the stopwatch display with the current elapsed time.
+
+        Returns:
+            float: The time in milliseconds until the displayed elapsed time changes.
+        """
+		now = monotonic_ns()
+		
+		self.set_output_text(self.time_formatter.format(self.get_elapsed_nanoseconds(now)))
+		
+		return self.get_next_change_delay(now)
 	
-	def print_time(self):
-		"""Updates the stopwatch display with the current elapsed time."""
-		self.setText("%s%s%s" % (self.prefix, self.get_time_gone_string(), self.postfix))
+	def resume_watch(self):
+		"""Resumes a paused stopwatch, leaving the paused time out of the elapsed time."""
+		if self.pause_ns is None:
+			return
+		
+		self.start_ns += monotonic_ns() - self.pause_ns
+		self.pause_ns = None
+		tick_scheduler.register(self, self.print_time, self.update_interval)
+	
+	def set_output_text(self, text: str):
+		"""
+        Displays a text unless it is already displayed.
+
+        Args:
+            text (str): The text to display.
+        """
+		if text == self.text():
+			self.skipped_repaints += 1
+		else:
+			self.performed_repaints += 1
+			self.setText(text)
 	
 	def start_watch(self):
-		"""Starts the stopwatch."""
+		"""Starts the stopwatch and clears the recorded laps."""
 		self.start_time = datetime.now()
-		self.timer.start(self.update_interval)
+		self.start_ns = monotonic_ns()
+		self.pause_ns = None
+		self.lap_start_ns = 0
+		self.laps = []
+		tick_scheduler.register(self, self.print_time, self.update_interval)
 	
 	def stop_watch(self):
-		"""Stops the stopwatch."""
-		self.timer.stop()
+		"""Stops the stopwatch. The recorded laps are kept until the next start."""
+		tick_scheduler.unregister(self)
 		self.start_time = None
+		self.start_ns = None
+		self.pause_ns = None
 	
 	def restart_watch(self):
 		"""Restarts the stopwatch."""
@@ -567,6 +1306,210 @@ class PyStopWatch(PyLabel):
 		self.start_watch()
 
 
+class ProgressRateEstimation:
+	"""
+    Configuration settings for the rate estimation of a progress watcher.
+
+    Attributes:
+        strategy (typing.Literal["cumulative", "ema", "window", "regression"]): How the seconds per point are estimated. "cumulative" divides the total elapsed time by the total points, "ema" smooths the time per point of every update exponentially, "window" divides the time by the points between the oldest and the newest buffered update, and "regression" fits a least squares line through the buffered updates. Defaults to "cumulative".
+        smoothing (float): The weight of the newest update for the "ema" strategy, between 0 and 1. Defaults to 0.1.
+        window_duration (typing.Optional[float]): The seconds of updates kept in the buffer of the "window" and "regression" strategies. If None, the buffer is only bounded by buffer_size. Defaults to 30.0.
+        buffer_size (int): The maximum number of updates kept in the buffer. Defaults to 1024.
+    """
+	
+	def __init__(
+			self,
+			strategy: typing.Literal["cumulative", "ema", "window", "regression"] = "cumulative",
+			smoothing: float = 0.1,
+			window_duration: typing.Optional[float] = 30.0,
+			buffer_size: int = 1024
+	):
+		"""
+        Initializes a ProgressRateEstimation object.
+
+        Args:
+            strategy (typing.Literal["cumulative", "ema", "window", "regression"]): How the seconds per point are estimated.
+            smoothing (float): The weight of the newest update for the "ema" strategy.
+            window_duration (typing.Optional[float]): The seconds of updates kept in the buffer.
+            buffer_size (int): The maximum number of updates kept in the buffer.
+        """
+		self.strategy = strategy
+		self.smoothing = smoothing
+		self.window_duration = window_duration
+		self.buffer_size = buffer_size
+
+
+class ProgressRateEstimator:
+	"""
+    Estimates the seconds per point of a progress from its updates in O(1) per update.
+
+    Recent updates are kept in a ring buffer of fixed size, so memory stays bounded however many points are processed. The "regression" strategy keeps the means, variance and covariance of the buffered updates and adjusts them as updates enter and leave the buffer.
+
+    Attributes:
+        rate_estimation (ProgressRateEstimation): The estimation settings.
+        seconds (numpy.ndarray): The ring buffer of update times in seconds since the start.
+        points (numpy.ndarray): The ring buffer of update points.
+        first (int): The buffer position of the oldest buffered update.
+        count (int): The number of buffered updates.
+        start_point (int): The point the progress started from.
+        last_seconds (float): The time of the last update in seconds since the start.
+        last_point (int): The point of the last update.
+        average (float): The exponential moving average of the seconds per point.
+        mean_seconds (float): The mean time of the buffered updates.
+        mean_points (float): The mean point of the buffered updates.
+        seconds_variance (float): The sum of squared deviations of the buffered update times.
+        covariance (float): The sum of products of the time and point deviations of the buffered updates.
+    """
+	
+	def __init__(self, rate_estimation: ProgressRateEstimation = ProgressRateEstimation()):
+		"""
+        Initializes a ProgressRateEstimator object.
+
+        Args:
+            rate_estimation (ProgressRateEstimation): The estimation settings.
+        """
+		self.rate_estimation = rate_estimation
+		self.seconds = numpy.zeros(max(2, rate_estimation.buffer_size), dtype=numpy.float64)
+		self.points = numpy.zeros(max(2, rate_estimation.buffer_size), dtype=numpy.int64)
+		self.first = 0
+		self.count = 0
+		self.start_point = 0
+		self.last_seconds = 0.0
+		self.last_point = 0
+		self.average = 0.0
+		self.mean_seconds = 0.0
+		self.mean_points = 0.0
+		self.seconds_variance = 0.0
+		self.covariance = 0.0
+		
+		self.reset(0, 0)
+	
+	def add_sample(self, seconds: float, point: int):
+		"""
+        Appends an update to the buffer, dropping the oldest update if the buffer is full.
+
+        Args:
+            seconds (float): The time of the update in seconds since the start.
+            point (int): The point of the update.
+        """
+		if self.count == len(self.seconds):
+			self.remove_sample()
+		
+		position = (self.first + self.count) % len(self.seconds)
+		self.seconds[position] = seconds
+		self.points[position] = point
+		self.count += 1
+		
+		delta_seconds = seconds - self.mean_seconds
+		self.mean_seconds += delta_seconds / self.count
+		self.mean_points += (point - self.mean_points) / self.count
+		self.seconds_variance += delta_seconds * (seconds - self.mean_seconds)
+		self.covariance += delta_seconds * (point - self.mean_points)
+	
+	def get_cumulative_seconds_for_point(self) -> float:
+		"""
+        Returns the total elapsed time divided by the total points.
+
+        Returns:
+            float: The seconds per point, or 0.0 if no point was processed.
+        """
+		if self.last_point == self.start_point:
+			return 0.0
+		
+		return self.last_seconds / (self.last_point - self.start_point)
+	
+	def remove_sample(self):
+		"""Drops the oldest update from the buffer."""
+		seconds = float(self.seconds[self.first])
+		point = int(self.points[self.first])
+		self.first = (self.first + 1) % len(self.seconds)
+		self.count -= 1
+		
+		if self.count == 0:
+			self.mean_seconds = 0.0
+			self.mean_points = 0.0
+			self.seconds_variance = 0.0
+			self.covariance = 0.0
+			return
+		
+		delta_seconds = seconds - self.mean_seconds
+		self.mean_seconds -= delta_seconds / self.count
+		self.mean_points -= (point - self.mean_points) / self.count
+		self.seconds_variance -= delta_seconds * (seconds - self.mean_seconds)
+		self.covariance -= delta_seconds * (point - self.mean_points)
+	
+	def reset(self, start_point: int, current_point: int):
+		"""
+        Clears the estimation for a progress that starts now.
+
+        Args:
+            start_point (int): The point the progress started from.
+            current_point (int): The current point.
+        """
+		self.first = 0
+		self.count = 0
+		self.start_point = start_point
+		self.last_seconds = 0.0
+		self.last_point = current_point
+		self.average = 0.0
+		self.mean_seconds = 0.0
+		self.mean_points = 0.0
+		self.seconds_variance = 0.0
+		self.covariance = 0.0
+		
+		self.add_sample(0.0, current_point)
+	
+	def update(self, seconds: float, point: int) -> float:
+		"""
+        Adds an update and estimates the seconds per point.
+
+        Strategies that have too few updates to estimate fall back to the cumulative estimate.
+
+        Args:
+            seconds (float): The time of the update in seconds since the start.
+            point (int): The point reached by the update.
+
+        Returns:
+            float: The estimated seconds per point, or 0.0 if it cannot be estimated.
+        """
+		strategy = self.rate_estimation.strategy
+		
+		if strategy == "ema" and point != self.last_point:
+			seconds_for_point = (seconds - self.last_seconds) / (point - self.last_point)
+			
+			if self.average == 0.0:
+				self.average = seconds_for_point
+			else:
+				self.average += self.rate_estimation.smoothing * (seconds_for_point - self.average)
+		
+		self.last_seconds = seconds
+		self.last_point = point
+		
+		if strategy == "cumulative":
+			return self.get_cumulative_seconds_for_point()
+		
+		if strategy == "ema":
+			return self.average
+		
+		self.add_sample(seconds, point)
+		
+		window_duration = self.rate_estimation.window_duration
+		
+		if window_duration is not None:
+			while self.count > 2 and self.seconds[self.first] < seconds - window_duration:
+				self.remove_sample()
+		
+		if strategy == "window":
+			points = point - int(self.points[self.first])
+			
+			if points > 0:
+				return (seconds - float(self.seconds[self.first])) / points
+		elif self.covariance > 0.0:
+			return self.seconds_variance / self.covariance
+		
+		return self.get_cumulative_seconds_for_point()
+
+
 class ProgressWatcherInit(LabelInit):
 	"""
     Data class for initializing progress watcher widgets.
@@ -618,6 +1561,7 @@ class ProgressWatcherInit(LabelInit):
         minutes_format (str): Format string for minutes. Defaults to "{value:02d}".
         seconds_format (str): Format string for seconds. Defaults to "{value:02d}".
         output_format (str): The output format string. Defaults to "{current_point}/{end_point} ({points_per_time}), {time_gone} / {est_time}".
+        rate_estimation (ProgressRateEstimation): Rate estimation settings. Defaults to a default ProgressRateEstimation.
     """
 	
 	def __init__(
@@ -667,7 +1611,8 @@ class ProgressWatcherInit(LabelInit):
 			hours_format: str = "{value:02d}",
 			minutes_format: str = "{value:02d}",
 			seconds_format: str = "{value:02d}",
-			output_format: str = "{current_point}/{end_point} ({progress_percent:.2f}%, {points_per_time}), {time_gone} / {est_time}"
+			output_format: str = "{current_point}/{end_point} ({progress_percent:.2f}%, {points_per_time}), {time_gone} / {est_time}",
+			rate_estimation: ProgressRateEstimation = ProgressRateEstimation()
 	):
 		"""
         Initializes a ProgressWatcherInit object.
@@ -719,6 +1664,7 @@ class ProgressWatcherInit(LabelInit):
             minutes_format (str): Format string for minutes. Defaults to "{value:02d}".
             seconds_format (str): Format string for seconds. Defaults to "{value:02d}".
             output_format (str): The output format string. Defaults to "{current_point}/{end_point} ({progress_percent:.2f}%, {points_per_time}), {time_gone} / {est_time}".
+            rate_estimation (ProgressRateEstimation): Rate estimation settings. Defaults to a default ProgressRateEstimation.
         """
 		super().__init__(
 				name,
@@ -769,6 +1715,7 @@ class ProgressWatcherInit(LabelInit):
 		self.minutes_format = minutes_format
 		self.seconds_format = seconds_format
 		self.output_format = output_format
+		self.rate_estimation = rate_estimation
 
 
 class PyProgressWatcher(PyLabel):
@@ -814,16 +1761,46 @@ class PyProgressWatcher(PyLabel):
 		self.seconds_format = progress_watcher_init.seconds_format
 		self.disable_negative_time = progress_watcher_init.disable_negative_time
 		self.output_format = progress_watcher_init.output_format
+		self.rate_estimation = progress_watcher_init.rate_estimation
+		self.rate_estimator = ProgressRateEstimator(self.rate_estimation)
 		self.start_time: typing.Optional[datetime] = None
 		self.end_time: typing.Optional[datetime] = None
+		self.start_ns: typing.Optional[int] = None
+		self.end_ns: typing.Optional[int] = None
 		self.block_print = False
 		self.seconds_for_point = 0.0
-		
-		self.timer = QTimer(self)
-		self.timer.timeout.connect(self.print_progress)
+		self.performed_repaints = 0
+		self.skipped_repaints = 0
+		self.time_formatter = self.get_time_formatter()
 		
 		self.reset_output(self.current_point, self.end_point)
 	
+	def get_time_formatter(self) -> TimeFormatter:
+		"""
+        Compiles the format settings into a time formatter.
+
+        Assign the result to time_formatter after changing the always_print_* or *_format attributes.
+
+        Returns:
+            TimeFormatter: The compiled formatter.
+        """
+		return TimeFormatter(
+				self.always_print_years,
+				self.always_print_months,
+				self.always_print_weeks,
+				self.always_print_days,
+				self.always_print_hours,
+				self.always_print_minutes,
+				self.always_print_seconds,
+				self.years_format,
+				self.months_format,
+				self.weeks_format,
+				self.days_format,
+				self.hours_format,
+				self.minutes_format,
+				self.seconds_format
+		)
+	
 	def get_points_per_time_sting(self) -> str:
 		"""Returns a formatted string representing the points processed per unit of time."""
 		if self.seconds_for_point > 2592000:
@@ -849,24 +1826,72 @@ class PyProgressWatcher(PyLabel):
 		else:
 			return self.points_per_nanosecond_format.format(points=1e-9 / self.seconds_for_point)
 	
-	def print_progress(self):
-		"""Updates the displayed progress information."""
-		if not self.block_print:
-			try:
-				progress_percent = (self.current_point / self.end_point) * 100
-			except ZeroDivisionError:
-				progress_percent = 0.0
-		
-			self.setText(
-					self.output_format.format(
-							current_point=self.current_point,
-							end_point=self.end_point,
-							progress_percent=progress_percent,
-							points_per_time=self.get_points_per_time_sting(),
-							time_gone=self.get_elapsed_time_string(),
-							est_time=self.get_estimated_time_string()
-					)
-			)
+	def get_next_change_delay(self, now: typing.Optional[int] = None) -> float:
+		"""
+        Calculates the time until the displayed elapsed or estimated time changes.
+
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
+        Returns:
+            float: The time in milliseconds, or math.inf if neither time changes anymore.
+        """
+		if self.start_ns is None:
+			return math.inf
+		
+		if now is None:
+			now = monotonic_ns()
+		
+		delay = get_milliseconds_to_next_second(now - self.start_ns)
+		
+		if self.end_ns is not None:
+			remaining = self.end_ns - now
+			
+			if remaining >= 0:
+				delay = min(delay, get_milliseconds_to_previous_second(remaining))
+			elif not self.disable_negative_time:
+				delay = min(delay, get_milliseconds_to_next_second(-remaining))
+		
+		return delay
+	
+	def get_repaint_statistics(self) -> dict[str, int]:
+		"""
+        Returns the number of performed and skipped repaints.
+
+        Returns:
+            dict[str, int]: The number of ticks that changed the displayed text and of ticks that left it unchanged.
+        """
+		return {"performed": self.performed_repaints, "skipped": self.skipped_repaints}
+	
+	def print_progress(self) -> float:
+		"""
+        Updates the displayed progress information.
+
+        Returns:
+            float: The time in milliseconds until the displayed information changes, or 0 if the output is blocked by an update.
+        """
+		if self.block_print:
+			return 0.0
+		
+		try:
+			progress_percent = (self.current_point / self.end_point) * 100
+		except ZeroDivisionError:
+			progress_percent = 0.0
+		
+		now = monotonic_ns()
+		
+		self.set_output_text(
+				self.output_format.format(
+						current_point=self.current_point,
+						end_point=self.end_point,
+						progress_percent=progress_percent,
+						points_per_time=self.get_points_per_time_sting(),
+						time_gone=self.get_elapsed_time_string(now),
+						est_time=self.get_estimated_time_string(now)
+				)
+		)
+		
+		return self.get_next_change_delay(now)
 	
 	def start_progress_watcher(self, start_point: int, end_point: int, current_point: int):
 		"""
@@ -885,9 +1910,12 @@ class PyProgressWatcher(PyLabel):
 		self.block_print = False
 		
 		self.start_time = datetime.now()
-		self.end_time = datetime.now()
+		self.end_time = self.start_time
+		self.start_ns = monotonic_ns()
+		self.end_ns = self.start_ns
+		self.rate_estimator.reset(start_point, current_point)
 		
-		self.timer.start(self.update_interval)
+		tick_scheduler.register(self, self.print_progress, self.update_interval)
 	
 	def get_time_string(self, time_: typing.Optional[relativedelta] = None) -> str:
 		"""
@@ -900,60 +1928,58 @@ class PyProgressWatcher(PyLabel):
             str: The formatted time string.
         """
 		if time_ is None:
-			time_ = relativedelta(years=0, months=0, weeks=0, days=0, hours=0, minutes=0, seconds=0)
-		
-		years_s = self.years_format.format(value=time_.years) if time_.years or self.always_print_years else ""
-		months_s = self.months_format.format(value=time_.months) if time_.months or self.always_print_months else ""
-		weeks_s = self.weeks_format.format(value=time_.weeks) if time_.weeks or self.always_print_weeks else ""
-		days_s = self.days_format.format(value=time_.days) if time_.days or self.always_print_days else ""
-		hours_s = self.hours_format.format(value=time_.hours) if time_.hours or self.always_print_hours else ""
-		minutes_s = (
-				self.minutes_format.format(value=time_.minutes)
-				if time_.minutes
-				or self.always_print_minutes
-				else ""
-		)
-		seconds_s = (
-				self.seconds_format.format(value=time_.seconds)
-				if time_.seconds
-				or self.always_print_seconds
-				else ""
-		)
+			return self.time_formatter.format_units()
 		
-		time_out_of_day = " ".join(list(filter(None, [years_s, months_s, weeks_s, days_s])))
-		time_in_day_string = ":".join(list(filter(None, [hours_s, minutes_s, seconds_s])))
-		
-		return " ".join(list(filter(None, [time_out_of_day, time_in_day_string])))
+		return self.time_formatter.format_units(
+				time_.years,
+				time_.months,
+				time_.weeks,
+				time_.days,
+				time_.hours,
+				time_.minutes,
+				time_.seconds
+		)
 	
-	def get_estimated_time_string(self) -> str:
+	def get_estimated_time_string(self, now: typing.Optional[int] = None) -> str:
 		"""
         Calculates and returns the estimated remaining time as a string.
 
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
         Returns:
             str: The estimated remaining time as a string.
         """
-		if self.end_time is not None:
-			if self.end_time.timestamp() - datetime.now().timestamp() >= 0:
-				return self.get_time_string(relativedelta(self.end_time, datetime.now()))
-			else:
-				if self.disable_negative_time:
-					return self.get_time_string()
-				else:
-					return "-" + self.get_time_string(relativedelta(datetime.now(), self.end_time))
-		else:
-			return self.get_time_string()
+		if self.end_ns is None:
+			return self.time_formatter.format_units()
+		
+		if now is None:
+			now = monotonic_ns()
+		
+		remaining = self.end_ns - now
+		
+		if remaining < 0 and self.disable_negative_time:
+			remaining = 0
+		
+		return self.time_formatter.format_duration(remaining, self.end_time if remaining > 0 else None)
 	
-	def get_elapsed_time_string(self) -> str:
+	def get_elapsed_time_string(self, now: typing.Optional[int] = None) -> str:
 		"""
         Returns the elapsed time as a formatted string.
 
+        Args:
+            now (typing.Optional[int]): The monotonic clock time in nanoseconds. Defaults to now.
+
         Returns:
             str: The elapsed time as a formatted string.
         """
-		if self.start_time is not None:
-			return self.get_time_string(relativedelta(datetime.now(), self.start_time))
-		else:
-			return self.get_time_string()
+		if self.start_ns is None:
+			return self.time_formatter.format_units()
+		
+		if now is None:
+			now = monotonic_ns()
+		
+		return self.time_formatter.format_duration(now - self.start_ns)
 	
 	def reset_output(self, current_point: int, end_point: int):
 		"""
@@ -986,12 +2012,14 @@ class PyProgressWatcher(PyLabel):
         Args:
             save_output (bool): If True, preserves the current output; otherwise, resets it.
         """
-		self.timer.stop()
+		tick_scheduler.unregister(self)
 		self.seconds_for_point = 0.0
 		self.block_print = False
 		
 		self.start_time = None
 		self.end_time = None
+		self.start_ns = None
+		self.end_ns = None
 		
 		if not save_output:
 			self.reset_output(0, 0)
@@ -1013,18 +2041,35 @@ class PyProgressWatcher(PyLabel):
 		self.stop_progress_watcher()
 		self.start_progress_watcher(self.start_point, self.end_point, self.current_point)
 	
+	def set_output_text(self, text: str):
+		"""
+        Displays a text unless it is already displayed.
+
+        Args:
+            text (str): The text to display.
+        """
+		if text == self.text():
+			self.skipped_repaints += 1
+		else:
+			self.performed_repaints += 1
+			self.setText(text)
+	
 	def update_progress(self):
-		"""Updates the current progress and recalculates estimations."""
+		"""
+        Updates the current progress and recalculates estimations.
+
+        The seconds per point come from the rate estimator selected by rate_estimation. The rate and the estimated end are measured on the monotonic clock; end_time is its wall clock counterpart for display.
+        """
 		self.block_print = True
 		
 		self.current_point += 1
-		try:
-			self.seconds_for_point = (time() - self.start_time.timestamp()) / (self.current_point - self.start_point)
-			self.end_time = datetime.now() + relativedelta(
-					seconds=+int((self.end_point - self.current_point) * self.seconds_for_point)
-			)
-		except ZeroDivisionError:
-			self.seconds_for_point = 0.0
-			self.end_time = datetime.now()
+		now = monotonic_ns()
+		
+		self.seconds_for_point = self.rate_estimator.update((now - self.start_ns) / 1_000_000_000, self.current_point)
+		remaining = int((self.end_point - self.current_point) * self.seconds_for_point)
+		
+		self.end_ns = now + remaining * 1_000_000_000
+		self.end_time = datetime.now() + timedelta(seconds=remaining)
 		
 		self.block_print = False
+		tick_scheduler.wake(self)
@@ -1,11 +1,13 @@
 from PyGraphicUI.Objects import (
 	AbstractTableModel,
 	Calendar,
+	ChunkedTableModel,
 	ComboBox,
 	Dialogs,
 	Label,
 	Layouts,
 	LineEdit,
+	MemoryMappedTableModel,
 	PadChoicers,
 	ProgressBars,
 	PushButton,
@@ -13,7 +15,11 @@ from PyGraphicUI.Objects import (
 	SortFilterProxyModel,
 	SpinBox,
 	StackedWidget,
+	TableFilters,
+	TableSearchIndex,
+	TableUpdateBatcher,
 	TableView,
+	TableWindowModel,
 	TextEdit,
 	Watches,
 	Widgets
@@ -37,8 +37,10 @@ from PyGraphicUI.Objects.StackedWidget import (
 )
 from PyGraphicUI.Objects.TableView import (
 	PyTableView,
+	TableRowSizing,
 	TableViewInit,
-	TableViewOptimize
+	TableViewOptimize,
+	TableViewState
 )
 from PyGraphicUI.Objects.ComboBox import (
 	ComboBoxInit,
@@ -47,12 +49,52 @@ from PyGraphicUI.Objects.ComboBox import (
 )
 from PyGraphicUI.Objects.AbstractTableModel import (
 	AbstractTableModelInit,
-	PyAbstractTableModel
+	ColumnStyle,
+	PyAbstractTableModel,
+	StyleRule
+)
+from PyGraphicUI.Objects.ChunkedTableModel import (
+	ChunkedTableModelInit,
+	CSVChunkProvider,
+	IteratorChunkProvider,
+	NumpyChunkProvider,
+	PyChunkedTableModel,
+	TableChunkProvider
+)
+from PyGraphicUI.Objects.MemoryMappedTableModel import (
+	MemoryMappedTableModelInit,
+	PyMemoryMappedTableModel
 )
 from PyGraphicUI.Objects.SortFilterProxyModel import (
 	PySortFilterProxyModel,
 	SortFilterProxyModelInit
 )
+from PyGraphicUI.Objects.TableFilters import (
+	AndFilter,
+	ColumnFilter,
+	DateRangeFilter,
+	IsInFilter,
+	MaskFilter,
+	NullFilter,
+	OrFilter,
+	RangeFilter,
+	SortedColumnIndex,
+	TableFilter
+)
+from PyGraphicUI.Objects.TableSearchIndex import (
+	ColumnSearchIndex,
+	PyTableSearchIndex,
+	SearchFilter,
+	TableSearchIndexInit
+)
+from PyGraphicUI.Objects.TableUpdateBatcher import (
+	PyTableUpdateBatcher,
+	TableUpdateBatcherInit
+)
+from PyGraphicUI.Objects.TableWindowModel import (
+	PyTableWindowModel,
+	TableWindowModelInit
+)
 from PyGraphicUI.Objects.PadChoicers import (
 	HorizontalPadChoicerInit,
 	PadChoicerItem,
@@ -72,11 +114,15 @@ from PyGraphicUI.Objects.ScrollAreas import (
 	ScrollAreaInit
 )
 from PyGraphicUI.Objects.Watches import (
+	ProgressRateEstimation,
+	ProgressRateEstimator,
 	ProgressWatcherInit,
 	PyProgressWatcher,
 	PyStopWatch,
 	PyTimer,
 	StopWatchInit,
+	TickScheduler,
+	TimeFormatter,
 	TimerInit
 )
 from PyGraphicUI.Objects.Dialogs import (
@@ -0,0 +1,87 @@
+import sys
+import numpy
+import pandas
+from time import perf_counter_ns
+from PyQt6.QtCore import Qt
+from PyGraphicUI.Objects.AbstractTableModel import (
+	AbstractTableModelInit,
+	PyAbstractTableModel
+)
+
+
+def measure(function, repeats: int) -> float:
+	"""
+    Measures the average latency of a callable.
+
+    Args:
+        function: The callable to measure.
+        repeats (int): The number of calls.
+
+    Returns:
+        float: The average latency in nanoseconds.
+    """
+	start = perf_counter_ns()
+	
+	for _ in range(repeats):
+		function()
+	
+	return (perf_counter_ns() - start) / repeats
+
+
+def main(rows: int = 200_000, repeats: int = 200_000):
+	"""
+    Compares per-cell and per-header latency of the `.iloc` path against PyAbstractTableModel.
+
+    Args:
+        rows (int): The number of rows in the benchmark DataFrame.
+        repeats (int): The number of lookups per measurement.
+    """
+	generator = numpy.random.default_rng(0)
+	data = pandas.DataFrame(
+			{
+				"price": generator.random(rows) * 100,
+				"size": generator.integers(0, 10_000, rows),
+				"time": pandas.date_range("2024-01-01", periods=rows, freq="s"),
+				"side": generator.choice(["buy", "sell"], rows)
+			}
+	)
+	model = PyAbstractTableModel(AbstractTableModelInit(data))
+	cached_model = PyAbstractTableModel(AbstractTableModelInit(data, cache_formatted_data=True))
+	
+	cells = [(int(row), int(column)) for row, column in zip(generator.integers(0, rows, 1024), generator.integers(0, 4, 1024))]
+	indexes = [model.index(row, column) for row, column in cells]
+	cached_indexes = [cached_model.index(row, column) for row, column in cells]
+	
+	for index in cached_indexes:
+		cached_model.data(index)
+	
+	position = iter(range(sys.maxsize))
+	
+	def iloc_cell():
+		row, column = cells[next(position) % 1024]
+		return str(data.iloc[row, column])
+	
+	def model_cell():
+		return model.data(indexes[next(position) % 1024], Qt.ItemDataRole.DisplayRole)
+	
+	def cached_model_cell():
+		return cached_model.data(cached_indexes[next(position) % 1024], Qt.ItemDataRole.DisplayRole)
+	
+	def iloc_header():
+		return str(data.columns[next(position) % 4]), str(data.index[next(position) % rows] + 1)
+	
+	def model_header():
+		return (
+				model.headerData(next(position) % 4, Qt.Orientation.Horizontal),
+				model.headerData(next(position) % rows, Qt.Orientation.Vertical)
+		)
+	
+	print("cell   .iloc + str:        %8.0f ns" % measure(iloc_cell, repeats))
+	print("cell   model.data():       %8.0f ns" % measure(model_cell, repeats))
+	print("cell   cached model.data(): %7.0f ns" % measure(cached_model_cell, repeats))
+	print("header .columns / .index:  %8.0f ns" % measure(iloc_header, repeats))
+	print("header model.headerData(): %8.0f ns" % measure(model_header, repeats))
+
+
+if __name__ == "__main__":
+	main()
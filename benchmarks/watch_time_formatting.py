@@ -0,0 +1,84 @@
+from time import monotonic_ns, perf_counter_ns
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from PyGraphicUI.Objects.Watches import TimeFormatter
+
+
+def measure(function, repeats: int) -> float:
+	"""
+    Measures the average latency of a callable.
+
+    Args:
+        function: The callable to measure.
+        repeats (int): The number of calls.
+
+    Returns:
+        float: The average latency in nanoseconds.
+    """
+	start = perf_counter_ns()
+	
+	for _ in range(repeats):
+		function()
+	
+	return (perf_counter_ns() - start) / repeats
+
+
+def format_relativedelta(time_: relativedelta) -> str:
+	"""
+    Formats a relativedelta with the default watch settings the way the watches did before TimeFormatter.
+
+    Args:
+        time_ (relativedelta): The time difference to format.
+
+    Returns:
+        str: The formatted time string.
+    """
+	years_s = "{value}y".format(value=time_.years) if time_.years else ""
+	months_s = "{value}mon".format(value=time_.months) if time_.months else ""
+	weeks_s = "{value}w".format(value=time_.weeks) if time_.weeks else ""
+	days_s = "{value}d".format(value=time_.days) if time_.days else ""
+	hours_s = "{value:02d}".format(value=time_.hours)
+	minutes_s = "{value:02d}".format(value=time_.minutes)
+	seconds_s = "{value:02d}".format(value=time_.seconds)
+	
+	time_out_of_day = " ".join(list(filter(None, [years_s, months_s, weeks_s, days_s])))
+	time_in_day_string = ":".join(list(filter(None, [hours_s, minutes_s, seconds_s])))
+	
+	return " ".join(list(filter(None, [time_out_of_day, time_in_day_string])))
+
+
+def main(repeats: int = 200_000):
+	"""
+    Compares the per-tick latency of the relativedelta path against TimeFormatter.
+
+    Args:
+        repeats (int): The number of formatted durations per measurement.
+    """
+	time_formatter = TimeFormatter()
+	elapsed = timedelta(hours=5, minutes=4, seconds=3)
+	long_elapsed = timedelta(days=400, hours=5)
+	start_time = datetime.now() - elapsed
+	long_start_time = datetime.now() - long_elapsed
+	start_ns = monotonic_ns() - elapsed // timedelta(microseconds=1) * 1000
+	long_start_ns = monotonic_ns() - long_elapsed // timedelta(microseconds=1) * 1000
+	
+	def relativedelta_tick():
+		return format_relativedelta(relativedelta(datetime.now(), start_time))
+	
+	def formatter_tick():
+		return time_formatter.format_duration(monotonic_ns() - start_ns)
+	
+	def long_relativedelta_tick():
+		return format_relativedelta(relativedelta(datetime.now(), long_start_time))
+	
+	def long_formatter_tick():
+		return time_formatter.format_duration(monotonic_ns() - long_start_ns)
+	
+	print("5 hours   relativedelta + str.format: %8.0f ns" % measure(relativedelta_tick, repeats))
+	print("5 hours   TimeFormatter:              %8.0f ns" % measure(formatter_tick, repeats))
+	print("400 days  relativedelta + str.format: %8.0f ns" % measure(long_relativedelta_tick, repeats))
+	print("400 days  TimeFormatter:              %8.0f ns" % measure(long_formatter_tick, repeats))
+
+
+if __name__ == "__main__":
+	main()
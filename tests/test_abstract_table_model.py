@@ -0,0 +1,107 @@
+import pandas
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QModelIndex
+from PyGraphicUI.Objects.AbstractTableModel import AbstractTableModelInit, PyAbstractTableModel
+
+
+class AbstractTableModelTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	@staticmethod
+	def get_column(table_model: PyAbstractTableModel, column: int = 0) -> list[str]:
+		return [table_model.index(row, column).data() for row in range(table_model.rowCount())]
+	
+	def test_remove_rows_signals_see_intermediate_rows(self):
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(
+						pandas.DataFrame({"value": range(10)}),
+						cache_formatted_data=True,
+						cache_block_size=4
+				)
+		)
+		self.get_column(table_model)
+		
+		snapshots = []
+		table_model.rowsRemoved.connect(
+				lambda parent, first, last: snapshots.append((first, last, self.get_column(table_model)))
+		)
+		
+		table_model.remove_rows([1, 2, 6, 7])
+		
+		self.assertEqual(
+				snapshots,
+				[
+					(6, 7, ["0", "1", "2", "3", "4", "5", "8", "9"]),
+					(1, 2, ["0", "3", "4", "5", "8", "9"])
+				]
+		)
+	
+	def test_remove_rows_resets_over_max_ranges(self):
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(pandas.DataFrame({"value": range(10)}), max_diff_ranges=1)
+		)
+		resets = []
+		table_model.modelReset.connect(lambda: resets.append(self.get_column(table_model)))
+		table_model.rowsRemoved.connect(lambda *args: self.fail("rowsRemoved emitted"))
+		
+		table_model.remove_rows([1, 3])
+		
+		self.assertEqual(resets, [["0", "2", "4", "5", "6", "7", "8", "9"]])
+
+	
+	def test_diff_signals_see_intermediate_rows(self):
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(
+						pandas.DataFrame({"key": list("abcdef"), "value": range(6)}),
+						diff_key_column="key"
+				)
+		)
+		
+		events = []
+		table_model.rowsRemoved.connect(
+				lambda parent, first, last: events.append(("removed", first, last, self.get_column(table_model)))
+		)
+		table_model.rowsInserted.connect(
+				lambda parent, first, last: events.append(("inserted", first, last, self.get_column(table_model)))
+		)
+		table_model.dataChanged.connect(
+				lambda top_left, bottom_right: events.append(
+						("changed", top_left.row(), bottom_right.row(), self.get_column(table_model, 1))
+				)
+		)
+		table_model.modelReset.connect(lambda: self.fail("modelReset emitted"))
+		
+		table_model.reset_table_data(pandas.DataFrame({"key": list("acdexf"), "value": [0, 2, 30, 4, 9, 5]}))
+		
+		self.assertEqual(
+				events,
+				[
+					("removed", 1, 1, ["a", "c", "d", "e", "f"]),
+					("changed", 2, 2, ["0", "2", "30", "4", "5"]),
+					("inserted", 4, 4, ["a", "c", "d", "e", "x", "f"])
+				]
+		)
+	
+	def test_append_and_update_cells(self):
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(pandas.DataFrame({"value": range(3)}), cache_formatted_data=True)
+		)
+		self.get_column(table_model)
+		
+		inserted = []
+		table_model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+		table_model.append_rows(pandas.DataFrame({"value": [3, 4]}))
+		
+		changed = []
+		table_model.dataChanged.connect(lambda top_left, bottom_right: changed.append((top_left.row(), bottom_right.row())))
+		table_model.update_cells([4, 0, 1], [0, 0, 0], [40, 10, 11])
+		
+		self.assertEqual(inserted, [(3, 4)])
+		self.assertEqual(changed, [(0, 1), (4, 4)])
+		self.assertEqual(self.get_column(table_model), ["10", "11", "2", "3", "40"])
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,81 @@
+import os
+import numpy
+import pandas
+import unittest
+import tempfile
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtWidgets import QApplication
+from PyGraphicUI.Objects.MemoryMappedTableModel import MemoryMappedTableModelInit, PyMemoryMappedTableModel
+from PyGraphicUI.Objects.ChunkedTableModel import (
+	CSVChunkProvider,
+	ChunkedTableModelInit,
+	IteratorChunkProvider,
+	NumpyChunkProvider,
+	PyChunkedTableModel
+)
+
+
+class ChunkedTableModelTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	@staticmethod
+	def get_column(table_model: PyChunkedTableModel, column: int = 0) -> list[str]:
+		return [table_model.index(row, column).data() for row in range(table_model.rowCount())]
+	
+	def test_fetch_more_exposes_iterator_chunks(self):
+		data = pandas.DataFrame({"value": range(7)})
+		table_model = PyChunkedTableModel(
+				ChunkedTableModelInit(
+						IteratorChunkProvider(lambda: (data.iloc[start:start + 3] for start in range(0, 7, 3)), ["value"], 3),
+						max_resident_chunks=2
+				)
+		)
+		inserted = []
+		table_model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+		
+		while table_model.canFetchMore(QModelIndex()):
+			table_model.fetchMore(QModelIndex())
+		
+		self.assertEqual(inserted, [(0, 2), (3, 5), (6, 6)])
+		self.assertEqual(self.get_column(table_model), [str(value) for value in range(7)])
+		self.assertLessEqual(len(table_model.chunks), 2)
+	
+	def test_csv_chunks_are_read_after_eviction(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, "table.csv")
+			pandas.DataFrame({"name": [f"r{row}" for row in range(10)], "value": range(10)}).to_csv(path, index=False)
+			
+			chunk_provider = CSVChunkProvider(path, chunk_size=4)
+			table_model = PyChunkedTableModel(ChunkedTableModelInit(chunk_provider, max_resident_chunks=1))
+			
+			while table_model.canFetchMore(QModelIndex()):
+				table_model.fetchMore(QModelIndex())
+			
+			self.assertEqual(chunk_provider.next_chunk_index, 3)
+			self.assertEqual(self.get_column(table_model)[::-1], [f"r{row}" for row in range(9, -1, -1)])
+			self.assertEqual(table_model.headerData(1, Qt.Orientation.Horizontal), "value")
+	
+	def test_numpy_chunks_and_memory_mapped_columns(self):
+		with tempfile.TemporaryDirectory() as directory:
+			numpy.save(os.path.join(directory, "b.npy"), numpy.arange(5) * 10)
+			numpy.save(os.path.join(directory, "a.npy"), numpy.arange(5))
+			
+			table_model = PyMemoryMappedTableModel(MemoryMappedTableModelInit(directory))
+			
+			self.assertEqual(table_model.rowCount(), 5)
+			self.assertEqual(table_model.horizontal_header_labels, ["a", "b"])
+			self.assertEqual(self.get_column(table_model, 1), ["0", "10", "20", "30", "40"])
+			self.assertIsInstance(table_model.arrays["a"], numpy.memmap)
+			
+			del table_model
+		
+		chunk_provider = NumpyChunkProvider({"value": numpy.arange(5)}, chunk_size=2)
+		
+		self.assertEqual(chunk_provider.read_chunk(2)["value"].tolist(), [4])
+		self.assertIsNone(chunk_provider.read_chunk(3))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,89 @@
+import time
+import numpy
+import pandas
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtWidgets import QApplication
+from PyGraphicUI.Objects.TableFilters import RangeFilter
+from PyGraphicUI.Objects.AbstractTableModel import AbstractTableModelInit, PyAbstractTableModel
+from PyGraphicUI.Objects.SortFilterProxyModel import PySortFilterProxyModel, SortFilterProxyModelInit
+
+
+class SlowExecutor(ThreadPoolExecutor):
+	def __init__(self):
+		super().__init__(max_workers=1)
+		self.release = threading.Event()
+	
+	def submit(self, function, *arguments, **keywords):
+		def run():
+			self.release.wait(5)
+			return function(*arguments, **keywords)
+		
+		return super().submit(run)
+
+
+class SortFilterProxyModelTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	def wait_until_idle(self, proxy_model: PySortFilterProxyModel):
+		deadline = time.monotonic() + 5
+		
+		while proxy_model.busy and time.monotonic() < deadline:
+			self.application.processEvents()
+		
+		self.assertFalse(proxy_model.busy)
+	
+	@staticmethod
+	def get_values(proxy_model: PySortFilterProxyModel) -> list[str]:
+		return [proxy_model.index(row, 0).data() for row in range(proxy_model.rowCount())]
+	
+	def test_filter_converges_under_continuous_append(self):
+		table_model = PyAbstractTableModel(AbstractTableModelInit(pandas.DataFrame({"value": range(20)})))
+		executor = SlowExecutor()
+		proxy_model = PySortFilterProxyModel(
+				SortFilterProxyModelInit(table_model, asynchronous=True, executor=executor)
+		)
+		
+		proxy_model.setFilterByColumn("^1", [], "value")
+		
+		for batch in range(5):
+			table_model.append_rows(pandas.DataFrame({"value": [20 + batch * 2, 21 + batch * 2]}))
+		
+		table_model.remove_rows([0, 1])
+		table_model.update_cells([0], [0], [100])
+		table_model.sort_by_columns([0])
+		table_model.append_rows(pandas.DataFrame({"value": [199]}))
+		
+		executor.release.set()
+		self.wait_until_idle(proxy_model)
+		
+		self.assertEqual(proxy_model.filter_generation, 1)
+		self.assertEqual(
+				self.get_values(proxy_model),
+				["10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "100", "199"]
+		)
+		executor.shutdown()
+	
+	def test_filter_lands_after_reset_without_retries(self):
+		table_model = PyAbstractTableModel(AbstractTableModelInit(pandas.DataFrame({"value": range(5)})))
+		executor = SlowExecutor()
+		proxy_model = PySortFilterProxyModel(
+				SortFilterProxyModelInit(table_model, asynchronous=True, executor=executor, max_filter_retries=0)
+		)
+		
+		proxy_model.add_typed_filter(RangeFilter("value", 2))
+		table_model.reset_table_data(pandas.DataFrame({"value": numpy.arange(5) + 2}))
+		
+		executor.release.set()
+		self.wait_until_idle(proxy_model)
+		
+		self.assertEqual(proxy_model.filter_generation, 1)
+		self.assertEqual(self.get_values(proxy_model), ["2", "3", "4", "5", "6"])
+		executor.shutdown()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,34 @@
+import numpy
+import pandas
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
+from PyGraphicUI.Objects.TableSearchIndex import PyTableSearchIndex, TableSearchIndexInit
+from PyGraphicUI.Objects.AbstractTableModel import AbstractTableModelInit, PyAbstractTableModel
+
+
+class TableSearchIndexTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	def test_sort_after_reset(self):
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(pandas.DataFrame({"symbol": [f"S{row}" for row in range(100)]}))
+		)
+		search_index = PyTableSearchIndex(TableSearchIndexInit(table_model))
+		
+		table_model.reset_table_data(pandas.DataFrame({"symbol": ["e", "d", "c", "b", "a"]}))
+		table_model.sort_by_columns([0])
+		
+		self.assertTrue(search_index.stale)
+		numpy.testing.assert_array_equal(search_index.search("b"), [1])
+		
+		table_model.sort_by_columns([0], [Qt.SortOrder.DescendingOrder])
+		
+		self.assertFalse(search_index.stale)
+		numpy.testing.assert_array_equal(search_index.search("b"), [3])
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,51 @@
+import pandas
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyGraphicUI.Objects.AbstractTableModel import AbstractTableModelInit, PyAbstractTableModel
+from PyGraphicUI.Objects.TableUpdateBatcher import PyTableUpdateBatcher, TableUpdateBatcherInit
+
+
+class TableUpdateBatcherTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	@staticmethod
+	def get_column(table_model: PyAbstractTableModel) -> list[str]:
+		return [table_model.index(row, 0).data() for row in range(table_model.rowCount())]
+	
+	def test_hot_cells_do_not_evict_other_cells(self):
+		table_model = PyAbstractTableModel(AbstractTableModelInit(pandas.DataFrame({"value": [0] * 4})))
+		batcher = PyTableUpdateBatcher(TableUpdateBatcherInit(table_model, max_pending_updates=3))
+		
+		batcher.update_cell(3, 0, 30)
+		
+		for value in range(100):
+			batcher.update_cell(0, 0, value)
+			batcher.update_cell(1, 0, value)
+		
+		self.assertEqual(len(batcher.pending_updates), 3)
+		self.assertEqual(batcher.coalesced_updates, 198)
+		self.assertEqual(batcher.dropped_updates, 0)
+		
+		batcher.flush()
+		
+		self.assertEqual(self.get_column(table_model), ["99", "99", "0", "30"])
+		self.assertEqual(batcher.received_updates, 201)
+	
+	def test_new_cell_evicts_first_buffered_cell(self):
+		table_model = PyAbstractTableModel(AbstractTableModelInit(pandas.DataFrame({"value": [0] * 4})))
+		batcher = PyTableUpdateBatcher(TableUpdateBatcherInit(table_model, max_pending_updates=2))
+		
+		batcher.update_cells([0, 1, 0, 2], [0, 0, 0, 0], [10, 11, 12, 13])
+		batcher.update_cell(7, 0, 70)
+		batcher.flush()
+		
+		self.assertEqual(self.get_column(table_model), ["0", "0", "13", "0"])
+		self.assertEqual(batcher.coalesced_updates, 1)
+		self.assertEqual(batcher.dropped_updates, 3)
+		self.assertEqual(batcher.flushes, 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
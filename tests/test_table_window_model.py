@@ -0,0 +1,68 @@
+import pandas
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QItemSelectionModel, Qt
+from PyGraphicUI.Objects.AbstractTableModel import AbstractTableModelInit, PyAbstractTableModel
+from PyGraphicUI.Objects.TableView import PyTableView, TableViewInit, TableViewOptimize
+from PyGraphicUI.Objects.SortFilterProxyModel import PySortFilterProxyModel, SortFilterProxyModelInit
+
+
+class TableWindowModelTest(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.application = QApplication.instance() or QApplication([])
+	
+	def create_view(self) -> PyTableView:
+		table_model = PyAbstractTableModel(
+				AbstractTableModelInit(pandas.DataFrame({"name": [f"r{row ^ 1:03d}" for row in range(200)]}))
+		)
+		
+		table_view = PyTableView(
+				TableViewInit(sorting_enabled=False, vertical_optimize=TableViewOptimize(True, 50)),
+				PySortFilterProxyModel(SortFilterProxyModelInit(table_model))
+		)
+		table_view.setAutoScroll(False)
+		
+		return table_view
+	
+	@staticmethod
+	def get_selected(table_view: PyTableView) -> list[str]:
+		return sorted(index.data() for index in table_view.selectionModel().selectedIndexes())
+	
+	def test_selection_follows_rows_after_sort(self):
+		table_view = self.create_view()
+		window_model = table_view.model()
+		
+		table_view.selectionModel().setCurrentIndex(
+				window_model.index(10, 0),
+				QItemSelectionModel.SelectionFlag.ClearAndSelect
+		)
+		table_view.selectionModel().select(window_model.index(21, 0), QItemSelectionModel.SelectionFlag.Select)
+		
+		self.assertEqual(table_view.currentIndex().data(), "r011")
+		self.assertEqual(self.get_selected(table_view), ["r011", "r020"])
+		
+		table_view.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+		
+		self.assertEqual(window_model.index(10, 0).data(), "r010")
+		self.assertEqual(table_view.currentIndex().row(), 11)
+		self.assertEqual(table_view.currentIndex().data(), "r011")
+		self.assertEqual(self.get_selected(table_view), ["r011", "r020"])
+	
+	def test_selection_leaving_window_is_dropped(self):
+		table_view = self.create_view()
+		window_model = table_view.model()
+		
+		table_view.selectionModel().setCurrentIndex(
+				window_model.index(10, 0),
+				QItemSelectionModel.SelectionFlag.ClearAndSelect
+		)
+		table_view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+		
+		self.assertEqual(window_model.index(0, 0).data(), "r199")
+		self.assertFalse(table_view.currentIndex().isValid())
+		self.assertEqual(self.get_selected(table_view), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
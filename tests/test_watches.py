@@ -0,0 +1,85 @@
+import unittest
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from PyGraphicUI.Objects.Watches import ProgressRateEstimation, ProgressRateEstimator, TimeFormatter
+
+
+class ProgressRateEstimatorTest(unittest.TestCase):
+	def test_strategies_on_steady_progress(self):
+		for strategy in ["cumulative", "ema", "window", "regression"]:
+			rate_estimator = ProgressRateEstimator(ProgressRateEstimation(strategy, buffer_size=8))
+			rate_estimator.reset(0, 0)
+			
+			for update in range(1, 50):
+				seconds_for_point = rate_estimator.update(update * 0.5, update * 10)
+			
+			self.assertAlmostEqual(seconds_for_point, 0.05, msg=strategy)
+			self.assertLessEqual(rate_estimator.count, 8)
+	
+	def test_window_follows_rate_change(self):
+		rate_estimations = [
+			ProgressRateEstimation("cumulative"),
+			ProgressRateEstimation("window", window_duration=5.0),
+			ProgressRateEstimation("regression", window_duration=5.0)
+		]
+		seconds_for_points = []
+		
+		for rate_estimation in rate_estimations:
+			rate_estimator = ProgressRateEstimator(rate_estimation)
+			
+			for second in range(1, 21):
+				point = second * 10 if second <= 10 else 100 + (second - 10) * 20
+				seconds_for_point = rate_estimator.update(float(second), point)
+			
+			seconds_for_points.append(seconds_for_point)
+		
+		self.assertAlmostEqual(seconds_for_points[0], 20 / 300)
+		self.assertAlmostEqual(seconds_for_points[1], 0.05)
+		self.assertAlmostEqual(seconds_for_points[2], 0.05)
+	
+	def test_regression_matches_batch_fit_after_evictions(self):
+		rate_estimator = ProgressRateEstimator(ProgressRateEstimation("regression", window_duration=None, buffer_size=4))
+		updates = [(1.0, 3), (2.0, 9), (3.0, 11), (4.5, 20), (5.0, 21), (7.0, 30)]
+		
+		for seconds, point in updates:
+			seconds_for_point = rate_estimator.update(seconds, point)
+		
+		seconds = [update[0] for update in updates[-4:]]
+		points = [update[1] for update in updates[-4:]]
+		mean_seconds, mean_points = sum(seconds) / 4, sum(points) / 4
+		
+		self.assertAlmostEqual(
+				seconds_for_point,
+				sum((second - mean_seconds) ** 2 for second in seconds)
+				/ sum((second - mean_seconds) * (point - mean_points) for second, point in zip(seconds, points))
+		)
+
+
+class TimeFormatterTest(unittest.TestCase):
+	def test_short_durations_match_relativedelta(self):
+		time_formatter = TimeFormatter(always_print_days=True)
+		reference = datetime(2024, 3, 31, 12)
+		
+		for seconds in [0, 59, 3_661, 90_061, 694_861, 2_419_199]:
+			time_ = relativedelta(seconds=seconds, microseconds=0).normalized()
+			
+			self.assertEqual(
+					time_formatter.format_duration(seconds * 1_000_000_000, reference),
+					time_formatter.format_units(0, 0, time_.days // 7, time_.days, time_.hours, time_.minutes, time_.seconds)
+			)
+	
+	def test_long_and_negative_durations(self):
+		time_formatter = TimeFormatter()
+		reference = datetime(2024, 3, 31, 12)
+		time_ = relativedelta(months=2, days=3)
+		nanoseconds = int((reference - (reference - time_)).total_seconds()) * 1_000_000_000
+		
+		self.assertEqual(
+				time_formatter.format_duration(nanoseconds, reference),
+				time_formatter.format_units(0, 2, 0, 3, 0, 0, 0)
+		)
+		self.assertEqual(time_formatter.format_duration(-61_000_000_000), "-" + time_formatter.format_duration(61_000_000_000))
+
+
+if __name__ == "__main__":
+	unittest.main()